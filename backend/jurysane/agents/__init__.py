@@ -1,16 +1,21 @@
 """AI agents for different trial roles."""
 
-from .base import BaseAgent
+from .base import AgentUnavailableError, BaseAgent
 from .defense import DefenseAgent
 from .judge import JudgeAgent
-from .jury import JuryAgent
+from .jury import DeliberationResult, EvaluationTable, ItemScore, JurorVote, JuryAgent
 from .prosecutor import ProsecutorAgent
 from .witness import WitnessAgent
 
 __all__ = [
+    "AgentUnavailableError",
     "BaseAgent",
     "DefenseAgent",
+    "DeliberationResult",
+    "EvaluationTable",
+    "ItemScore",
     "JudgeAgent",
+    "JurorVote",
     "JuryAgent",
     "ProsecutorAgent",
     "WitnessAgent",
@@ -1,7 +1,8 @@
 """Base agent class for all trial participants."""
 
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain.schema import BaseMessage, HumanMessage, SystemMessage
 try:
@@ -23,8 +24,14 @@ except Exception:
 from pydantic import BaseModel, Field
 
 from ..config import settings
+from ..metrics import LLM_ATTEMPTS, LLM_REQUEST_DURATION, LLM_TIME_TO_FIRST_TOKEN
 from ..models.trial import CaseRole, TrialSession
+from ..tracing import current_span, span, traced
 from ..utils import get_enum_value, format_trial_phase
+from .circuit_breaker import CircuitOpenError, get_breaker
+from .rate_limit import provider_slot
+from .resilience import call_with_resilience, classify_error, is_provider_failure, with_timeout
+from .usage import estimate_tokens, extract_token_usage, token_cost, usage_tracker
 
 
 class AgentResponse(BaseModel):
@@ -38,6 +45,26 @@ class AgentResponse(BaseModel):
         default=0.8, description="Confidence in the response")
 
 
+# Providers whose chat API can be forced to return a JSON object
+JSON_MODE_PROVIDERS = {"openai", "groq", "gemini"}
+
+
+class AgentUnavailableError(RuntimeError):
+    """Raised when an agent could not produce a usable response."""
+
+    def __init__(self, role: CaseRole, reason: str, rate_limited: bool = False):
+        """Initialize the error.
+
+        Args:
+            role: Role whose agent failed
+            reason: Underlying provider error
+            rate_limited: Whether the provider kept rejecting calls with 429s
+        """
+        super().__init__(f"{get_enum_value(role)} agent is unavailable: {reason}")
+        self.role = role
+        self.rate_limited = rate_limited
+
+
 class BaseAgent(ABC):
     """Base class for all trial agents."""
 
@@ -63,54 +90,115 @@ class BaseAgent(ABC):
         self.provider_name = (provider_name or settings.llm.provider).lower()
         self.temperature = temperature
         self.memory: List[BaseMessage] = []
+        # Precomputed role briefing; replaces the raw case fields in context
+        self.case_briefing: Optional[str] = None
+
+        # Per-turn generation limits (None = settings.llm.max_tokens)
+        self.max_output_tokens: Optional[int] = None
+        self.stop_sequences: List[str] = []
+        # Request a JSON object response where the provider supports it
+        self.json_output = False
+        # Ordered (provider, model) pairs tried when earlier ones are unavailable
+        self.fallback_models: List[Tuple[str, str]] = []
+        self._fallback_llms: Dict[Tuple[str, str], Any] = {}
+        # Recent transcript entries included in the case context
+        self.context_entries = 5
 
         # Initialize the LLM based on provider
-        if self.provider_name == "openai":
-            self.llm = ChatOpenAI(
-                model=self.model_name,
+        self.llm = self._build_llm(self.provider_name, self.model_name)
+
+    def _build_llm(self, provider_name: str, model_name: str) -> Any:
+        """Create a chat model client.
+
+        Args:
+            provider_name: Provider name (openai, anthropic, groq, gemini)
+            model_name: Model name
+
+        Returns:
+            LangChain chat model
+
+        Raises:
+            RuntimeError: If the provider's integration is not installed
+        """
+        if provider_name == "openai":
+            return ChatOpenAI(
+                model=model_name,
                 temperature=self.temperature,
                 max_tokens=settings.llm.max_tokens,
                 openai_api_key=settings.openai_api_key,
             )
-        elif self.provider_name == "anthropic":
+        elif provider_name == "anthropic":
             if ChatAnthropic is None:
                 raise RuntimeError(
                     "Anthropic provider requested but langchain_anthropic is not installed")
-            self.llm = ChatAnthropic(
-                model=self.model_name,
+            return ChatAnthropic(
+                model=model_name,
                 temperature=self.temperature,
                 max_tokens=settings.llm.max_tokens,
                 anthropic_api_key=settings.anthropic_api_key,
             )
-        elif self.provider_name == "groq":
+        elif provider_name == "groq":
             if ChatGroq is None:
                 raise RuntimeError(
                     "Groq provider requested but langchain_groq is not installed")
-            self.llm = ChatGroq(
-                model=self.model_name,
+            return ChatGroq(
+                model=model_name,
                 temperature=self.temperature,
                 max_tokens=settings.llm.max_tokens,
                 groq_api_key=settings.groq_api_key,
             )
-        elif self.provider_name == "gemini":
+        elif provider_name == "gemini":
             if ChatGoogleGenerativeAI is None:
                 raise RuntimeError(
                     "Gemini provider requested but langchain_google_genai is not installed")
-            self.llm = ChatGoogleGenerativeAI(
-                model=self.model_name,
+            return ChatGoogleGenerativeAI(
+                model=model_name,
                 temperature=self.temperature,
                 max_tokens=settings.llm.max_tokens,
                 google_api_key=settings.gemini_api_key,
             )
         else:
             # Fallback to OpenAI
-            self.llm = ChatOpenAI(
-                model=self.model_name,
+            return ChatOpenAI(
+                model=model_name,
                 temperature=self.temperature,
                 max_tokens=settings.llm.max_tokens,
                 openai_api_key=settings.openai_api_key,
             )
 
+    def switch_model(self, provider_name: str, model_name: str) -> bool:
+        """Make another model primary, keeping the current one as first fallback.
+
+        Args:
+            provider_name: Provider name
+            model_name: Model name
+
+        Returns:
+            Whether the switch happened (False if the client cannot be built)
+        """
+        current = (self.provider_name, self.model_name)
+        if (provider_name, model_name) == current:
+            return True
+        try:
+            llm = self._llm_for(provider_name, model_name)
+        except Exception:
+            return False
+        self.fallback_models = [current] + [
+            candidate for candidate in self.fallback_models if candidate != (provider_name, model_name)
+        ]
+        self._fallback_llms[current] = self.llm
+        self.provider_name, self.model_name, self.llm = provider_name, model_name, llm
+        return True
+
+    def _llm_for(self, provider_name: str, model_name: str) -> Any:
+        """Get the client for a candidate, building fallbacks lazily."""
+        if (provider_name, model_name) == (self.provider_name, self.model_name):
+            return self.llm
+        key = (provider_name, model_name)
+        if key not in self._fallback_llms:
+            self._fallback_llms[key] = self._build_llm(provider_name, model_name)
+        return self._fallback_llms[key]
+
     def add_to_memory(self, message: BaseMessage) -> None:
         """Add a message to the agent's memory."""
         self.memory.append(message)
@@ -119,6 +207,7 @@ class BaseAgent(ABC):
         """Clear the agent's memory."""
         self.memory.clear()
 
+    @traced("agent.get_context_messages")
     def get_context_messages(self, trial_session: TrialSession) -> List[BaseMessage]:
         """Get context messages for the current trial state.
 
@@ -154,9 +243,12 @@ class BaseAgent(ABC):
             f"User Role: {get_enum_value(trial_session.user_role)}",
         ]
 
+        # Prefer the compact role briefing over re-rendering the case
+        if self.case_briefing:
+            context_parts.append(self.case_briefing)
         # Add case information if available
         # Note: Case data should be passed through the trial service
-        if hasattr(trial_session, 'case_data') and trial_session.case_data:
+        elif hasattr(trial_session, 'case_data') and trial_session.case_data:
             case = trial_session.case_data
             context_parts.extend([
                 f"Case: {case.title}",
@@ -166,7 +258,7 @@ class BaseAgent(ABC):
 
         # Add recent transcript entries
         if trial_session.transcript:
-            recent_entries = trial_session.transcript[-5:]  # Last 5 entries
+            recent_entries = trial_session.transcript[-self.context_entries:]
             context_parts.append("Recent Transcript:")
             for entry in recent_entries:
                 speaker = entry.get("speaker", "Unknown")
@@ -194,6 +286,7 @@ class BaseAgent(ABC):
         """
         pass
 
+    @traced("agent.generate_response")
     async def _generate_response(
         self,
         messages: List[BaseMessage],
@@ -208,10 +301,15 @@ class BaseAgent(ABC):
         Returns:
             Agent's response
         """
+        attempts: List[Dict[str, Any]] = []
+        served_by: Dict[str, Any] = {}
+        started = time.perf_counter()
         try:
-            response = await self.llm.ainvoke(messages)
+            response = await self._invoke_llm(messages, attempts, served_by)
             content = response.content if hasattr(
                 response, 'content') else str(response)
+            usage = self._usage(messages, response, content, served_by, started)
+            content = self._truncate_at_stop(content)
 
             # Add the response to memory
             self.add_to_memory(HumanMessage(content=messages[-1].content))
@@ -220,15 +318,201 @@ class BaseAgent(ABC):
             return AgentResponse(
                 content=content,
                 role=self.role,
-                metadata=metadata or {},
+                metadata={**(metadata or {}), **served_by, "attempts": attempts, "usage": usage},
                 confidence=0.8,  # Default confidence
             )
 
         except Exception as e:
-            # Fallback response
+            elapsed = time.perf_counter() - started
+            usage = {"prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0, "error": True,
+                     "latency_ms": round(elapsed * 1000, 1)}
+            usage_tracker.record(get_enum_value(self.role), usage)
+            LLM_REQUEST_DURATION.observe(elapsed, get_enum_value(self.role))
+            # Fallback response; callers must not treat it as trial content
             return AgentResponse(
                 content=f"I apologize, but I'm having difficulty responding right now. Error: {str(e)}",
                 role=self.role,
-                metadata={"error": str(e)},
+                metadata={
+                    "error": str(e) or type(e).__name__,
+                    "error_type": classify_error(e),
+                    "attempts": attempts,
+                    "usage": usage,
+                },
                 confidence=0.1,
             )
+
+    def _usage(
+        self,
+        messages: List[BaseMessage],
+        response: Any,
+        content: str,
+        served_by: Dict[str, Any],
+        started: float,
+    ) -> Dict[str, Any]:
+        """Build and record the usage of a successful call.
+
+        Args:
+            messages: Messages sent to the LLM
+            response: Raw LLM response
+            content: Response text
+            served_by: Provider/model that answered
+            started: ``time.perf_counter()`` when the call started
+
+        Returns:
+            Usage record (token counts are estimated if the provider sent none)
+        """
+        counts = extract_token_usage(response)
+        estimated = counts is None
+        if counts is None:
+            counts = (sum(estimate_tokens(str(message.content)) for message in messages),
+                      estimate_tokens(content))
+        provider = served_by.get("provider", self.provider_name)
+        model = served_by.get("model", self.model_name)
+        elapsed = time.perf_counter() - started
+        usage = {
+            "model": f"{provider}/{model}",
+            "prompt_tokens": counts[0],
+            "completion_tokens": counts[1],
+            "total_tokens": counts[0] + counts[1],
+            "cost_usd": token_cost(provider, model, *counts),
+            "latency_ms": round(elapsed * 1000, 1),
+            "estimated": estimated,
+        }
+        usage_tracker.record(get_enum_value(self.role), usage)
+        LLM_REQUEST_DURATION.observe(elapsed, get_enum_value(self.role))
+        current = current_span()
+        if current is not None:
+            current.attributes.update({
+                "agent.role": get_enum_value(self.role), "llm.model": usage["model"],
+                "llm.prompt_tokens": counts[0], "llm.completion_tokens": counts[1]})
+        return usage
+
+    async def _invoke_llm(
+        self,
+        messages: List[BaseMessage],
+        attempts: List[Dict[str, Any]],
+        served_by: Dict[str, Any],
+    ) -> Any:
+        """Call the LLM with retries, failing over when a provider is down.
+
+        Candidates are the agent's own provider/model followed by its
+        fallbacks. Providers whose circuit breaker is open are skipped.
+
+        Args:
+            messages: Messages to send to the LLM
+            attempts: List each attempt's record is appended to
+            served_by: Filled with the provider/model that answered
+
+        Returns:
+            Raw LLM response
+
+        Raises:
+            CircuitOpenError: If every candidate's breaker is open
+        """
+        # Rough estimate (~4 characters per token) plus the completion budget
+        max_tokens = self.max_output_tokens or settings.llm.max_tokens
+        prompt_chars = sum(len(str(message.content)) for message in messages)
+        estimated_tokens = prompt_chars // 4 + max_tokens
+
+        candidates = [(self.provider_name, self.model_name), *self.fallback_models]
+        last_error: Optional[Exception] = None
+        for provider_name, model_name in candidates:
+            breaker = get_breaker(provider_name)
+            if not breaker.allow_request():
+                attempts.append({"provider": f"{provider_name}/{model_name}",
+                                 "outcome": "circuit_open"})
+                LLM_ATTEMPTS.inc(f"{provider_name}/{model_name}", "circuit_open")
+                continue
+
+            async def attempt() -> Any:
+                async with provider_slot(provider_name, model_name, estimated_tokens):
+                    with span("llm.call", {"llm.model": f"{provider_name}/{model_name}"}):
+                        if settings.llm.stream_responses and hasattr(llm, "astream"):
+                            return await with_timeout(self._stream(llm, messages, generation_kwargs))
+                        return await with_timeout(llm.ainvoke(messages, **generation_kwargs))
+
+            generation_kwargs = self._generation_kwargs(provider_name)
+            first_attempt = len(attempts)
+            try:
+                llm = self._llm_for(provider_name, model_name)
+                response = await call_with_resilience(
+                    attempt, provider_name, model_name, attempts)
+            except Exception as e:
+                if is_provider_failure(e):
+                    breaker.record_failure()
+                else:
+                    # Local error (e.g. queueing deadline): not the provider's fault
+                    breaker.release_probe()
+                last_error = e
+                continue
+            except BaseException:
+                # Cancelled: the call has no outcome, so free its probe slot
+                breaker.release_probe()
+                raise
+            finally:
+                for record in attempts[first_attempt:]:
+                    record.setdefault("provider", f"{provider_name}/{model_name}")
+                    LLM_ATTEMPTS.inc(record["provider"], str(record.get("outcome", "unknown")))
+
+            breaker.record_success()
+            served_by.update(
+                provider=provider_name, model=model_name,
+                failover=(provider_name, model_name) != candidates[0])
+            return response
+
+        if last_error is not None:
+            raise last_error
+        raise CircuitOpenError(
+            f"All providers for the {get_enum_value(self.role)} agent are unavailable")
+
+    async def _stream(self, llm: Any, messages: List[BaseMessage], kwargs: Dict[str, Any]) -> Any:
+        """Stream a completion, recording the time to its first chunk.
+
+        Args:
+            llm: Chat model
+            messages: Messages to send
+            kwargs: Generation keyword arguments
+
+        Returns:
+            The chunks merged into one message
+        """
+        started = time.perf_counter()
+        response = None
+        async for chunk in llm.astream(messages, **kwargs):
+            if response is None:
+                LLM_TIME_TO_FIRST_TOKEN.observe(time.perf_counter() - started, get_enum_value(self.role))
+                response = chunk
+            else:
+                response = response + chunk
+        return response if response is not None else await llm.ainvoke(messages, **kwargs)
+
+    def _generation_kwargs(self, provider_name: str) -> Dict[str, Any]:
+        """Per-call output limit and stop sequences for a provider.
+
+        Args:
+            provider_name: Provider the call goes to
+
+        Returns:
+            Keyword arguments for ``ainvoke``
+        """
+        kwargs: Dict[str, Any] = {}
+        if self.max_output_tokens:
+            # Gemini names the output limit differently
+            key = "max_output_tokens" if provider_name == "gemini" else "max_tokens"
+            kwargs[key] = self.max_output_tokens
+        if self.stop_sequences:
+            kwargs["stop"] = list(self.stop_sequences)
+        if self.json_output and provider_name in JSON_MODE_PROVIDERS:
+            if provider_name == "gemini":
+                kwargs["response_mime_type"] = "application/json"
+            else:
+                kwargs["response_format"] = {"type": "json_object"}
+        return kwargs
+
+    def _truncate_at_stop(self, content: str) -> str:
+        """Cut content at the first stop sequence, for providers that ignore them."""
+        for stop in self.stop_sequences:
+            index = content.find(stop)
+            if index != -1:
+                content = content[:index]
+        return content.rstrip() if self.stop_sequences else content
@@ -0,0 +1,132 @@
+"""Per-provider circuit breakers for LLM calls.
+
+A breaker tracks the outcomes of recent calls to one provider. When the
+failure rate over the window crosses the threshold it opens and calls are
+routed to fallback models instead. After a cool-down it lets a probe call
+through (half-open); a successful probe closes it again. A probe that ends
+without an outcome (e.g. cancelled) gives its slot back, and probes that
+never report within a cool-down are treated as lost.
+"""
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict
+
+from ..config import CircuitBreakerConfig, settings
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_breakers: Dict[str, "CircuitBreaker"] = {}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when every candidate provider for a call is unavailable."""
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker driven by a rolling failure rate."""
+
+    def __init__(self, key: str, config: CircuitBreakerConfig):
+        """Initialize a closed breaker.
+
+        Args:
+            key: Provider this breaker guards
+            config: Thresholds and timings
+        """
+        self.key = key
+        self.config = config
+        self.state = CLOSED
+        self.outcomes: Deque[bool] = deque(maxlen=config.window)
+        self.opened_at = 0.0
+        self.probes = 0
+        self.probe_started = 0.0
+        self.total_failures = 0
+        self.total_successes = 0
+
+    @property
+    def failure_rate(self) -> float:
+        """Share of failed calls in the current window."""
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def allow_request(self) -> bool:
+        """Check whether a call may be sent to the provider.
+
+        Returns:
+            True if the breaker is closed, or half-open with a probe slot free
+        """
+        if self.state == OPEN:
+            if time.monotonic() - self.opened_at < self.config.open_seconds:
+                return False
+            self.state = HALF_OPEN
+            self.probes = 0
+        if self.state == HALF_OPEN:
+            if self.probes >= self.config.half_open_max_calls:
+                if time.monotonic() - self.probe_started < self.config.open_seconds:
+                    return False
+                # The outstanding probes never reported back
+                self.probes = 0
+            self.probes += 1
+            self.probe_started = time.monotonic()
+        return True
+
+    def release_probe(self) -> None:
+        """Give back a half-open probe slot whose call ended without an outcome."""
+        if self.state == HALF_OPEN and self.probes > 0:
+            self.probes -= 1
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        self.total_successes += 1
+        if self.state == HALF_OPEN:
+            self.state = CLOSED
+            self.outcomes.clear()
+        self.outcomes.append(True)
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker if the threshold is crossed."""
+        self.total_failures += 1
+        self.outcomes.append(False)
+        if self.state == HALF_OPEN or (
+            len(self.outcomes) >= self.config.min_calls
+            and self.failure_rate >= self.config.failure_rate_threshold
+        ):
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+    def status(self) -> Dict[str, Any]:
+        """Health snapshot for monitoring."""
+        retry_in = 0.0
+        if self.state == OPEN:
+            retry_in = max(0.0, self.config.open_seconds - (time.monotonic() - self.opened_at))
+        return {
+            "state": self.state,
+            "failure_rate": round(self.failure_rate, 3),
+            "window_calls": len(self.outcomes),
+            "total_successes": self.total_successes,
+            "total_failures": self.total_failures,
+            "retry_in_seconds": round(retry_in, 1),
+        }
+
+
+def get_breaker(provider: str) -> CircuitBreaker:
+    """Get the shared breaker for a provider.
+
+    Args:
+        provider: Provider name
+
+    Returns:
+        Circuit breaker, created closed on first use
+    """
+    key = provider.lower()
+    if key not in _breakers:
+        _breakers[key] = CircuitBreaker(key, settings.llm.circuit_breaker)
+    return _breakers[key]
+
+
+def breaker_status() -> Dict[str, Dict[str, Any]]:
+    """Health snapshot of every provider seen so far."""
+    return {key: breaker.status() for key, breaker in _breakers.items()}
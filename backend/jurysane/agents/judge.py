@@ -4,11 +4,16 @@ from typing import Any, Dict, Optional
 
 from langchain.schema import HumanMessage
 
+from ..config import settings
 from ..models.trial import CaseRole, TrialSession, UserRole
-from .base import AgentResponse, BaseAgent
+from .base import JSON_MODE_PROVIDERS, AgentResponse, BaseAgent
 from ..utils import get_enum_value, format_trial_phase
 
 
+# Written right after the turn directive so generation stops there
+TURN_END_MARKER = "<<END_TURN>>"
+
+
 class JudgeAgent(BaseAgent):
     """AI agent that plays the role of a judge."""
 
@@ -47,6 +52,9 @@ You must make decisions that serve justice and maintain the integrity of the leg
             provider_name=provider_name,
             temperature=0.3,  # Lower temperature for more consistent judicial behavior
         )
+        self.json_output = (settings.trial.structured_directives
+                            and self.provider_name in JSON_MODE_PROVIDERS)
+        self.stop_sequences = [] if self.json_output else [TURN_END_MARKER]
 
     async def respond(
         self,
@@ -87,23 +95,37 @@ TURN MANAGEMENT CONTEXT:
 - Current turn: {get_enum_value(current_turn) if current_turn else 'None'}
 
 IMPORTANT: When you direct someone to speak (e.g., "Prosecution, present your opening statement"), 
-you must include turn management information in your response. Use this format:
+you must include turn management information in your response. {self._turn_format_instructions()}
+This helps the system know whose turn it is next.
+"""
+
+        return f"{turn_info}\n\nORIGINAL PROMPT: {prompt}"
+
+    def _turn_format_instructions(self) -> str:
+        """Describe how to state the next speaker (JSON or a directive line)."""
+        if self.json_output:
+            return """Respond with a JSON object only:
+
+{"response": "[Your judicial response here]", "turn_management": "[prosecutor | defense | jury | judge]"}
+
+Set "turn_management" to the role who should speak next.
+"""
+        return f"""Use this format:
 
 RESPONSE FORMAT:
 [Your judicial response here]
 
-TURN_MANAGEMENT: [Role who should speak next]
+TURN_MANAGEMENT: [prosecutor | defense | jury | judge]
+{TURN_END_MARKER}
+
+The TURN_MANAGEMENT line must be the last line of your response, followed only by {TURN_END_MARKER}.
 
 Examples:
-- If directing prosecution to speak: TURN_MANAGEMENT: prosecution
+- If directing prosecution to speak: TURN_MANAGEMENT: prosecutor
 - If directing defense to speak: TURN_MANAGEMENT: defense
 - If directing jury to deliberate: TURN_MANAGEMENT: jury
-
-This helps the system know whose turn it is next.
 """
 
-        return f"{turn_info}\n\nORIGINAL PROMPT: {prompt}"
-
     async def rule_on_objection(
         self,
         objection_type: str,
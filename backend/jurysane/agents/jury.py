@@ -1,11 +1,113 @@
 """Jury agent for deliberating and rendering verdicts."""
 
-from typing import Any, Dict, Optional
+import asyncio
+import re
+from typing import Any, Dict, List, Optional
 
-from langchain.schema import HumanMessage
+from langchain.schema import HumanMessage, SystemMessage
+from pydantic import BaseModel, Field
 
+from ..config import settings
 from ..models.trial import CaseRole, TrialSession, Verdict
-from .base import AgentResponse, BaseAgent
+from ..utils import gather_with_concurrency
+from .base import AgentResponse, AgentUnavailableError, BaseAgent
+
+GUILTY = "Guilty"
+NOT_GUILTY = "Not Guilty"
+HUNG = "Hung"
+
+# Personas cycled through when seating a panel of individual jurors
+JUROR_PERSONAS = [
+    "a retired schoolteacher who values careful reasoning and fairness",
+    "a small business owner who is practical and skeptical of excuses",
+    "a nurse who pays close attention to human behavior and stress",
+    "a software engineer who focuses on logical consistency and data",
+    "a college student who is idealistic and wary of police overreach",
+    "a retired police officer who respects procedure but knows its limits",
+    "a stay-at-home parent who relies on common sense and intuition",
+    "an accountant who scrutinizes records and timelines",
+    "a construction foreman who is direct and distrusts polished talk",
+    "a librarian who weighs sources and corroboration carefully",
+    "a bus driver who has seen many people under pressure",
+    "a pastor who is compassionate but takes accountability seriously",
+]
+
+_VOTE_LINE = re.compile(
+    r"^\s*VOTE:\s*(?P<charge>.+?)\s*[=:-]\s*(?P<vote>not\s+guilty|guilty)\b",
+    re.IGNORECASE | re.MULTILINE)
+_SCORE_LINE = re.compile(
+    r"^\s*ITEM\s*#?(?P<index>\d+)\s*\|\s*SCORE:?\s*(?P<score>\d+(?:\.\d+)?)\s*(?:/\s*10)?\s*(?:\|\s*(?P<rationale>.*))?$",
+    re.IGNORECASE | re.MULTILINE)
+_SUMMARY_LINE = re.compile(r"^\s*SUMMARY:\s*(?P<summary>.+)$",
+                           re.IGNORECASE | re.MULTILINE)
+
+
+class JurorVote(BaseModel):
+    """One juror's votes and reasoning."""
+
+    juror: int = Field(description="Juror number (1-based)")
+    persona: str = Field(description="Persona the juror was seated with")
+    votes: Dict[str, str] = Field(
+        default_factory=dict, description="Vote (Guilty/Not Guilty) per charge")
+    summary: str = Field(default="", description="Short reasoning summary")
+
+
+class ItemScore(BaseModel):
+    """Jury score for one evidence item or witness."""
+
+    item: str = Field(description="Evidence title or witness name")
+    score: Optional[float] = Field(
+        default=None, description="Strength/credibility from 0 to 10, None if unscored")
+    rationale: str = Field(default="", description="Short reason for the score")
+
+
+class EvaluationTable(BaseModel):
+    """Parsed per-item scores from a jury evaluation."""
+
+    kind: str = Field(description="What was scored: evidence or witness")
+    scores: List[ItemScore] = Field(default_factory=list, description="Score per item")
+
+    def as_prompt_text(self) -> str:
+        """Render the table as compact lines for later prompts."""
+        return "\n".join(
+            f"- {row.item}: {row.score if row.score is not None else '?'}/10 {row.rationale}".rstrip()
+            for row in self.scores
+        )
+
+
+class DeliberationResult(BaseModel):
+    """Outcome of a panel deliberation."""
+
+    verdict: Verdict = Field(description="Aggregated verdict")
+    charge_verdicts: Dict[str, str] = Field(
+        default_factory=dict, description="Verdict per charge (Guilty/Not Guilty/Hung)")
+    jurors: List[JurorVote] = Field(
+        default_factory=list, description="Votes from jurors who deliberated")
+    jurors_seated: int = Field(description="Number of jurors on the panel")
+    stopped_early: bool = Field(
+        default=False, description="Whether remaining jurors were skipped")
+
+
+def decide_charge(guilty: int, not_guilty: int, jurors: int, require_unanimous: bool) -> str:
+    """Decide a single charge from its vote tally.
+
+    Args:
+        guilty: Guilty votes cast
+        not_guilty: Not guilty votes cast
+        jurors: Total number of jurors on the panel
+        require_unanimous: Whether a verdict needs every juror to agree
+
+    Returns:
+        Guilty, Not Guilty or Hung
+    """
+    if require_unanimous:
+        if guilty == jurors:
+            return GUILTY
+        if not_guilty == jurors:
+            return NOT_GUILTY
+        return HUNG
+    # Majority rule; a tie or missing votes cannot convict
+    return GUILTY if guilty * 2 > jurors else NOT_GUILTY
 
 
 class JuryAgent(BaseAgent):
@@ -212,3 +314,302 @@ Provide your overall assessment of the evidence. Which pieces are most compellin
             trial_session,
             context={"action": "evidence_evaluation"}
         )
+
+    async def evaluate_evidence_batch(
+        self,
+        evidence_items: Dict[str, str],
+        trial_session: TrialSession,
+        mode: str = "batch",
+        max_concurrency: Optional[int] = None,
+    ) -> EvaluationTable:
+        """Score every evidence item for strength.
+
+        Args:
+            evidence_items: Evidence description keyed by title
+            trial_session: Current trial session
+            mode: "batch" for one structured call, "parallel" for one call per
+                item under a concurrency limit
+            max_concurrency: Calls in flight in parallel mode
+
+        Returns:
+            Per-item score table
+
+        Raises:
+            AgentUnavailableError: If a scoring call failed
+        """
+        instructions = ("Score how strongly each evidence item supports its side, considering "
+                        "reliability, authentication, chain of custody and alternative explanations.")
+        return await self._score_items(
+            "evidence", evidence_items, instructions, trial_session, mode, max_concurrency)
+
+    async def assess_witnesses_batch(
+        self,
+        testimonies: Dict[str, str],
+        trial_session: TrialSession,
+        mode: str = "batch",
+        max_concurrency: Optional[int] = None,
+    ) -> EvaluationTable:
+        """Score every witness for credibility.
+
+        Args:
+            testimonies: Summary of each witness's testimony keyed by name
+            trial_session: Current trial session
+            mode: "batch" for one structured call, "parallel" for one call per
+                witness under a concurrency limit
+            max_concurrency: Calls in flight in parallel mode
+
+        Returns:
+            Per-witness score table
+
+        Raises:
+            AgentUnavailableError: If a scoring call failed
+        """
+        instructions = ("Score each witness's credibility, considering consistency, ability to "
+                        "observe, bias, and how they held up under cross-examination.")
+        return await self._score_items(
+            "witness", testimonies, instructions, trial_session, mode, max_concurrency)
+
+    async def _score_items(
+        self,
+        kind: str,
+        items: Dict[str, str],
+        instructions: str,
+        trial_session: TrialSession,
+        mode: str,
+        max_concurrency: Optional[int],
+    ) -> EvaluationTable:
+        """Score items in one structured call or a bounded parallel fan-out."""
+        names = list(items)
+        if not names:
+            return EvaluationTable(kind=kind)
+
+        if mode == "parallel":
+            tables = await gather_with_concurrency(
+                max_concurrency or settings.jury.max_concurrency,
+                *(self._score_call(kind, {name: items[name]}, instructions, trial_session)
+                  for name in names))
+            return EvaluationTable(kind=kind, scores=[t.scores[0] for t in tables])
+        if mode != "batch":
+            raise ValueError(f"Invalid evaluation mode: {mode}")
+
+        return await self._score_call(kind, items, instructions, trial_session)
+
+    async def _score_call(
+        self,
+        kind: str,
+        items: Dict[str, str],
+        instructions: str,
+        trial_session: TrialSession,
+    ) -> EvaluationTable:
+        """Make one scoring call and parse its ITEM lines.
+
+        Raises:
+            AgentUnavailableError: If the LLM call failed (a failure is not
+                reported as a table of unscored items)
+        """
+        names = list(items)
+        listing = "\n".join(
+            f"ITEM {index}: {name} - {items[name]}" for index, name in enumerate(names, start=1))
+        prompt = f"""{instructions}
+
+{kind.upper()} TO SCORE:
+{listing}
+
+Answer with exactly one line per item and nothing else, in this format:
+ITEM <number> | SCORE <0-10> | <one-sentence rationale>"""
+
+        messages = self.get_context_messages(trial_session)
+        messages.append(HumanMessage(content=prompt))
+        response = self._require_content(await self._generate_response(
+            messages, {"jury_action": f"{kind}_batch_evaluation", "items": len(names)}))
+
+        parsed: Dict[int, ItemScore] = {}
+        for match in _SCORE_LINE.finditer(response.content):
+            index = int(match.group("index"))
+            if 1 <= index <= len(names):
+                parsed[index] = ItemScore(
+                    item=names[index - 1],
+                    score=min(10.0, float(match.group("score"))),
+                    rationale=(match.group("rationale") or "").strip(),
+                )
+        return EvaluationTable(kind=kind, scores=[
+            parsed.get(index, ItemScore(item=name))
+            for index, name in enumerate(names, start=1)
+        ])
+
+    async def deliberate_panel(
+        self,
+        trial_session: TrialSession,
+        charges: list[str],
+        prosecution_summary: str,
+        defense_summary: str,
+        key_evidence: list[str],
+        judge_instructions: str,
+        jurors: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        require_unanimous: Optional[bool] = None,
+        assessments: Optional[str] = None,
+    ) -> DeliberationResult:
+        """Deliberate with a panel of individual juror personas in parallel.
+
+        Each juror votes independently on every charge. Jurors still queued
+        behind the concurrency cap are skipped once the outcome of every
+        charge can no longer change.
+
+        Args:
+            trial_session: Current trial session
+            charges: Criminal charges to decide on
+            prosecution_summary: Summary of prosecution's case
+            defense_summary: Summary of defense arguments
+            key_evidence: List of key evidence presented
+            judge_instructions: Judge's instructions to jury
+            jurors: Panel size (defaults to settings.jury.size)
+            max_concurrency: Jurors deliberating at once
+            require_unanimous: Whether verdicts must be unanimous
+            assessments: Prior evidence/witness scores to reuse
+
+        Returns:
+            Aggregated deliberation result
+
+        Raises:
+            AgentUnavailableError: If a juror's LLM call failed; a failed
+                call is never counted as an abstention
+        """
+        jurors = jurors or settings.jury.size
+        max_concurrency = max_concurrency or settings.jury.max_concurrency
+        if require_unanimous is None:
+            require_unanimous = settings.jury.require_unanimous
+
+        charges_text = "\n".join(f"- {charge}" for charge in charges)
+        evidence_text = "; ".join(key_evidence)
+        prompt = f"""The trial has concluded. Deliberate on your own and cast your vote.
+
+CHARGES:
+{charges_text}
+
+PROSECUTION'S CASE:
+{prosecution_summary}
+
+DEFENSE ARGUMENTS:
+{defense_summary}
+
+KEY EVIDENCE:
+{evidence_text}
+
+JUDGE'S INSTRUCTIONS:
+{judge_instructions}
+
+JURY'S EVIDENCE AND WITNESS ASSESSMENTS:
+{assessments or "None recorded."}
+
+Answer in exactly this format, one VOTE line per charge using the charge name as written above:
+VOTE: <charge> = GUILTY or NOT GUILTY
+SUMMARY: <one or two sentences explaining your reasoning>"""
+
+        base_messages = self.get_context_messages(trial_session)
+        tallies = {charge: {GUILTY: 0, NOT_GUILTY: 0} for charge in charges}
+        votes: List[JurorVote] = []
+        decided = asyncio.Event()
+        failures: List[AgentUnavailableError] = []
+
+        async def deliberate_juror(number: int) -> None:
+            if decided.is_set():
+                return
+            persona = JUROR_PERSONAS[(number - 1) % len(JUROR_PERSONAS)]
+            messages = base_messages + [
+                SystemMessage(content=f"You are juror #{number}, {persona}. "
+                              "Deliberate individually and vote your conscience."),
+                HumanMessage(content=prompt),
+            ]
+            try:
+                response = self._require_content(await self._generate_response(
+                    messages, {"action": "juror_vote", "juror": number}))
+            except AgentUnavailableError as e:
+                # The panel fails; skip the jurors still queued
+                failures.append(e)
+                decided.set()
+                return
+            vote = self._parse_juror_vote(number, persona, response.content, charges)
+            votes.append(vote)
+            for charge, value in vote.votes.items():
+                tallies[charge][value] += 1
+            if self._outcome_settled(tallies, jurors, len(votes), require_unanimous):
+                decided.set()
+
+        await gather_with_concurrency(
+            max_concurrency, *(deliberate_juror(n) for n in range(1, jurors + 1)))
+        if failures:
+            raise failures[0]
+
+        votes.sort(key=lambda v: v.juror)
+        charge_verdicts = {
+            charge: decide_charge(tally[GUILTY], tally[NOT_GUILTY], jurors, require_unanimous)
+            for charge, tally in tallies.items()
+        }
+        vote_breakdown: Dict[str, int] = {}
+        for charge, tally in tallies.items():
+            vote_breakdown[f"{charge}: guilty"] = tally[GUILTY]
+            vote_breakdown[f"{charge}: not_guilty"] = tally[NOT_GUILTY]
+
+        distinct = set(charge_verdicts.values())
+        if len(distinct) == 1:
+            overall = distinct.pop()
+        else:
+            overall = "; ".join(f"{charge}: {value}" for charge, value in charge_verdicts.items())
+        reasoning = "\n".join(
+            f"Juror {vote.juror}: {vote.summary}" for vote in votes if vote.summary)
+
+        return DeliberationResult(
+            verdict=Verdict(verdict=overall, reasoning=reasoning,
+                            vote_breakdown=vote_breakdown),
+            charge_verdicts=charge_verdicts,
+            jurors=votes,
+            jurors_seated=jurors,
+            stopped_early=len(votes) < jurors,
+        )
+
+    def _require_content(self, response: AgentResponse) -> AgentResponse:
+        """Reject the fallback response of a failed LLM call.
+
+        Raises:
+            AgentUnavailableError: If the response carries error metadata
+        """
+        if response.metadata.get("error"):
+            raise AgentUnavailableError(
+                self.role, response.metadata["error"],
+                rate_limited=response.metadata.get("error_type") == "rate_limited")
+        return response
+
+    @staticmethod
+    def _parse_juror_vote(number: int, persona: str, content: str, charges: list[str]) -> JurorVote:
+        """Parse a juror's VOTE/SUMMARY lines; unparseable charges are abstentions."""
+        by_name = {charge.lower(): charge for charge in charges}
+        votes: Dict[str, str] = {}
+        for match in _VOTE_LINE.finditer(content):
+            charge = by_name.get(match.group("charge").strip(" -*\"'").lower())
+            if charge is None:
+                continue
+            is_guilty = match.group("vote").lower() == "guilty"
+            votes[charge] = GUILTY if is_guilty else NOT_GUILTY
+
+        summary_match = _SUMMARY_LINE.search(content)
+        summary = summary_match.group("summary").strip() if summary_match else ""
+        return JurorVote(juror=number, persona=persona, votes=votes, summary=summary)
+
+    @staticmethod
+    def _outcome_settled(
+        tallies: Dict[str, Dict[str, int]],
+        jurors: int,
+        reported: int,
+        require_unanimous: bool,
+    ) -> bool:
+        """Check whether the remaining jurors can still change any charge."""
+        remaining = jurors - reported
+        for tally in tallies.values():
+            all_guilty = decide_charge(
+                tally[GUILTY] + remaining, tally[NOT_GUILTY], jurors, require_unanimous)
+            all_not_guilty = decide_charge(
+                tally[GUILTY], tally[NOT_GUILTY] + remaining, jurors, require_unanimous)
+            if all_guilty != all_not_guilty:
+                return False
+        return True
@@ -0,0 +1,287 @@
+"""Shared per-provider limits for LLM calls.
+
+Each provider (or provider/model pair) configured in ``settings.llm.rate_limits``
+gets one limiter with a concurrency cap and requests/tokens-per-minute token
+buckets. Waiters are ordered by the scheduler's fair queue: interactive work
+first, then by weighted fair share across tenants and sessions, so one busy
+session cannot starve the others.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Dict, Iterator, Optional
+from uuid import UUID
+
+from ..config import RateLimitConfig, settings
+from ..metrics import LLM_SLOT_WAIT
+from ..tracing import span
+from .scheduler import FairQueue, Work, current_work, wait_granted
+
+# Fairness key for the LLM call currently being made (usually a session ID)
+llm_session: ContextVar[str] = ContextVar("llm_session", default="default")
+
+# Overrides set at runtime (e.g. by the simulate CLI), merged over settings
+_overrides: Dict[str, RateLimitConfig] = {}
+_limiters: Dict[str, "ProviderLimiter"] = {}
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate."""
+
+    def __init__(self, per_minute: float):
+        """Initialize a full bucket.
+
+        Args:
+            per_minute: Refill rate and burst capacity
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` tokens are available (0 if available now)."""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float, now: float) -> None:
+        """Take tokens from the bucket."""
+        self._refill(now)
+        self.tokens -= min(amount, self.capacity)
+
+
+class ProviderLimiter:
+    """Concurrency cap plus RPM/TPM buckets with fair ordering of waiters."""
+
+    def __init__(self, key: str, config: RateLimitConfig):
+        """Initialize the limiter.
+
+        Args:
+            key: Provider or provider/model key this limiter covers
+            config: Limits to enforce
+        """
+        self.key = key
+        self.max_concurrency = config.max_concurrency
+        self.requests = TokenBucket(config.requests_per_minute) if config.requests_per_minute else None
+        self.tokens = TokenBucket(config.tokens_per_minute) if config.tokens_per_minute else None
+        self.in_flight = 0
+        # Grants are held until then after the provider pushed back
+        self.blocked_until = 0.0
+        self._queue = FairQueue(f"provider:{key}")
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def waiting(self) -> int:
+        """Number of calls queued behind the limits."""
+        return len(self._queue)
+
+    async def acquire(self, session_key: str, tokens: int) -> None:
+        """Wait for a call slot.
+
+        Args:
+            session_key: Fairness key of the caller
+            tokens: Estimated tokens the call will use
+
+        Raises:
+            DeadlineExceededError: If the caller's work deadline passes first
+        """
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        waiter = self._queue.push(future, session_key, current_work() or Work(), tokens)
+        self._dispatch()
+        await wait_granted(self._queue, waiter, self.release)
+
+    def release(self) -> None:
+        """Return a call slot."""
+        self.in_flight -= 1
+        self._dispatch()
+
+    def resize(self, max_concurrency: Optional[int]) -> None:
+        """Change the concurrency cap, keeping queued and in-flight calls.
+
+        Args:
+            max_concurrency: New cap, or None for no cap
+        """
+        self.max_concurrency = max_concurrency
+        self._dispatch()
+
+    def penalize(self, seconds: float) -> None:
+        """Pause grants after the provider pushed back.
+
+        The configured limits are left as they are.
+
+        Args:
+            seconds: How long to hold queued calls
+        """
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def _dispatch(self) -> None:
+        """Grant queued calls in fair-queue order while limits allow."""
+        while True:
+            if self.max_concurrency and self.in_flight >= self.max_concurrency:
+                return
+
+            waiter = self._queue.peek()
+            if waiter is None:
+                return
+            if waiter.future.done():
+                self._queue.discard(waiter)  # Cancelled while waiting
+                continue
+
+            tokens = waiter.tokens
+            now = time.monotonic()
+            delay = max(
+                self.blocked_until - now,
+                self.requests.wait_time(1, now) if self.requests else 0.0,
+                self.tokens.wait_time(tokens, now) if self.tokens else 0.0,
+            )
+            if delay > 0:
+                self._schedule(delay)
+                return
+
+            self._queue.take(waiter)
+            if self.requests:
+                self.requests.consume(1, now)
+            if self.tokens:
+                self.tokens.consume(tokens, now)
+            self.in_flight += 1
+            waiter.future.set_result(None)
+
+    def _schedule(self, delay: float) -> None:
+        """Re-run dispatch once the buckets have refilled or a penalty expired."""
+        if self._timer is not None:
+            return
+
+        def fire() -> None:
+            self._timer = None
+            self._dispatch()
+
+        self._timer = asyncio.get_running_loop().call_later(delay, fire)
+
+
+def set_provider_concurrency(provider: str, limit: Optional[int]) -> None:
+    """Override the concurrency cap for a provider or provider/model pair.
+
+    An existing limiter is resized in place, so calls already queued on it
+    are granted under the new cap rather than stranded.
+
+    Args:
+        provider: Provider name, optionally suffixed with "/model"
+        limit: Maximum calls in flight, or None to remove the override
+    """
+    key = provider.lower()
+    if limit is None:
+        _overrides.pop(key, None)
+    else:
+        base = settings.llm.rate_limits.get(key, RateLimitConfig())
+        _overrides[key] = base.model_copy(update={"max_concurrency": max(1, limit)})
+    limiter = _limiters.get(key)
+    if limiter is not None:
+        config = _overrides.get(key) or settings.llm.rate_limits.get(key) or RateLimitConfig()
+        limiter.resize(config.max_concurrency)
+
+
+def get_limiter(provider: str, model: str) -> Optional[ProviderLimiter]:
+    """Find the limiter for the most specific configured key.
+
+    Args:
+        provider: Provider name
+        model: Model name
+
+    Returns:
+        Shared limiter, or None if the provider is unlimited
+    """
+    for key in (f"{provider}/{model}".lower(), provider.lower()):
+        if key in _limiters:
+            return _limiters[key]
+        config = _overrides.get(key) or settings.llm.rate_limits.get(key)
+        if config is not None:
+            _limiters[key] = ProviderLimiter(key, config)
+            return _limiters[key]
+    return None
+
+
+def limiter_stats() -> Dict[str, Dict[str, int]]:
+    """Snapshot of in-flight and queued calls per limiter."""
+    return {
+        key: {"in_flight": limiter.in_flight, "waiting": limiter.waiting}
+        for key, limiter in _limiters.items()
+    }
+
+
+@contextmanager
+def llm_session_scope(session_id: UUID) -> Iterator[None]:
+    """Attribute LLM calls made inside the block to a session for fairness.
+
+    Args:
+        session_id: Session making the calls
+    """
+    token = llm_session.set(str(session_id))
+    try:
+        yield
+    finally:
+        llm_session.reset(token)
+
+
+@asynccontextmanager
+async def provider_slot(provider: str, model: str, tokens: int = 0) -> AsyncIterator[None]:
+    """Hold a provider call slot for the duration of an LLM call.
+
+    Args:
+        provider: Provider name
+        model: Model name
+        tokens: Estimated tokens the call will use
+    """
+    limiter = get_limiter(provider, model)
+    if limiter is None:
+        yield
+        return
+    started = time.perf_counter()
+    with span("llm.queue", {"llm.provider": provider}):
+        await limiter.acquire(llm_session.get(), tokens)
+    LLM_SLOT_WAIT.observe(time.perf_counter() - started, provider)
+    try:
+        yield
+    finally:
+        limiter.release()
+
+
+def penalize_provider(provider: str, model: str, seconds: float) -> None:
+    """Hold queued calls to a provider after it returned a rate-limit error.
+
+    Args:
+        provider: Provider name
+        model: Model name
+        seconds: Back-off duration
+    """
+    limiter = get_limiter(provider, model)
+    if limiter is not None:
+        limiter.penalize(seconds)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Check whether an exception is a provider rate-limit (HTTP 429) error."""
+    status = getattr(error, "status_code", None) or getattr(
+        getattr(error, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    text = f"{type(error).__name__} {error}".lower()
+    return any(marker in text for marker in ("ratelimit", "rate limit", "429", "resource_exhausted"))
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Read a Retry-After hint from a provider error, if present."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    value = headers.get("retry-after") if hasattr(headers, "get") else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
@@ -0,0 +1,263 @@
+"""Deadlines, retries and hedged requests for LLM calls.
+
+Every provider call is bounded by ``settings.llm.timeout``; the deadline
+starts once the call holds its provider slot, so time spent queueing for
+capacity does not count against it. Failures are classified as rate-limited,
+timed out, transient, deadline (dropped by the scheduler) or permanent; only
+the first three are retried, with jittered exponential back-off. When hedging is enabled, a second
+attempt is started once the first has run longer than the provider's rolling
+p95 latency, and whichever finishes first wins.
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, TypeVar
+
+from ..config import settings
+from .rate_limit import is_rate_limit_error, penalize_provider, retry_after_seconds
+from .scheduler import DeadlineExceededError
+
+T = TypeVar("T")
+
+RATE_LIMITED = "rate_limited"
+TIMEOUT = "timeout"
+TRANSIENT = "transient"
+DEADLINE = "deadline"
+PERMANENT = "permanent"
+
+_TRANSIENT_STATUS = {408, 409, 425, 500, 502, 503, 504, 529}
+# Rejections caused by the request itself rather than the provider
+_CALLER_STATUS = {400, 413, 422}
+_TRANSIENT_MARKERS = (
+    "timeout", "timed out", "connection", "temporarily", "unavailable",
+    "overloaded", "internal server error", "bad gateway", "reset by peer",
+)
+
+_trackers: Dict[str, "LatencyTracker"] = {}
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies for one provider/model."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        """Initialize the tracker.
+
+        Args:
+            window: Number of recent latencies kept
+            min_samples: Samples required before percentiles are reported
+        """
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+
+    def observe(self, seconds: float) -> None:
+        """Record a successful call latency."""
+        self.samples.append(seconds)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Latency percentile in seconds, or None until enough samples exist."""
+        if len(self.samples) < self.min_samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+def latency_tracker(provider: str, model: str) -> LatencyTracker:
+    """Get the shared latency tracker for a provider/model pair."""
+    key = f"{provider}/{model}".lower()
+    if key not in _trackers:
+        _trackers[key] = LatencyTracker()
+    return _trackers[key]
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    status = getattr(error, "status_code", None) or getattr(
+        getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def classify_error(error: BaseException) -> str:
+    """Classify a provider error for the retry policy.
+
+    Args:
+        error: Exception raised by an LLM call
+
+    Returns:
+        One of RATE_LIMITED, TIMEOUT, TRANSIENT, DEADLINE or PERMANENT
+    """
+    if isinstance(error, DeadlineExceededError):
+        return DEADLINE
+    if isinstance(error, asyncio.TimeoutError):
+        return TIMEOUT
+    if is_rate_limit_error(error):
+        return RATE_LIMITED
+    if isinstance(error, (ConnectionError, OSError)):
+        return TRANSIENT
+
+    status = _status_code(error)
+    if status is not None:
+        return TRANSIENT if status in _TRANSIENT_STATUS else PERMANENT
+
+    text = f"{type(error).__name__} {error}".lower()
+    if any(marker in text for marker in _TRANSIENT_MARKERS):
+        return TRANSIENT
+    return PERMANENT
+
+
+def is_provider_failure(error: BaseException) -> bool:
+    """Whether an error counts against the provider's circuit breaker.
+
+    Local errors (queueing deadlines, bad requests, bugs on our side) say
+    nothing about the provider's health and must not open its breaker.
+
+    Args:
+        error: Exception raised by an LLM call
+
+    Returns:
+        True if the provider failed or rejected the call for its own reasons
+    """
+    kind = classify_error(error)
+    if kind in (RATE_LIMITED, TIMEOUT, TRANSIENT):
+        return True
+    status = _status_code(error)
+    return kind == PERMANENT and status is not None and status not in _CALLER_STATUS
+
+
+async def with_timeout(call: Awaitable[T]) -> T:
+    """Bound a provider call by the configured per-attempt timeout.
+
+    Apply it only once the call holds its provider slot.
+
+    Args:
+        call: The provider request (e.g. ``llm.ainvoke(...)``)
+
+    Returns:
+        The call's result
+
+    Raises:
+        asyncio.TimeoutError: If the call outlives ``settings.llm.timeout``
+    """
+    return await asyncio.wait_for(call, timeout=settings.llm.timeout)
+
+
+def backoff_delay(retry: int, base: float, cap: float) -> float:
+    """Full-jitter exponential back-off.
+
+    Args:
+        retry: Zero-based retry number
+        base: Delay scale in seconds
+        cap: Maximum delay in seconds
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    return random.uniform(0, min(cap, base * (2 ** retry)))
+
+
+async def call_with_resilience(
+    call: Callable[[], Awaitable[T]],
+    provider: str,
+    model: str,
+    attempts: List[Dict[str, Any]],
+) -> T:
+    """Run an LLM call with deadlines, classified retries and optional hedging.
+
+    Args:
+        call: Factory starting one attempt (including any limiter wait); the
+            provider request inside it should be wrapped in with_timeout
+        provider: Provider name, for latency tracking and rate-limit back-off
+        model: Model name
+        attempts: List each attempt's record is appended to
+
+    Returns:
+        Result of the first successful attempt
+
+    Raises:
+        Exception: The last error once retries are exhausted or the error is not retryable
+    """
+    config = settings.llm
+    tracker = latency_tracker(provider, model)
+    retries = {RATE_LIMITED: 0, TRANSIENT: 0}
+
+    while True:
+        try:
+            return await _hedged_attempt(call, tracker, attempts)
+        except Exception as e:
+            kind = classify_error(e)
+            if kind in (PERMANENT, DEADLINE):
+                raise
+            budget_key = RATE_LIMITED if kind == RATE_LIMITED else TRANSIENT
+            budget = config.rate_limit_retries if kind == RATE_LIMITED else config.max_retries
+            if retries[budget_key] >= budget:
+                raise
+
+            if kind == RATE_LIMITED:
+                delay = retry_after_seconds(e) or config.rate_limit_backoff * (2 ** retries[budget_key])
+                penalize_provider(provider, model, delay)
+            else:
+                delay = backoff_delay(retries[budget_key], config.retry_backoff, config.retry_backoff_max)
+            retries[budget_key] += 1
+            await asyncio.sleep(delay)
+
+
+async def _timed_attempt(
+    call: Callable[[], Awaitable[T]],
+    tracker: LatencyTracker,
+    attempts: List[Dict[str, Any]],
+    hedged: bool,
+) -> T:
+    """Run one attempt and record its outcome."""
+    record: Dict[str, Any] = {"attempt": len(attempts) + 1, "hedged": hedged}
+    attempts.append(record)
+    started = time.perf_counter()
+    try:
+        result = await call()
+    except asyncio.CancelledError:
+        record["outcome"] = "cancelled"
+        raise
+    except Exception as e:
+        record["outcome"] = classify_error(e)
+        record["error"] = str(e) or type(e).__name__
+        raise
+    finally:
+        record["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+    record["outcome"] = "ok"
+    tracker.observe(time.perf_counter() - started)
+    return result
+
+
+async def _hedged_attempt(
+    call: Callable[[], Awaitable[T]],
+    tracker: LatencyTracker,
+    attempts: List[Dict[str, Any]],
+) -> T:
+    """Run an attempt, adding a hedge once it outlives the p95 latency."""
+    config = settings.llm
+    p95 = tracker.percentile(config.hedge_percentile) if config.hedge_requests else None
+    if p95 is None:
+        return await _timed_attempt(call, tracker, attempts, hedged=False)
+
+    primary = asyncio.ensure_future(_timed_attempt(call, tracker, attempts, hedged=False))
+    pending = {primary}
+    try:
+        done, _ = await asyncio.wait(pending, timeout=max(p95, config.hedge_min_delay))
+        if done:
+            return primary.result()
+
+        pending.add(asyncio.ensure_future(_timed_attempt(call, tracker, attempts, hedged=True)))
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error  # type: ignore[misc]
+    finally:
+        # Cancel the loser and let it record its outcome
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,405 @@
+"""Fair scheduling of agent work across sessions and tenants.
+
+Agent work carries a ``Work`` record in a context variable: its priority
+class (interactive, speculative or batch), an optional deadline and the
+tenant it is done for. Wherever work queues for capacity, a ``FairQueue``
+decides who goes next:
+
+1. Higher priority classes first, so batch and autopilot sessions only use
+   capacity interactive sessions leave free.
+2. Within a class, work close to its deadline first.
+3. Otherwise weighted fair queuing: each tenant gets its weight's share,
+   split evenly among its sessions, and a session with a backlog cannot
+   starve one that asks for a single turn.
+
+``AgentScheduler`` admits agent executions up to
+``settings.scheduler.max_concurrency``, and provider rate limiters order
+their waiters with the same queue. Work that waits past its deadline is
+dropped with ``DeadlineExceededError``.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+
+from ..config import SchedulerConfig, settings
+from ..metrics import SCHEDULER_DEADLINE_MISSES, SCHEDULER_WAIT
+
+INTERACTIVE = "interactive"
+SPECULATIVE = "speculative"
+BATCH = "batch"
+PRIORITY_CLASSES = (INTERACTIVE, SPECULATIVE, BATCH)
+
+_current_work: ContextVar[Optional["Work"]] = ContextVar("current_work", default=None)
+
+# Every live queue, so promoted work can be re-ordered wherever it waits
+_queues: "weakref.WeakSet[FairQueue]" = weakref.WeakSet()
+
+
+class DeadlineExceededError(RuntimeError):
+    """Agent work waited for capacity past its deadline."""
+
+    def __init__(self, priority: str, waited: float):
+        """Initialize the error.
+
+        Args:
+            priority: Priority class of the dropped work
+            waited: Seconds it waited
+        """
+        super().__init__(f"{priority.capitalize()} work was dropped after waiting {waited:.1f}s for capacity")
+        self.priority = priority
+        self.waited = waited
+
+
+class Work:
+    """Priority class, deadline and tenant of a piece of agent work."""
+
+    __slots__ = ("priority", "deadline", "tenant")
+
+    def __init__(
+        self,
+        priority: str = INTERACTIVE,
+        deadline_seconds: Optional[float] = None,
+        tenant: Optional[str] = None,
+    ):
+        """Initialize the work record.
+
+        Args:
+            priority: interactive, speculative or batch
+            deadline_seconds: Seconds the work may wait; defaults to the
+                class's entry in settings.scheduler.deadlines
+            tenant: Tenant the work is done for
+
+        Raises:
+            ValueError: If the priority class is unknown
+        """
+        if priority not in PRIORITY_CLASSES:
+            raise ValueError(f"Unknown priority class: {priority}")
+        self.priority = priority
+        self.tenant = tenant
+        self.deadline: Optional[float] = None
+        self.set_deadline(deadline_seconds)
+
+    def set_deadline(self, seconds: Optional[float] = None) -> None:
+        """Start the deadline clock (None uses the class default)."""
+        if seconds is None:
+            seconds = settings.scheduler.deadlines.get(self.priority)
+        self.deadline = time.monotonic() + seconds if seconds is not None else None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, or None without one."""
+        return None if self.deadline is None else self.deadline - time.monotonic()
+
+
+@contextmanager
+def work_scope(work: Work) -> Iterator[Work]:
+    """Run the block (and tasks it creates) as the given work."""
+    token = _current_work.set(work)
+    try:
+        yield work
+    finally:
+        _current_work.reset(token)
+
+
+def current_work() -> Optional[Work]:
+    """Work record of the current context, if any."""
+    return _current_work.get()
+
+
+def promote(work: Work, priority: str = INTERACTIVE) -> None:
+    """Raise queued work to a higher class, e.g. once a user waits for a speculative turn.
+
+    Args:
+        work: Work to promote
+        priority: New priority class; its default deadline replaces the old one
+    """
+    if PRIORITY_CLASSES.index(priority) >= PRIORITY_CLASSES.index(work.priority):
+        return
+    work.priority = priority
+    work.set_deadline()
+    for queue in list(_queues):
+        queue.requeue(work)
+
+
+class Waiter:
+    """A unit of work queued in a ``FairQueue``."""
+
+    __slots__ = ("future", "session", "work", "tokens", "cost", "priority", "start",
+                 "has_deadline", "entry", "__weakref__")
+
+    def __init__(self, future: "asyncio.Future[None]", session: str, work: Work, tokens: int, cost: float):
+        self.future = future
+        self.session = session
+        self.work = work
+        self.tokens = tokens
+        self.cost = cost
+        self.priority = work.priority
+        self.start = 0.0
+        self.has_deadline = False
+        # Heap entry while queued; None once taken or discarded
+        self.entry: Optional[Tuple[float, int, "Waiter"]] = None
+
+
+class FairQueue:
+    """Waiters ordered by priority class, deadline urgency and weighted fair share."""
+
+    def __init__(self, name: str, config: Optional[SchedulerConfig] = None):
+        """Initialize an empty queue.
+
+        Args:
+            name: Queue name, for metrics
+            config: Weights and deadlines; defaults to settings.scheduler
+        """
+        self.name = name
+        self.config = config or settings.scheduler
+        self._heaps: Dict[str, List[Tuple[float, int, Waiter]]] = {cls: [] for cls in PRIORITY_CLASSES}
+        self._virtual_time: Dict[str, float] = {cls: 0.0 for cls in PRIORITY_CLASSES}
+        self._counts: Dict[str, int] = {cls: 0 for cls in PRIORITY_CLASSES}
+        self._deadline_counts: Dict[str, int] = {cls: 0 for cls in PRIORITY_CLASSES}
+        # Per (class, session): finish tag of its last queued waiter, and queued count
+        self._finish: Dict[Tuple[str, str], float] = {}
+        self._queued: Dict[Tuple[str, str], int] = {}
+        # Per (class, tenant): sessions with queued work
+        self._tenant_sessions: Dict[Tuple[str, str], Set[str]] = {}
+        self._sequence = itertools.count()
+        _queues.add(self)
+
+    def __len__(self) -> int:
+        return sum(self._counts.values())
+
+    def depth(self) -> Dict[str, int]:
+        """Queued waiters per priority class."""
+        return dict(self._counts)
+
+    def push(
+        self,
+        future: "asyncio.Future[None]",
+        session: str,
+        work: Work,
+        tokens: int = 0,
+        cost: float = 1.0,
+    ) -> Waiter:
+        """Queue a waiter.
+
+        Args:
+            future: Future resolved when the waiter is granted
+            session: Session the work belongs to
+            work: Priority, deadline and tenant of the work
+            tokens: Estimated tokens, for token-bucket limits
+            cost: Share of capacity the work uses
+
+        Returns:
+            The queued waiter
+        """
+        waiter = Waiter(future, session, work, tokens, cost)
+        self._enqueue(waiter)
+        return waiter
+
+    def peek(self) -> Optional[Waiter]:
+        """The waiter that should be granted next, without removing it."""
+        for cls in PRIORITY_CLASSES:
+            heap = self._heaps[cls]
+            while heap and heap[0][2].entry is not heap[0]:
+                heapq.heappop(heap)  # Taken, discarded or moved to another class
+            if not heap:
+                continue
+            if self._deadline_counts[cls]:
+                urgent = self._most_urgent(heap)
+                if urgent is not None:
+                    return urgent
+            return heap[0][2]
+        return None
+
+    def pop(self) -> Optional[Waiter]:
+        """Remove and return the next waiter."""
+        waiter = self.peek()
+        if waiter is not None:
+            self.take(waiter)
+        return waiter
+
+    def take(self, waiter: Waiter) -> None:
+        """Remove a waiter that is being granted."""
+        cls = waiter.priority
+        self._virtual_time[cls] = max(self._virtual_time[cls], waiter.start)
+        self.discard(waiter)
+
+    def discard(self, waiter: Waiter) -> None:
+        """Remove a waiter (no-op if it is no longer queued)."""
+        if waiter.entry is None:
+            return
+        waiter.entry = None
+        cls = waiter.priority
+        self._counts[cls] -= 1
+        if waiter.has_deadline:
+            self._deadline_counts[cls] -= 1
+        flow = (cls, waiter.session)
+        self._queued[flow] -= 1
+        if not self._queued[flow]:
+            del self._queued[flow]
+            del self._finish[flow]
+            tenant = (cls, self._tenant_key(waiter))
+            sessions = self._tenant_sessions[tenant]
+            sessions.discard(waiter.session)
+            if not sessions:
+                del self._tenant_sessions[tenant]
+
+    def requeue(self, work: Work) -> None:
+        """Move waiters of a promoted work record to its new class."""
+        for cls, heap in self._heaps.items():
+            if cls == work.priority:
+                continue
+            for entry in list(heap):
+                waiter = entry[2]
+                if waiter.work is work and waiter.entry is entry:
+                    self.discard(waiter)
+                    self._enqueue(waiter)
+
+    def _tenant_key(self, waiter: Waiter) -> str:
+        # Sessions without a tenant each count as their own tenant
+        return waiter.work.tenant or f"session:{waiter.session}"
+
+    def _enqueue(self, waiter: Waiter) -> None:
+        cls = waiter.priority = waiter.work.priority
+        flow = (cls, waiter.session)
+        sessions = self._tenant_sessions.setdefault((cls, self._tenant_key(waiter)), set())
+        sessions.add(waiter.session)
+        weight = self.config.tenant_weights.get(waiter.work.tenant or "", 1.0) / len(sessions)
+
+        # Start-time fair queuing: a session's work is tagged after its own
+        # earlier work and no earlier than the work now being served
+        waiter.start = max(self._virtual_time[cls], self._finish.get(flow, 0.0))
+        finish = waiter.start + waiter.cost / max(weight, 1e-9)
+        self._finish[flow] = finish
+        self._queued[flow] = self._queued.get(flow, 0) + 1
+        self._counts[cls] += 1
+        waiter.has_deadline = waiter.work.deadline is not None
+        if waiter.has_deadline:
+            self._deadline_counts[cls] += 1
+        waiter.entry = (finish, next(self._sequence), waiter)
+        heapq.heappush(self._heaps[cls], waiter.entry)
+
+    def _most_urgent(self, heap: List[Tuple[float, int, Waiter]]) -> Optional[Waiter]:
+        """Earliest-deadline waiter within the urgency window, if any."""
+        horizon = time.monotonic() + self.config.deadline_urgency
+        urgent: Optional[Waiter] = None
+        for entry in heap:
+            waiter = entry[2]
+            deadline = waiter.work.deadline
+            if (waiter.entry is entry and deadline is not None and deadline <= horizon
+                    and (urgent is None or deadline < urgent.work.deadline)):  # type: ignore[operator]
+                urgent = waiter
+        return urgent
+
+
+async def wait_granted(queue: FairQueue, waiter: Waiter, release: Any) -> None:
+    """Wait for a queued waiter's grant, honouring its deadline.
+
+    Args:
+        queue: Queue the waiter is in
+        waiter: Queued waiter
+        release: Callback returning the slot if the grant raced a cancellation
+
+    Raises:
+        DeadlineExceededError: If the deadline passes first
+    """
+    started = time.monotonic()
+    try:
+        await asyncio.wait_for(waiter.future, waiter.work.remaining())
+    except asyncio.TimeoutError:
+        queue.discard(waiter)
+        SCHEDULER_DEADLINE_MISSES.inc(queue.name, waiter.priority)
+        raise DeadlineExceededError(waiter.priority, time.monotonic() - started) from None
+    except asyncio.CancelledError:
+        queue.discard(waiter)
+        if waiter.future.done() and not waiter.future.cancelled():
+            # Granted just before the caller was cancelled
+            release()
+        raise
+
+
+class AgentScheduler:
+    """Admission control for agent executions."""
+
+    def __init__(self, config: Optional[SchedulerConfig] = None):
+        """Initialize the scheduler.
+
+        Args:
+            config: Scheduler settings; defaults to settings.scheduler
+        """
+        self.config = config or settings.scheduler
+        self.queue = FairQueue("agents", self.config)
+        self.in_flight: Dict[str, int] = {cls: 0 for cls in PRIORITY_CLASSES}
+
+    @asynccontextmanager
+    async def slot(self, session_key: str, work: Work) -> AsyncIterator[None]:
+        """Hold an execution slot for the duration of an agent call.
+
+        Args:
+            session_key: Session the work belongs to
+            work: Priority, deadline and tenant of the work
+
+        Raises:
+            DeadlineExceededError: If the work's deadline passes while it waits
+        """
+        started = time.monotonic()
+        remaining = work.remaining()
+        if remaining is not None and remaining <= 0:
+            SCHEDULER_DEADLINE_MISSES.inc(self.queue.name, work.priority)
+            raise DeadlineExceededError(work.priority, 0.0)
+
+        limit = self.config.max_concurrency
+        if limit is not None and (sum(self.in_flight.values()) >= limit or len(self.queue)):
+            future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+            waiter = self.queue.push(future, session_key, work)
+            self._dispatch()
+            await wait_granted(self.queue, waiter, lambda: self._release(waiter.priority))
+            priority = waiter.priority
+        else:
+            priority = work.priority
+            self.in_flight[priority] += 1
+        SCHEDULER_WAIT.observe(time.monotonic() - started, priority)
+        try:
+            yield
+        finally:
+            self._release(priority)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Running and queued agent executions per priority class."""
+        return {"in_flight": dict(self.in_flight), "queued": self.queue.depth()}
+
+    def _release(self, priority: str) -> None:
+        self.in_flight[priority] -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant queued work while slots are free."""
+        limit = self.config.max_concurrency
+        while limit is None or sum(self.in_flight.values()) < limit:
+            waiter = self.queue.pop()
+            if waiter is None:
+                return
+            if waiter.future.done():
+                continue  # Cancelled while waiting
+            self.in_flight[waiter.priority] += 1
+            waiter.future.set_result(None)
+
+
+_scheduler: Optional[AgentScheduler] = None
+
+
+def get_scheduler() -> AgentScheduler:
+    """Shared agent scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = AgentScheduler()
+    return _scheduler
+
+
+def queue_depths() -> Dict[Tuple[str, str], float]:
+    """Queued work per (queue, priority class) across all fair queues."""
+    return {(queue.name, cls): count for queue in list(_queues) for cls, count in queue.depth().items()}
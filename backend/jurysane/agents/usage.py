@@ -0,0 +1,234 @@
+"""Token, cost and latency accounting for LLM calls.
+
+``BaseAgent`` reads token counts from the provider response (falling back to
+a ~4 characters per token estimate) and reports every call to the shared
+``UsageTracker``. Calls made inside ``usage_scope(session_id, phase, tenant)``
+are attributed to that session, trial phase and tenant; counters are kept per
+(role, phase) for each session and globally, per provider/model, and per
+tenant and day. Per-session counters are kept for the most recently active
+``settings.budgets.tracked_sessions`` sessions and tenant counters for the
+current day only, so a long-running server does not grow without bound.
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+from uuid import UUID
+
+from ..config import settings
+
+# (session ID, phase, tenant) the LLM call currently being made belongs to
+_usage_context: ContextVar[Optional[Tuple[str, str, Optional[str]]]] = ContextVar(
+    "usage_context", default=None)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
+def extract_token_usage(response: Any) -> Optional[Tuple[int, int]]:
+    """Read (prompt, completion) token counts from an LLM response.
+
+    Understands LangChain's ``usage_metadata`` and the OpenAI/Groq, Anthropic
+    and Gemini shapes of ``response_metadata``.
+
+    Args:
+        response: Message returned by ``ainvoke``
+
+    Returns:
+        Token counts, or None if the provider did not report them
+    """
+    usage = getattr(response, "usage_metadata", None)
+    if usage:
+        return int(usage.get("input_tokens") or 0), int(usage.get("output_tokens") or 0)
+
+    metadata = getattr(response, "response_metadata", None) or {}
+    for key in ("token_usage", "usage"):
+        data = metadata.get(key)
+        if isinstance(data, dict):
+            prompt = data.get("prompt_tokens", data.get("input_tokens"))
+            completion = data.get("completion_tokens", data.get("output_tokens"))
+            if prompt is not None or completion is not None:
+                return int(prompt or 0), int(completion or 0)
+    data = metadata.get("usage_metadata")
+    if isinstance(data, dict) and "prompt_token_count" in data:
+        return int(data["prompt_token_count"] or 0), int(data.get("candidates_token_count") or 0)
+    return None
+
+
+def token_cost(provider: str, model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Price of a call in USD from ``settings.llm.pricing`` (0 if unpriced)."""
+    price = settings.llm.pricing.get(f"{provider}/{model}")
+    if price is None:
+        return 0.0
+    return (prompt_tokens * price.input + completion_tokens * price.output) / 1_000_000
+
+
+@contextmanager
+def usage_scope(
+    session_id: Union[UUID, str],
+    phase: Optional[str] = None,
+    tenant_id: Optional[str] = None,
+) -> Iterator[None]:
+    """Attribute LLM calls made inside the block to a session, phase and tenant."""
+    token = _usage_context.set((str(session_id), phase or "unknown", tenant_id))
+    try:
+        yield
+    finally:
+        _usage_context.reset(token)
+
+
+class UsageCounter:
+    """Running totals for a group of LLM calls."""
+
+    __slots__ = ("calls", "errors", "estimated", "prompt_tokens", "completion_tokens",
+                 "cost_usd", "latency_ms")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.estimated = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cost_usd = 0.0
+        self.latency_ms = 0.0
+
+    def add(self, usage: Dict[str, Any]) -> None:
+        """Add one call's usage record."""
+        self.calls += 1
+        self.errors += bool(usage.get("error"))
+        self.estimated += bool(usage.get("estimated"))
+        self.prompt_tokens += usage.get("prompt_tokens", 0)
+        self.completion_tokens += usage.get("completion_tokens", 0)
+        self.cost_usd += usage.get("cost_usd", 0.0)
+        self.latency_ms += usage.get("latency_ms", 0.0)
+
+    def merge(self, other: "UsageCounter") -> None:
+        """Add another counter's totals."""
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Totals for JSON output."""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "estimated_calls": self.estimated,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+            "latency_ms": round(self.latency_ms, 1),
+        }
+
+
+GroupKey = Tuple[str, str]
+
+
+def _summarize(groups: Dict[GroupKey, UsageCounter]) -> Dict[str, Any]:
+    """Fold (role, phase) counters into totals, per role and per phase."""
+    total = UsageCounter()
+    by_role: Dict[str, UsageCounter] = {}
+    by_phase: Dict[str, UsageCounter] = {}
+    for (role, phase), counter in groups.items():
+        total.merge(counter)
+        by_role.setdefault(role, UsageCounter()).merge(counter)
+        by_phase.setdefault(phase, UsageCounter()).merge(counter)
+    return {
+        "total": total.as_dict(),
+        "by_role": {role: counter.as_dict() for role, counter in by_role.items()},
+        "by_phase": {phase: counter.as_dict() for phase, counter in by_phase.items()},
+    }
+
+
+class UsageTracker:
+    """Aggregates usage per session, role and phase."""
+
+    def __init__(self, max_sessions: Optional[int] = None) -> None:
+        """Initialize empty counters.
+
+        Args:
+            max_sessions: Sessions kept before the least recently active is
+                forgotten; defaults to settings.budgets.tracked_sessions
+        """
+        self.max_sessions = max_sessions or settings.budgets.tracked_sessions
+        self._sessions: "OrderedDict[str, Dict[GroupKey, UsageCounter]]" = OrderedDict()
+        self._global: Dict[GroupKey, UsageCounter] = {}
+        self._models: Dict[str, UsageCounter] = {}
+        self._tenants: Dict[Tuple[str, date], UsageCounter] = {}
+        self._today = date.today()
+
+    def record(self, role: str, usage: Dict[str, Any]) -> None:
+        """Add one call, attributed to the current ``usage_scope``.
+
+        Args:
+            role: Role of the agent that made the call
+            usage: Usage record built by the agent
+        """
+        scope = _usage_context.get()
+        phase = scope[1] if scope else "unknown"
+        key = (role, phase)
+        self._global.setdefault(key, UsageCounter()).add(usage)
+        if usage.get("model"):
+            self._models.setdefault(usage["model"], UsageCounter()).add(usage)
+        if scope is not None:
+            self._sessions.setdefault(scope[0], {}).setdefault(key, UsageCounter()).add(usage)
+            self._sessions.move_to_end(scope[0])
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+            if scope[2] is not None:
+                today = date.today()
+                if today != self._today:
+                    # Daily tenant budgets only look at today
+                    self._tenants = {
+                        tenant_day: counter for tenant_day, counter in self._tenants.items()
+                        if tenant_day[1] >= today}
+                    self._today = today
+                self._tenants.setdefault((scope[2], today), UsageCounter()).add(usage)
+
+    def has_session(self, session_id: Union[UUID, str]) -> bool:
+        """Whether any call was recorded for a session."""
+        return str(session_id) in self._sessions
+
+    def session_totals(self, session_id: Union[UUID, str]) -> UsageCounter:
+        """Totals for one session."""
+        total = UsageCounter()
+        for counter in self._sessions.get(str(session_id), {}).values():
+            total.merge(counter)
+        return total
+
+    def tenant_totals(self, tenant_id: str, day: Optional[date] = None) -> UsageCounter:
+        """Totals for one tenant on a day (today by default)."""
+        return self._tenants.get((tenant_id, day or date.today())) or UsageCounter()
+
+    def session_summary(self, session_id: Union[UUID, str]) -> Dict[str, Any]:
+        """Usage of one session: totals, per role and per phase."""
+        return _summarize(self._sessions.get(str(session_id), {}))
+
+    def global_summary(self) -> Dict[str, Any]:
+        """Usage across all sessions, plus per model and the busiest sessions."""
+        summary = _summarize(self._global)
+        summary["by_model"] = {model: counter.as_dict() for model, counter in self._models.items()}
+        sessions = sorted(
+            ((session_id, self.session_totals(session_id)) for session_id in self._sessions),
+            key=lambda item: -item[1].total_tokens,
+        )
+        summary["sessions"] = len(sessions)
+        summary["top_sessions"] = [
+            {"session_id": session_id, **counter.as_dict()} for session_id, counter in sessions[:10]
+        ]
+        return summary
+
+    def drop_session(self, session_id: Union[UUID, str]) -> None:
+        """Forget a session's counters (global totals are kept)."""
+        self._sessions.pop(str(session_id), None)
+
+
+usage_tracker = UsageTracker()
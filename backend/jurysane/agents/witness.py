@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, Optional
 
-from langchain.schema import HumanMessage
+from langchain.schema import HumanMessage, SystemMessage
 
 from ..models.trial import CaseRole, TrialSession
 from .base import AgentResponse, BaseAgent
@@ -76,6 +76,8 @@ Remember: You are here to tell the truth about what you know, saw, or experience
             provider_name=provider_name,
             temperature=0.6,
         )
+        # Memories retrieved for the current question (set by the trial service)
+        self.recalled_memory: Optional[str] = None
 
     async def respond(
         self,
@@ -85,6 +87,10 @@ Remember: You are here to tell the truth about what you know, saw, or experience
     ) -> AgentResponse:
         """Generate a witness response."""
         messages = self.get_context_messages(trial_session)
+        if self.recalled_memory:
+            messages.append(SystemMessage(
+                content="WHAT YOU RECALL THAT IS RELEVANT TO THIS QUESTION "
+                        "(stay consistent with it):\n" + self.recalled_memory))
         messages.append(HumanMessage(content=prompt))
 
         phase_value = trial_session.current_phase.value if hasattr(
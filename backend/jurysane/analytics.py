@@ -0,0 +1,305 @@
+"""Vectorized analytics over simulation results.
+
+Simulation NDJSON files are loaded once into flat NumPy arrays (one row per
+trial, per charge and per turn, with integer case indices) so per-case
+statistics are computed with ``bincount``/``lexsort`` instead of Python loops
+over transcripts.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+NOT_GUILTY, GUILTY, HUNG, MIXED, NO_VERDICT = 0, 1, 2, 3, 4
+VERDICT_LABELS = ["Not Guilty", "Guilty", "Hung", "Mixed", "No Verdict"]
+_VERDICT_CODES = {"not guilty": NOT_GUILTY, "guilty": GUILTY, "hung": HUNG}
+
+
+def verdict_code(verdict: Optional[str]) -> int:
+    """Map a verdict string to its integer code.
+
+    Args:
+        verdict: Verdict text (e.g. "Guilty", "Hung", or a per-charge mix)
+
+    Returns:
+        One of the module's verdict codes
+    """
+    if not verdict:
+        return NO_VERDICT
+    return _VERDICT_CODES.get(verdict.strip().lower(), MIXED)
+
+
+@dataclass
+class SimulationArrays:
+    """Compact columnar view of simulation results."""
+
+    case_titles: List[str]
+    charge_names: List[str]
+    # One row per trial
+    trial_case: np.ndarray
+    trial_ok: np.ndarray
+    trial_verdict: np.ndarray
+    trial_turns: np.ndarray
+    trial_duration_ms: np.ndarray
+    trial_tokens: np.ndarray
+    # One row per (trial, charge)
+    charge_trial: np.ndarray
+    charge_name: np.ndarray
+    charge_guilty_votes: np.ndarray
+    charge_not_guilty_votes: np.ndarray
+    charge_verdict: np.ndarray
+    # One row per turn
+    turn_trial: np.ndarray
+    turn_latency_ms: np.ndarray
+
+    @property
+    def n_cases(self) -> int:
+        """Number of distinct cases."""
+        return len(self.case_titles)
+
+
+def _records(source: Union[str, Path, Iterable[Dict[str, Any]]]) -> Iterable[Dict[str, Any]]:
+    """Yield records from an NDJSON path or pass through an iterable."""
+    if isinstance(source, (str, Path)):
+        with Path(source).open("r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+    else:
+        yield from source
+
+
+def load_simulation_arrays(source: Union[str, Path, Iterable[Dict[str, Any]]]) -> SimulationArrays:
+    """Load simulation records into flat NumPy arrays.
+
+    Transcripts are not retained; only the fields needed for analysis are
+    extracted from each record. A resumed run re-runs failed trials and
+    appends a second record for the same (case title, trial index); only the
+    last record per key is kept.
+
+    Args:
+        source: NDJSON file written by ``jurysane simulate`` or an iterable of
+            already-decoded records
+
+    Returns:
+        Columnar arrays for the whole run
+    """
+    case_index: Dict[str, int] = {}
+    charge_index: Dict[str, int] = {}
+    trial_case: List[int] = []
+    trial_ok: List[bool] = []
+    trial_verdict: List[int] = []
+    trial_turns: List[int] = []
+    trial_duration: List[float] = []
+    trial_tokens: List[float] = []
+    charge_trial: List[int] = []
+    charge_name: List[int] = []
+    charge_guilty: List[int] = []
+    charge_not_guilty: List[int] = []
+    charge_verdict: List[int] = []
+    turn_trial: List[int] = []
+    turn_latency: List[float] = []
+
+    latest: Dict[Any, Dict[str, Any]] = {}
+    for position, record in enumerate(_records(source)):
+        key = (record["case_title"], record["trial_index"]) if "trial_index" in record else position
+        latest.pop(key, None)
+        latest[key] = {field: value for field, value in record.items() if field != "transcript"}
+
+    for row, record in enumerate(latest.values()):
+        case = case_index.setdefault(record["case_title"], len(case_index))
+        verdict = record.get("verdict") or {}
+        turns = record.get("turns") or []
+        # UsageTracker.session_summary(): totals under "total"
+        usage = (record.get("usage") or {}).get("total") or {}
+
+        trial_case.append(case)
+        trial_ok.append(record.get("status") == "ok")
+        trial_verdict.append(verdict_code(verdict.get("verdict")))
+        trial_turns.append(len(turns))
+        trial_duration.append(float(record.get("duration_ms") or np.nan))
+        trial_tokens.append(float(usage.get("total_tokens", np.nan)))
+
+        breakdown = verdict.get("vote_breakdown") or {}
+        for charge, outcome in (record.get("charge_verdicts") or {}).items():
+            charge_trial.append(row)
+            charge_name.append(charge_index.setdefault(charge, len(charge_index)))
+            charge_guilty.append(int(breakdown.get(f"{charge}: guilty", 0)))
+            charge_not_guilty.append(int(breakdown.get(f"{charge}: not_guilty", 0)))
+            charge_verdict.append(verdict_code(outcome))
+
+        turn_trial.extend([row] * len(turns))
+        turn_latency.extend(float(turn.get("latency_ms", np.nan)) for turn in turns)
+
+    return SimulationArrays(
+        case_titles=list(case_index),
+        charge_names=list(charge_index),
+        trial_case=np.asarray(trial_case, dtype=np.int32),
+        trial_ok=np.asarray(trial_ok, dtype=bool),
+        trial_verdict=np.asarray(trial_verdict, dtype=np.int8),
+        trial_turns=np.asarray(trial_turns, dtype=np.int32),
+        trial_duration_ms=np.asarray(trial_duration, dtype=np.float32),
+        trial_tokens=np.asarray(trial_tokens, dtype=np.float64),
+        charge_trial=np.asarray(charge_trial, dtype=np.int32),
+        charge_name=np.asarray(charge_name, dtype=np.int32),
+        charge_guilty_votes=np.asarray(charge_guilty, dtype=np.int16),
+        charge_not_guilty_votes=np.asarray(charge_not_guilty, dtype=np.int16),
+        charge_verdict=np.asarray(charge_verdict, dtype=np.int8),
+        turn_trial=np.asarray(turn_trial, dtype=np.int32),
+        turn_latency_ms=np.asarray(turn_latency, dtype=np.float32),
+    )
+
+
+def wilson_interval(successes: np.ndarray, totals: np.ndarray, z: float = 1.96) -> np.ndarray:
+    """Wilson score confidence intervals for many proportions at once.
+
+    Args:
+        successes: Success counts
+        totals: Trial counts (zeros yield NaN bounds)
+        z: Normal quantile for the confidence level (1.96 = 95%)
+
+    Returns:
+        Array of shape (n, 2) with lower and upper bounds
+    """
+    successes = np.asarray(successes, dtype=np.float64)
+    totals = np.asarray(totals, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = successes / totals
+        denom = 1.0 + z * z / totals
+        centre = (p + z * z / (2 * totals)) / denom
+        half = z * np.sqrt(p * (1 - p) / totals + z * z / (4 * totals * totals)) / denom
+    return np.clip(np.stack([centre - half, centre + half], axis=-1), 0.0, 1.0)
+
+
+def grouped_percentiles(
+    groups: np.ndarray,
+    values: np.ndarray,
+    n_groups: int,
+    percentiles: Iterable[float],
+) -> np.ndarray:
+    """Linear-interpolated percentiles of ``values`` within each group.
+
+    Sorts once by (group, value) and indexes every group's quantile
+    positions directly; NaN values are ignored.
+
+    Args:
+        groups: Group index per value
+        values: Values to summarize
+        n_groups: Number of groups
+        percentiles: Percentiles in [0, 100]
+
+    Returns:
+        Array of shape (n_groups, len(percentiles)); NaN for empty groups
+    """
+    q = np.asarray(list(percentiles), dtype=np.float64) / 100.0
+    values = np.asarray(values, dtype=np.float64)
+    keep = ~np.isnan(values)
+    groups, values = np.asarray(groups)[keep], values[keep]
+
+    order = np.lexsort((values, groups))
+    sorted_values = values[order]
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+
+    position = starts[:, None] + (counts[:, None] - 1) * q[None, :]
+    low = np.floor(position).astype(np.int64)
+    high = np.ceil(position).astype(np.int64)
+    empty = counts == 0
+    low[empty] = 0
+    high[empty] = 0
+    if sorted_values.size == 0:
+        return np.full((n_groups, q.size), np.nan)
+
+    fraction = position - low
+    result = sorted_values[low] * (1 - fraction) + sorted_values[high] * fraction
+    result[empty] = np.nan
+    return result
+
+
+class CaseReport(BaseModel):
+    """Per-case summary statistics."""
+
+    case_title: str = Field(description="Case title")
+    trials: int = Field(description="Trials recorded for the case")
+    errors: int = Field(description="Trials that ended with an error")
+    verdict_rates: Dict[str, float] = Field(description="Share of completed trials per verdict")
+    guilty_rate_ci: List[float] = Field(
+        description="95% Wilson interval of the guilty rate over completed trials")
+    mean_turns: float = Field(description="Mean turns per completed trial")
+    turn_latency_ms: Dict[str, float] = Field(description="Turn latency percentiles")
+    tokens: Dict[str, float] = Field(description="Tokens-per-trial percentiles")
+    charge_vote_distributions: Dict[str, List[int]] = Field(
+        default_factory=dict,
+        description="Histogram of guilty votes (index = votes) per charge")
+
+
+def summarize(arrays: SimulationArrays, percentiles: Iterable[float] = (50, 90, 95, 99)) -> List[CaseReport]:
+    """Compute per-case verdict, vote, turn, latency and token statistics.
+
+    Verdict rates, their interval and turn counts cover completed trials
+    only; errored trials are reported in ``errors``.
+
+    Args:
+        arrays: Loaded simulation arrays
+        percentiles: Percentiles to report for latencies and tokens
+
+    Returns:
+        One report per case, in first-seen order
+    """
+    percentiles = list(percentiles)
+    n_cases = arrays.n_cases
+    n_labels = len(VERDICT_LABELS)
+
+    trials = np.bincount(arrays.trial_case, minlength=n_cases)
+    ok = arrays.trial_ok
+    completed = np.bincount(arrays.trial_case[ok], minlength=n_cases)
+    errors = trials - completed
+    verdict_counts = np.bincount(
+        arrays.trial_case[ok].astype(np.int64) * n_labels + arrays.trial_verdict[ok],
+        minlength=n_cases * n_labels,
+    ).reshape(n_cases, n_labels)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        verdict_rates = verdict_counts / completed[:, None]
+        mean_turns = np.bincount(
+            arrays.trial_case[ok], weights=arrays.trial_turns[ok], minlength=n_cases) / completed
+    guilty_ci = wilson_interval(verdict_counts[:, GUILTY], completed)
+
+    latency = grouped_percentiles(
+        arrays.trial_case[arrays.turn_trial], arrays.turn_latency_ms, n_cases, percentiles)
+    tokens = grouped_percentiles(arrays.trial_case, arrays.trial_tokens, n_cases, percentiles)
+
+    # Guilty-vote histograms per (case, charge)
+    max_votes = int(arrays.charge_guilty_votes.max(initial=0)) + 1
+    n_charges = len(arrays.charge_names)
+    charge_case = arrays.trial_case[arrays.charge_trial].astype(np.int64)
+    histogram = np.bincount(
+        (charge_case * n_charges + arrays.charge_name) * max_votes + arrays.charge_guilty_votes,
+        minlength=n_cases * n_charges * max_votes,
+    ).reshape(n_cases, n_charges, max_votes)
+    charge_seen = histogram.sum(axis=2) > 0
+
+    reports = []
+    for case, title in enumerate(arrays.case_titles):
+        reports.append(CaseReport(
+            case_title=title,
+            trials=int(trials[case]),
+            errors=int(errors[case]),
+            verdict_rates={
+                label: float(verdict_rates[case, code])
+                for code, label in enumerate(VERDICT_LABELS)
+            },
+            guilty_rate_ci=[float(bound) for bound in guilty_ci[case]],
+            mean_turns=float(mean_turns[case]),
+            turn_latency_ms={f"p{p:g}": float(v) for p, v in zip(percentiles, latency[case])},
+            tokens={f"p{p:g}": float(v) for p, v in zip(percentiles, tokens[case])},
+            charge_vote_distributions={
+                arrays.charge_names[charge]: histogram[case, charge].tolist()
+                for charge in np.flatnonzero(charge_seen[case])
+            },
+        ))
+    return reports
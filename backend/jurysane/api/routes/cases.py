@@ -1,11 +1,12 @@
 """Case management API routes."""
 
 from typing import List
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from uuid import UUID
 
 from ...models.trial import Case
 from ...data.case_store import get_shared_cases, get_case_by_id
+from ...services.case_search import CaseSearchHit, get_case_search_index
 
 
 router = APIRouter(prefix="/cases", tags=["cases"])
@@ -55,6 +56,28 @@ async def search_cases(query: str):
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 
+@router.get("/search/semantic/{query}", response_model=List[CaseSearchHit])
+async def semantic_search_cases(
+    query: str,
+    limit: int = Query(default=10, ge=1, le=100),
+    lexical_weight: float = Query(default=0.3, ge=0.0, le=1.0),
+):
+    """Search cases by meaning, optionally blended with word overlap.
+
+    Args:
+        query: Search query string
+        limit: Maximum number of results
+        lexical_weight: Share of the score from word overlap (0 = purely semantic)
+
+    Returns:
+        Matching cases with their scores, best first
+    """
+    try:
+        return get_case_search_index().search(query, limit, lexical_weight)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
+
+
 @router.get("/category/{category}", response_model=List[Case])
 async def get_cases_by_category(category: str):
     """Get cases filtered by category.
@@ -1,12 +1,18 @@
 """Trial-related API routes."""
 
-from typing import Dict, List, Optional
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
+from ...agents import AgentUnavailableError, DeliberationResult, EvaluationTable
 from ...models.trial import Case, CaseRole, TrialPhase, TrialSession, UserRole, Verdict
+from ...services.budget import BudgetExceededError
+from ...services.job_queue import BATCH, INTERACTIVE, Job, QueueFullError, get_job_queue
+from ...services.objection_classifier import ObjectionRuling
 from ...services.trial_service import TrialService
 from ...data.case_store import get_shared_cases, get_case_by_id as get_case_by_id_from_store
 from ...utils import format_case_role
@@ -52,6 +58,7 @@ class CreateTrialRequest(BaseModel):
     """Request to create a new trial."""
     case_id: UUID
     user_role: UserRole
+    tenant_id: Optional[str] = None
 
 
 class CreateTrialResponse(BaseModel):
@@ -84,6 +91,17 @@ class CompleteTrialRequest(BaseModel):
     verdict: Verdict
 
 
+class DeliberateRequest(BaseModel):
+    """Request to run jury deliberation."""
+    jurors: Optional[int] = Field(default=None, ge=1, le=12)
+
+
+class JuryEvaluationRequest(BaseModel):
+    """Request to score evidence and witnesses for the jury."""
+    mode: Optional[str] = Field(default=None, pattern="^(batch|parallel)$")
+    refresh: bool = False
+
+
 @router.post("/create", response_model=CreateTrialResponse)
 async def create_trial(
     request: CreateTrialRequest,
@@ -105,6 +123,7 @@ async def create_trial(
         session = await trial_service.create_trial_session(
             case=case,
             user_role=request.user_role,
+            tenant_id=request.tenant_id,
         )
 
         return CreateTrialResponse(
@@ -121,6 +140,21 @@ async def create_trial(
         ) from e
 
 
+@router.get("/usage", response_model=Dict[str, Any])
+async def get_global_usage(
+    trial_service: TrialService = Depends(get_trial_service),
+) -> Dict[str, Any]:
+    """Get token, cost and latency totals across all sessions.
+
+    Args:
+        trial_service: Trial service instance
+
+    Returns:
+        Totals per role, phase and model, and the most expensive sessions
+    """
+    return trial_service.get_global_usage()
+
+
 @router.get("/{session_id}", response_model=TrialSession)
 async def get_trial_session(
     session_id: UUID,
@@ -145,22 +179,72 @@ async def get_trial_session(
     return session
 
 
-@router.post("/{session_id}/agent-response", response_model=AgentResponse)
+async def _submit_job(
+    trial_service: TrialService,
+    session_id: UUID,
+    kind: str,
+    run: Any,
+    priority: Optional[str],
+) -> JSONResponse:
+    """Queue an agent turn as a background job.
+
+    Args:
+        trial_service: Trial service instance
+        session_id: Trial session ID
+        kind: Job kind
+        run: Coroutine factory producing the route's response
+        priority: interactive or batch; autopilot sessions default to batch
+
+    Returns:
+        202 response with the queued job
+    """
+    if not await trial_service.get_trial_session(session_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Trial session not found",
+        )
+    if priority is None:
+        priority = BATCH if session_id in trial_service.autopilot_sessions else INTERACTIVE
+    try:
+        job = get_job_queue().submit(session_id, kind, run, priority)
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+        ) from e
+    return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=job.model_dump(mode="json"))
+
+
+@router.post(
+    "/{session_id}/agent-response",
+    response_model=AgentResponse,
+    responses={202: {"model": Job, "description": "Queued as a background job"}},
+)
 async def get_agent_response(
     session_id: UUID,
     request: AgentPromptRequest,
+    background: bool = Query(default=False, description="Queue the turn and return a job"),
+    priority: Optional[str] = Query(default=None, pattern="^(interactive|batch)$"),
     trial_service: TrialService = Depends(get_trial_service),
-) -> AgentResponse:
+) -> Any:
     """Get a response from an AI agent.
 
     Args:
         session_id: Trial session ID
         request: Agent prompt request
+        background: Queue the turn as a job instead of waiting for it
+        priority: Job priority (interactive or batch)
         trial_service: Trial service instance
 
     Returns:
-        Agent response
+        Agent response, or the queued job when background is set
     """
+    if background:
+        return await _submit_job(
+            trial_service, session_id, "agent-response",
+            lambda: get_agent_response(
+                session_id, request, background=False, trial_service=trial_service),
+            priority)
     try:
         content = await trial_service.get_agent_response(
             session_id=session_id,
@@ -182,6 +266,16 @@ async def get_agent_response(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         ) from e
+    except BudgetExceededError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+        ) from e
+    except AgentUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+        ) from e
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -223,23 +317,38 @@ async def advance_trial_phase(
         ) from e
 
 
-@router.post("/{session_id}/auto-response", response_model=AgentResponse)
+@router.post(
+    "/{session_id}/auto-response",
+    response_model=AgentResponse,
+    responses={202: {"model": Job, "description": "Queued as a background job"}},
+)
 async def get_automatic_agent_response(
     session_id: UUID,
+    background: bool = Query(default=False, description="Queue the turn and return a job"),
+    priority: Optional[str] = Query(default=None, pattern="^(interactive|batch)$"),
     trial_service: TrialService = Depends(get_trial_service),
-) -> AgentResponse:
+) -> Any:
     """Get an automatic response from the agent whose turn it is.
 
     Args:
         session_id: Session ID
+        background: Queue the turn as a job instead of waiting for it
+        priority: Job priority (interactive or batch)
         trial_service: Trial service instance
 
     Returns:
-        Agent response if it's an AI agent's turn
+        Agent response if it's an AI agent's turn, or the queued job when
+        background is set
 
     Raises:
         HTTPException: If no automatic response is available
     """
+    if background:
+        return await _submit_job(
+            trial_service, session_id, "auto-response",
+            lambda: get_automatic_agent_response(
+                session_id, background=False, trial_service=trial_service),
+            priority)
     try:
         response_content = await trial_service.get_automatic_agent_response(
             session_id=session_id,
@@ -273,6 +382,16 @@ async def get_automatic_agent_response(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         ) from e
+    except BudgetExceededError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+        ) from e
+    except AgentUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+        ) from e
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -280,6 +399,73 @@ async def get_automatic_agent_response(
         ) from e
 
 
+def _session_job(session_id: UUID, job_id: UUID) -> Job:
+    """Look up a job of a session, raising 404 if there is none."""
+    job = get_job_queue().get(job_id)
+    if job is None or job.session_id != session_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+        )
+    return job
+
+
+@router.get("/{session_id}/jobs/{job_id}", response_model=Job)
+async def get_job(session_id: UUID, job_id: UUID) -> Job:
+    """Poll a background agent turn.
+
+    Args:
+        session_id: Trial session ID
+        job_id: Job ID
+
+    Returns:
+        The job, with its result or error once finished
+    """
+    return _session_job(session_id, job_id)
+
+
+@router.get("/{session_id}/jobs/{job_id}/stream")
+async def stream_job(session_id: UUID, job_id: UUID) -> StreamingResponse:
+    """Stream a background agent turn's status as server-sent events.
+
+    One "job" event is sent now and after every status change; the stream
+    ends once the job has finished.
+
+    Args:
+        session_id: Trial session ID
+        job_id: Job ID
+
+    Returns:
+        text/event-stream response
+    """
+    _session_job(session_id, job_id)
+
+    async def events() -> AsyncIterator[str]:
+        async for job in get_job_queue().watch(job_id):
+            if job is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"event: job\ndata: {json.dumps(job.model_dump(mode='json'))}\n\n"
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+@router.delete("/{session_id}/jobs/{job_id}", response_model=Job)
+async def cancel_job(session_id: UUID, job_id: UUID) -> Job:
+    """Cancel a queued or running background agent turn.
+
+    Args:
+        session_id: Trial session ID
+        job_id: Job ID
+
+    Returns:
+        The job after cancelling
+    """
+    _session_job(session_id, job_id)
+    return get_job_queue().cancel(job_id)
+
+
 class AddTranscriptRequest(BaseModel):
     """Request to add transcript entry."""
     speaker: str
@@ -359,6 +545,116 @@ async def complete_trial(
         ) from e
 
 
+@router.post("/{session_id}/jury/evaluate", response_model=Dict[str, EvaluationTable])
+async def evaluate_for_jury(
+    session_id: UUID,
+    request: JuryEvaluationRequest,
+    trial_service: TrialService = Depends(get_trial_service),
+) -> Dict[str, EvaluationTable]:
+    """Score all evidence and witnesses for the jury.
+
+    Args:
+        session_id: Trial session ID
+        request: Evaluation request
+        trial_service: Trial service instance
+
+    Returns:
+        Evaluation tables keyed by "evidence" and "witness"
+    """
+    try:
+        return await trial_service.evaluate_for_jury(
+            session_id=session_id,
+            mode=request.mode,
+            refresh=request.refresh,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+    except BudgetExceededError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+        ) from e
+    except AgentUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to evaluate for jury: {str(e)}",
+        ) from e
+
+
+@router.post("/{session_id}/deliberate", response_model=DeliberationResult)
+async def deliberate(
+    session_id: UUID,
+    request: DeliberateRequest,
+    trial_service: TrialService = Depends(get_trial_service),
+) -> DeliberationResult:
+    """Run parallel jury deliberation and record the verdict.
+
+    Args:
+        session_id: Trial session ID
+        request: Deliberation request
+        trial_service: Trial service instance
+
+    Returns:
+        Deliberation result with vote breakdown
+    """
+    try:
+        return await trial_service.run_jury_deliberation(
+            session_id=session_id,
+            jurors=request.jurors,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+    except BudgetExceededError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+        ) from e
+    except AgentUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to run deliberation: {str(e)}",
+        ) from e
+
+
+@router.get("/{session_id}/usage", response_model=Dict[str, Any])
+async def get_session_usage(
+    session_id: UUID,
+    trial_service: TrialService = Depends(get_trial_service),
+) -> Dict[str, Any]:
+    """Get token, cost and latency totals of a trial session.
+
+    Args:
+        session_id: Trial session ID
+        trial_service: Trial service instance
+
+    Returns:
+        Totals for the session, per role and per phase
+    """
+    try:
+        return trial_service.get_usage(session_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+
+
 @router.get("/{session_id}/transcript", response_model=List[Dict])
 async def get_trial_transcript(
     session_id: UUID,
@@ -485,6 +781,17 @@ class RuleOnObjectionRequest(BaseModel):
     reason: str
 
 
+class JudgeObjectionRequest(BaseModel):
+    """Request for the court to rule on an objection."""
+    objection_type: str
+    reason: str
+    question: Optional[str] = None  # defaults to the last transcript entry
+    examination_type: Optional[str] = None  # "direct" or "cross"
+    witness_name: Optional[str] = None
+    asked_by: Optional[str] = None
+    objection_id: Optional[str] = None
+
+
 @router.post("/{session_id}/objection/raise", response_model=TrialSession)
 async def raise_objection(
     session_id: UUID,
@@ -555,3 +862,55 @@ async def rule_on_objection(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to rule on objection: {str(e)}",
         ) from e
+
+
+@router.post("/{session_id}/objection/judge", response_model=ObjectionRuling)
+async def judge_objection(
+    session_id: UUID,
+    request: JudgeObjectionRequest,
+    trial_service: TrialService = Depends(get_trial_service),
+) -> ObjectionRuling:
+    """Have the court rule on an objection.
+
+    Clear-cut objections are ruled instantly from the question text; the
+    rest are decided by the judge agent.
+
+    Args:
+        session_id: Trial session ID
+        request: Objection to rule on
+        trial_service: Trial service instance
+
+    Returns:
+        The ruling (also added to the transcript)
+    """
+    try:
+        return await trial_service.request_objection_ruling(
+            session_id=session_id,
+            objection_type=request.objection_type,
+            reason=request.reason,
+            question=request.question,
+            examination_type=request.examination_type,
+            witness_name=request.witness_name,
+            asked_by=request.asked_by,
+            objection_id=request.objection_id,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+    except BudgetExceededError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+        ) from e
+    except AgentUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to rule on objection: {str(e)}",
+        ) from e
@@ -1,15 +1,20 @@
 """Command line interface for JurySane."""
 
 import asyncio
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional
 
 import typer
 import uvicorn
 from rich.console import Console
 from rich.table import Table
 
+from .agents.rate_limit import set_provider_concurrency
+from .analytics import load_simulation_arrays, summarize
 from .config import settings
+from .data.case_store import get_shared_cases
 from .data.sample_cases import get_sample_case
+from .services.simulation import SimulationRunner
 from .services.trial_service import TrialService
 from .models.trial import UserRole
 
@@ -39,7 +44,10 @@ def serve(
 
 
 @app.command()
-def demo() -> None:
+def demo(
+    autopilot: bool = typer.Option(
+        False, help="Play the whole trial with AI agents in every role"),
+) -> None:
     """Run a demo trial simulation."""
     console.print("[bold blue]JurySane Demo Trial[/bold blue]")
 
@@ -56,6 +64,7 @@ def demo() -> None:
         session = await trial_service.create_trial_session(
             case=case,
             user_role=UserRole.DEFENSE,
+            autopilot=autopilot,
         )
 
         console.print(f"[green]Session created:[/green] {session.id}")
@@ -79,12 +88,122 @@ def demo() -> None:
         console.print("\n[bold yellow]Case Facts:[/bold yellow]")
         console.print(case.case_facts)
 
+        if autopilot:
+            console.print("\n[bold blue]Autopilot Trial[/bold blue]")
+            async for event in trial_service.run_autopilot(session.id):
+                if event["type"] == "turn":
+                    console.print(
+                        f"\n[cyan]{event['speaker']}[/cyan] [dim]({event['latency_ms']:.0f} ms)[/dim]")
+                    console.print(event["content"])
+                elif event["type"] == "phase":
+                    console.print(
+                        f"\n[bold yellow]— {event['phase'].replace('_', ' ').title()} —[/bold yellow]")
+                elif event["type"] == "deliberation":
+                    console.print(
+                        f"\n[bold magenta]Verdict:[/bold magenta] {event['verdict']}")
+
         console.print(
             "\n[bold cyan]Demo completed! Use 'jurysane serve' to start the API server.[/bold cyan]")
 
     asyncio.run(run_demo())
 
 
+@app.command()
+def simulate(
+    case: Optional[List[str]] = typer.Option(
+        None, "--case", help="Case ID or title substring (repeatable; default: all cases)"),
+    trials: int = typer.Option(1, help="Trials to run per case"),
+    concurrency: int = typer.Option(4, help="Maximum trials running at once"),
+    provider_limit: Optional[List[str]] = typer.Option(
+        None, "--provider-limit", help="Concurrent calls per provider, e.g. gemini=8 (repeatable)"),
+    output: Path = typer.Option(Path("simulations.ndjson"), help="NDJSON output file"),
+    user_role: UserRole = typer.Option(UserRole.DEFENSE, help="Side the simulated user plays"),
+    resume: bool = typer.Option(True, help="Skip trials already in the output file"),
+) -> None:
+    """Run many autopilot trials concurrently and write results to NDJSON."""
+    all_cases = get_shared_cases()
+    if case:
+        selected = [
+            c for c in all_cases
+            if any(sel == str(c.id) or sel.lower() in c.title.lower() for sel in case)
+        ]
+    else:
+        selected = all_cases
+    if not selected:
+        console.print("[red]No cases matched.[/red]")
+        raise typer.Exit(code=1)
+
+    for limit in provider_limit or []:
+        provider, _, value = limit.partition("=")
+        if not value.isdigit():
+            console.print(f"[red]Invalid provider limit: {limit}[/red]")
+            raise typer.Exit(code=1)
+        set_provider_concurrency(provider, int(value))
+
+    console.print(
+        f"[bold blue]Simulating {trials} trial(s) for {len(selected)} case(s)[/bold blue]")
+    runner = SimulationRunner(
+        cases=selected,
+        trials_per_case=trials,
+        output_path=output,
+        concurrency=concurrency,
+        user_role=user_role,
+        resume=resume,
+    )
+    summary = asyncio.run(runner.run())
+
+    table = Table(title="Simulation Summary")
+    table.add_column("Completed", style="green")
+    table.add_column("Failed", style="red")
+    table.add_column("Skipped", style="yellow")
+    table.add_column("Duration", style="cyan")
+    table.add_column("Tokens", style="magenta")
+    table.add_column("Cost", style="magenta")
+    table.add_row(str(summary.completed), str(summary.failed),
+                  str(summary.skipped), f"{summary.duration_ms / 1000:.1f}s",
+                  f"{summary.total_tokens:,}", f"${summary.cost_usd:.4f}")
+    console.print(table)
+    console.print(f"Results written to {output}")
+
+
+@app.command()
+def report(
+    results: Path = typer.Argument(..., help="NDJSON file written by 'jurysane simulate'"),
+    as_json: bool = typer.Option(False, "--json", help="Print the report as JSON"),
+) -> None:
+    """Summarize verdicts, votes, turns, latency and tokens per case."""
+    reports = summarize(load_simulation_arrays(results))
+
+    if as_json:
+        console.print_json(data=[r.model_dump() for r in reports])
+        return
+
+    table = Table(title="Simulation Report")
+    table.add_column("Case", style="cyan")
+    table.add_column("Trials", justify="right")
+    table.add_column("Guilty (95% CI)", style="red")
+    table.add_column("Not Guilty", style="green")
+    table.add_column("Hung/Mixed", style="yellow")
+    table.add_column("Turns", justify="right")
+    table.add_column("Latency p50/p95", justify="right")
+    table.add_column("Tokens p50/p95", justify="right")
+
+    for r in reports:
+        rates = r.verdict_rates
+        low, high = r.guilty_rate_ci
+        table.add_row(
+            r.case_title,
+            f"{r.trials} ({r.errors} err)" if r.errors else str(r.trials),
+            f"{rates['Guilty']:.0%} ({low:.0%}-{high:.0%})",
+            f"{rates['Not Guilty']:.0%}",
+            f"{rates['Hung'] + rates['Mixed']:.0%}",
+            f"{r.mean_turns:.1f}",
+            f"{r.turn_latency_ms['p50']:.0f}/{r.turn_latency_ms['p95']:.0f} ms",
+            f"{r.tokens['p50']:.0f}/{r.tokens['p95']:.0f}",
+        )
+    console.print(table)
+
+
 @app.command()
 def info() -> None:
     """Show information about JurySane."""
@@ -1,7 +1,7 @@
 """Configuration management for JurySane application."""
 
 import os
-from typing import Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 try:
@@ -19,6 +19,67 @@ class DatabaseConfig(BaseModel):
     persist_directory: str = "./data/chroma"
 
 
+class RateLimitConfig(BaseModel):
+    """Limits shared by all calls to one provider or provider/model pair."""
+
+    max_concurrency: Optional[int] = None
+    requests_per_minute: Optional[float] = None
+    tokens_per_minute: Optional[float] = None
+
+
+class CircuitBreakerConfig(BaseModel):
+    """Per-provider circuit breaker thresholds."""
+
+    failure_rate_threshold: float = 0.5
+    window: int = 20  # Recent calls considered
+    min_calls: int = 5  # Calls required before the breaker can open
+    open_seconds: float = 30.0  # Cool-down before a half-open probe
+    half_open_max_calls: int = 1
+
+
+class GenerationLimit(BaseModel):
+    """Output length and stop sequences for turns matching a role, phase and/or action."""
+
+    role: Optional[str] = None
+    phase: Optional[str] = None
+    action: Optional[str] = None
+    max_tokens: Optional[int] = None
+    stop: List[str] = Field(default_factory=list)
+
+
+def _default_generation_limits() -> List[GenerationLimit]:
+    """Short rulings and procedural lines, long closings."""
+    return [
+        GenerationLimit(role="judge", max_tokens=400),
+        GenerationLimit(role="judge", action="objection_ruling", max_tokens=150),
+        GenerationLimit(role="judge", action="jury_instructions", max_tokens=1000),
+        GenerationLimit(role="witness", max_tokens=350),
+        GenerationLimit(action="opening", max_tokens=800),
+        GenerationLimit(action="examination", max_tokens=400),
+        GenerationLimit(action="closing", max_tokens=1200),
+        GenerationLimit(role="jury", action="evaluation", max_tokens=1500),
+        GenerationLimit(role="jury", action="deliberation", max_tokens=600),
+    ]
+
+
+class ModelPrice(BaseModel):
+    """Price of a model in USD per million tokens."""
+
+    input: float
+    output: float
+
+
+def _default_pricing() -> Dict[str, ModelPrice]:
+    """List prices of the models used by the default routing rules."""
+    return {
+        "openai/gpt-4o-mini": ModelPrice(input=0.15, output=0.60),
+        "openai/gpt-4o": ModelPrice(input=2.50, output=10.00),
+        "gemini/gemini-2.5-flash-lite": ModelPrice(input=0.10, output=0.40),
+        "gemini/gemini-2.5-flash": ModelPrice(input=0.30, output=2.50),
+        "gemini/gemini-2.5-pro": ModelPrice(input=1.25, output=10.00),
+    }
+
+
 class LLMConfig(BaseModel):
     """Large Language Model configuration."""
 
@@ -27,6 +88,145 @@ class LLMConfig(BaseModel):
     temperature: float = 0.7
     max_tokens: int = 2000
     timeout: int = 60
+    # Keyed by "provider" or "provider/model"; the most specific key wins
+    rate_limits: Dict[str, RateLimitConfig] = Field(default_factory=dict)
+    # Retries after a provider rate-limit (429) error before giving up
+    rate_limit_retries: int = 3
+    rate_limit_backoff: float = 2.0
+    # Retries after timeouts and transient provider errors (jittered back-off)
+    max_retries: int = 2
+    retry_backoff: float = 0.5
+    retry_backoff_max: float = 8.0
+    # Start a second attempt once the first outlives this latency percentile
+    hedge_requests: bool = False
+    hedge_percentile: float = 95.0
+    hedge_min_delay: float = 1.0
+    # Stream completions (where supported) so time to first token is measured
+    stream_responses: bool = False
+    circuit_breaker: CircuitBreakerConfig = Field(default_factory=CircuitBreakerConfig)
+    # "provider/model" entries tried, in order, after a role's own fallbacks
+    fallback_models: List[str] = Field(default_factory=list)
+    # Per (role, phase, action) overrides of max_tokens, plus stop sequences
+    generation_limits: List[GenerationLimit] = Field(default_factory=_default_generation_limits)
+    # Keyed by "provider/model"; unpriced models are counted at zero cost
+    pricing: Dict[str, ModelPrice] = Field(default_factory=_default_pricing)
+
+
+class JuryConfig(BaseModel):
+    """Jury deliberation configuration."""
+
+    size: int = 12
+    max_concurrency: int = 4
+    require_unanimous: bool = True
+    evaluation_mode: str = "batch"  # batch, parallel
+
+
+class TrialConfig(BaseModel):
+    """Trial flow configuration."""
+
+    # Pre-generate the next AI turn as soon as it is assigned
+    speculative_generation: bool = False
+    # Ask the judge for JSON {"response", "turn_management"} on providers with a JSON mode
+    structured_directives: bool = False
+    # Retrieve relevant knowledge and prior answers into witness prompts
+    witness_memory: bool = True
+    witness_memory_top_k: int = 4
+    # Repeated questions to a witness: "reuse" the earlier answer, "flag" them, or "off"
+    asked_and_answered: str = "reuse"
+    asked_and_answered_threshold: float = 0.7
+    # Rule clear-cut objections from the question text without the judge model
+    objection_fast_path: bool = True
+    objection_fast_path_confidence: float = 0.8
+    # Judge rulings shared across sessions of a case (LRU + TTL)
+    ruling_cache_size: int = 1024
+    ruling_cache_ttl: float = 3600.0
+
+
+class RoutingRule(BaseModel):
+    """Models to use for turns matching a role, phase and/or action."""
+
+    role: Optional[str] = None
+    phase: Optional[str] = None
+    action: Optional[str] = None
+    models: List[str]  # "provider/model", preferred first
+
+
+class RoutingConfig(BaseModel):
+    """Model routing per (role, phase, action).
+
+    With no rules (the default) every turn uses the role's configured model.
+    Per-role environment overrides ({ROLE}_PROVIDER/{ROLE}_MODEL) still take
+    precedence over these rules. See "Model Routing" in the README for a
+    tiered example.
+    """
+
+    rules: List[RoutingRule] = Field(default_factory=list)
+    # Re-rank candidates by rolling latency and error rate
+    adaptive: bool = False
+    error_penalty: float = 4.0
+
+
+class BudgetConfig(BaseModel):
+    """LLM spending limits; None means unlimited."""
+
+    session_tokens: Optional[int] = None
+    session_cost_usd: Optional[float] = None
+    tenant_tokens_per_day: Optional[int] = None
+    tenant_cost_usd_per_day: Optional[float] = None
+    # Past this fraction of a budget, turns run in degraded mode
+    degrade_at: float = 0.8
+    # "provider/model" used when degraded; None picks the cheapest priced candidate
+    degraded_model: Optional[str] = None
+    degraded_max_tokens_factor: float = 0.5
+    degraded_context_entries: int = 2
+    # Sessions whose usage is kept in memory; the least recently active go first
+    tracked_sessions: int = 10000
+
+
+class SchedulerConfig(BaseModel):
+    """Fair scheduling of agent work across sessions and tenants."""
+
+    # Agent executions run at once; None only orders work queued at provider limits
+    max_concurrency: Optional[int] = None
+    # Share of capacity per tenant ID (default 1.0), split among its sessions
+    tenant_weights: Dict[str, float] = Field(default_factory=dict)
+    # Seconds work of a priority class may wait before it is dropped
+    deadlines: Dict[str, float] = Field(default_factory=lambda: {"speculative": 30.0})
+    # Work this close to its deadline goes first within its priority class
+    deadline_urgency: float = 2.0
+
+
+class EmbeddingConfig(BaseModel):
+    """Local text embedding configuration."""
+
+    backend: str = "auto"  # auto, sentence-transformers or hashing
+    model_name: str = "sentence-transformers/all-MiniLM-L6-v2"
+    hashing_dim: int = 512
+    batch_size: int = 64
+    cache_dir: Optional[str] = "./data/embeddings"  # None keeps vectors in memory
+    quantization: str = "float32"  # float32, float16 or int8
+
+
+class JobConfig(BaseModel):
+    """Background agent-turn job configuration."""
+
+    workers: int = 4
+    # Queued jobs accepted before new submissions are refused
+    max_queued: int = 1000
+    # How long finished jobs stay available for polling
+    retention_seconds: float = 600.0
+
+
+class TracingConfig(BaseModel):
+    """Request tracing configuration."""
+
+    enabled: bool = False
+    # Fraction of new traces recorded; an incoming sampled traceparent is always kept
+    sample_rate: float = 1.0
+    # Also export unsampled traces whose root span takes at least this long
+    slow_trace_ms: Optional[float] = None
+    exporter: str = "stdout"  # stdout or file
+    file_path: str = "./data/traces.jsonl"
 
 
 class APIConfig(BaseModel):
@@ -60,6 +260,14 @@ class Settings(BaseSettings):
     # Configurations
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
     llm: LLMConfig = Field(default_factory=LLMConfig)
+    jury: JuryConfig = Field(default_factory=JuryConfig)
+    trial: TrialConfig = Field(default_factory=TrialConfig)
+    routing: RoutingConfig = Field(default_factory=RoutingConfig)
+    embeddings: EmbeddingConfig = Field(default_factory=EmbeddingConfig)
+    budgets: BudgetConfig = Field(default_factory=BudgetConfig)
+    scheduler: SchedulerConfig = Field(default_factory=SchedulerConfig)
+    jobs: JobConfig = Field(default_factory=JobConfig)
+    tracing: TracingConfig = Field(default_factory=TracingConfig)
     api: APIConfig = Field(default_factory=APIConfig)
 
     # Security
@@ -1,10 +1,40 @@
 """Main FastAPI application."""
 
-from fastapi import FastAPI
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
+from .agents.circuit_breaker import breaker_status
+from .agents.rate_limit import limiter_stats
+from .agents.scheduler import get_scheduler, queue_depths
 from .api.routes import trial, cases
 from .config import settings
+from .metrics import HTTP_REQUEST_DURATION, Gauge, registry
+from .services.job_queue import get_job_queue
+from .tracing import span
+
+
+class TracedJSONResponse(JSONResponse):
+    """JSON response whose rendering is traced as the serialization step."""
+
+    def render(self, content: Any) -> bytes:
+        with span("http.serialize") as current:
+            body = super().render(content)
+            if current is not None:
+                current.set_attribute("http.response_bytes", len(body))
+            return body
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Stop background job workers on shutdown."""
+    yield
+    await get_job_queue().shutdown()
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -13,6 +43,8 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=TracedJSONResponse,
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -29,6 +61,52 @@ app.include_router(trial.router, prefix="/api/v1")
 app.include_router(cases.router, prefix="/api/v1")
 
 
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next: Any) -> Response:
+    """Observe request latency per route template and trace the request."""
+    started = time.perf_counter()
+    status = 500
+    with span(f"{request.method} {request.url.path}",
+              traceparent=request.headers.get("traceparent")) as current:
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            if current is not None:
+                response.headers["traceparent"] = current.traceparent
+            return response
+        finally:
+            route = getattr(request.scope.get("route"), "path", "unmatched")
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started, request.method, route, str(status))
+            if current is not None:
+                current.name = f"{request.method} {route}"
+                current.attributes.update(
+                    {"http.method": request.method, "http.route": route, "http.status_code": status})
+
+
+def _session_counts() -> Dict[tuple, float]:
+    """Sessions held in memory, by state."""
+    service = trial.get_trial_service()
+    return {
+        ("active",): len(service.active_sessions),
+        ("autopilot",): len(service.autopilot_sessions),
+        ("speculating",): len(service.speculative_turns),
+    }
+
+
+registry.register(Gauge(
+    "jurysane_sessions", "Trial sessions in memory by state", ("state",), callback=_session_counts))
+registry.register(Gauge(
+    "jurysane_scheduler_queue_depth", "Agent work waiting for capacity by queue and priority class",
+    ("queue", "priority"), callback=queue_depths))
+registry.register(Gauge(
+    "jurysane_scheduler_in_flight", "Agent executions running by priority class", ("priority",),
+    callback=lambda: {(cls,): count for cls, count in get_scheduler().in_flight.items()}))
+registry.register(Gauge(
+    "jurysane_jobs", "Background agent-turn jobs by status and priority", ("status", "priority"),
+    callback=lambda: dict(get_job_queue().stats())))
+
+
 @app.get("/")
 async def root() -> dict[str, str]:
     """Root endpoint."""
@@ -45,6 +123,23 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy"}
 
 
+@app.get("/health/providers")
+async def provider_health() -> Dict[str, Any]:
+    """LLM provider health: circuit breaker state and limiter queues."""
+    breakers = breaker_status()
+    return {
+        "status": "degraded" if any(b["state"] != "closed" for b in breakers.values()) else "healthy",
+        "providers": breakers,
+        "limiters": limiter_stats(),
+    }
+
+
+@app.get("/metrics")
+async def metrics() -> Response:
+    """Metrics in Prometheus text exposition format."""
+    return Response(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,234 @@
+"""In-process metrics exposed in Prometheus text format.
+
+Counters, gauges and histograms keep their series in plain dicts keyed by
+label values. Updates run on the event loop thread and are single dict
+operations, so no locks are taken on the hot path. ``render()`` produces
+the text served at ``/metrics``.
+"""
+
+import math
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+LabelValues = Tuple[str, ...]
+
+# Seconds; spans fast cache hits through slow LLM generations
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    """Base class for a named metric with fixed label names."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        """Initialize the metric.
+
+        Args:
+            name: Metric name
+            help_text: HELP line
+            labelnames: Label names, in the order values are passed
+        """
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+
+    def samples(self) -> Iterable[str]:
+        """Sample lines for the exposition format."""
+        return []
+
+    def render(self) -> List[str]:
+        """HELP, TYPE and sample lines."""
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}", *self.samples()]
+
+
+class Counter(Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Increase the series for the given label values."""
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Current value of a series."""
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Gauge(Metric):
+    """Value that goes up and down, optionally read from a callback at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self.callback = callback
+
+    def set(self, value: float, *labels: str) -> None:
+        """Set the series for the given label values."""
+        self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Increase the series for the given label values."""
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        """Decrease the series for the given label values."""
+        self.inc(*labels, amount=-amount)
+
+    def samples(self) -> Iterable[str]:
+        values = dict(self._values)
+        if self.callback is not None:
+            values.update(self.callback())
+        for labels, value in values.items():
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Histogram(Metric):
+    """Distribution of observations in fixed buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per series: per-bucket counts (last slot is +Inf), sum, count
+        self._series: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record an observation for the given label values."""
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0.0] * (len(self.buckets) + 3)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def count(self, *labels: str) -> int:
+        """Number of observations in a series."""
+        series = self._series.get(labels)
+        return int(series[-1]) if series else 0
+
+    def samples(self) -> Iterable[str]:
+        for labels, series in self._series.items():
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, math.inf), series):
+                cumulative += count
+                le = 'le="' + _format_value(bound) + '"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {_format_value(cumulative)}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(series[-2])}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, labels)} {_format_value(series[-1])}"
+
+
+MetricT = TypeVar("MetricT", bound=Metric)
+
+
+class MetricsRegistry:
+    """Named metrics rendered together."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: MetricT) -> MetricT:
+        """Add a metric, or return the one already registered under its name."""
+        return self._metrics.setdefault(metric.name, metric)  # type: ignore[return-value]
+
+    def render(self) -> str:
+        """All metrics in Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = registry.register(Histogram(
+    "jurysane_http_request_duration_seconds", "HTTP request latency by route",
+    ("method", "route", "status")))
+LLM_REQUEST_DURATION = registry.register(Histogram(
+    "jurysane_llm_request_duration_seconds", "Total LLM generation time by agent role",
+    ("role",)))
+LLM_TIME_TO_FIRST_TOKEN = registry.register(Histogram(
+    "jurysane_llm_time_to_first_token_seconds", "Time to the first streamed token by agent role",
+    ("role",)))
+LLM_ATTEMPTS = registry.register(Counter(
+    "jurysane_llm_attempts_total", "LLM call attempts by provider/model and outcome",
+    ("provider", "outcome")))
+LLM_SLOT_WAIT = registry.register(Histogram(
+    "jurysane_llm_slot_wait_seconds", "Time spent waiting for a provider rate-limit slot",
+    ("provider",)))
+SCHEDULER_WAIT = registry.register(Histogram(
+    "jurysane_scheduler_wait_seconds", "Time agent work waited for an execution slot by priority class",
+    ("priority",)))
+SCHEDULER_DEADLINE_MISSES = registry.register(Counter(
+    "jurysane_scheduler_deadline_misses_total", "Agent work dropped after waiting past its deadline",
+    ("queue", "priority")))
+CACHE_REQUESTS = registry.register(Counter(
+    "jurysane_cache_requests_total", "Cache lookups by cache and result (hit or miss)",
+    ("cache", "result")))
+
+
+def _cache_hit_ratios() -> Dict[LabelValues, float]:
+    """Hit ratio per cache from the lookup counters."""
+    totals: Dict[str, List[float]] = {}
+    for (cache, result), value in CACHE_REQUESTS._values.items():
+        totals.setdefault(cache, [0.0, 0.0])[result == "hit"] += value
+    return {(cache,): hits / (misses + hits) for cache, (misses, hits) in totals.items() if misses + hits}
+
+
+CACHE_HIT_RATIO = registry.register(Gauge(
+    "jurysane_cache_hit_ratio", "Fraction of cache lookups that hit", ("cache",),
+    callback=_cache_hit_ratios))
+
+
+def record_cache(cache: str, hit: bool, count: int = 1) -> None:
+    """Count cache lookups.
+
+    Args:
+        cache: Cache name
+        hit: Whether the lookups hit
+        count: Number of lookups
+    """
+    if count:
+        CACHE_REQUESTS.inc(cache, "hit" if hit else "miss", amount=count)
@@ -159,3 +159,5 @@ class TrialSession(BaseModel):
         default=None, description="Who spoke last")
     awaiting_response: bool = Field(
         default=False, description="Whether system is waiting for a response")
+    tenant_id: Optional[str] = Field(
+        default=None, description="Tenant whose budget the session draws on")
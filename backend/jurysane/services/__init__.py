@@ -1,5 +1,7 @@
 """Services for JurySane application."""
 
+from .case_briefing import CaseBriefingService
+from .simulation import SimulationRunner
 from .trial_service import TrialService
 
-__all__ = ["TrialService"]
+__all__ = ["CaseBriefingService", "SimulationRunner", "TrialService"]
@@ -0,0 +1,136 @@
+"""Detection of repeated questions to a witness.
+
+Every question put to a witness is reduced to a set of word shingles after
+dropping filler words, and compared with the earlier questions the same side
+asked that witness in the session by Jaccard similarity. A near-duplicate can
+be answered from the earlier answer without an LLM call, or just flagged as
+grounds for an asked-and-answered objection.
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from ..models.trial import ObjectionType
+from .embeddings import tokenize
+
+# Words that rephrasings add or drop without changing the question
+FILLER_WORDS = frozenset({
+    "a", "an", "the", "so", "and", "now", "again", "just", "please", "once",
+    "more", "can", "could", "would", "will", "you", "your", "me", "us", "tell",
+    "court", "jury", "let", "ask", "asked", "i", "did", "do", "does", "is",
+    "was", "were", "to", "of", "that", "this", "isn't", "wasn't", "didn't",
+    "right", "correct", "ms", "mr", "mrs", "dr", "sir", "ma'am", "okay", "well",
+})
+
+
+def question_shingles(question: str, size: int = 2) -> FrozenSet[str]:
+    """Normalize a question into a set of word shingles.
+
+    Args:
+        question: Question text
+        size: Words per shingle; questions shorter than this use single words
+
+    Returns:
+        Shingle set (empty if the question has no content words)
+    """
+    words = [word for word in tokenize(question) if word not in FILLER_WORDS]
+    if len(words) < size:
+        return frozenset(words)
+    return frozenset(" ".join(words[i:i + size]) for i in range(len(words) - size + 1))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two sets (0 when either is empty)."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class PriorQuestion(BaseModel):
+    """A question a witness has already answered."""
+
+    question: str = Field(description="Question as asked")
+    answer: str = Field(description="Witness's answer")
+    shingles: FrozenSet[str] = Field(description="Normalized question shingles")
+
+
+class RepeatedQuestion(BaseModel):
+    """A question found to repeat an earlier one."""
+
+    question: str = Field(description="Earlier question")
+    answer: str = Field(description="Answer the witness gave then")
+    similarity: float = Field(description="Jaccard similarity of the questions")
+    objection_type: ObjectionType = Field(default=ObjectionType.ASKED_AND_ANSWERED)
+
+
+class AskedAndAnsweredDetector:
+    """Per-session record of questions answered by each witness."""
+
+    def __init__(self, threshold: float = 0.7, max_questions: int = 200):
+        """Initialize the detector.
+
+        Args:
+            threshold: Similarity at or above which a question is a repeat
+            max_questions: Questions kept per witness and asking side
+        """
+        self.threshold = threshold
+        self.max_questions = max_questions
+        self._questions: Dict[Tuple[UUID, str, Optional[str]], List[PriorQuestion]] = {}
+
+    def find(
+        self,
+        session_id: UUID,
+        witness_name: str,
+        question: str,
+        asked_by: Optional[str] = None,
+    ) -> Optional[RepeatedQuestion]:
+        """Find an earlier question that the given one repeats.
+
+        Args:
+            session_id: Trial session
+            witness_name: Witness being asked
+            question: New question
+            asked_by: Side asking (only its own earlier questions count)
+
+        Returns:
+            Most similar earlier question at or above the threshold, or None
+        """
+        shingles = question_shingles(question)
+        best: Optional[RepeatedQuestion] = None
+        for prior in self._questions.get((session_id, witness_name, asked_by), []):
+            similarity = jaccard(shingles, prior.shingles)
+            if similarity >= self.threshold and (best is None or similarity > best.similarity):
+                best = RepeatedQuestion(
+                    question=prior.question, answer=prior.answer, similarity=similarity)
+        return best
+
+    def record(
+        self,
+        session_id: UUID,
+        witness_name: str,
+        question: str,
+        answer: str,
+        asked_by: Optional[str] = None,
+    ) -> None:
+        """Remember an answered question.
+
+        Args:
+            session_id: Trial session
+            witness_name: Witness who answered
+            question: Question asked
+            answer: Witness's answer
+            asked_by: Side that asked
+        """
+        shingles = question_shingles(question)
+        if not shingles:
+            return
+        questions = self._questions.setdefault((session_id, witness_name, asked_by), [])
+        questions.append(PriorQuestion(question=question, answer=answer, shingles=shingles))
+        del questions[:-self.max_questions]
+
+    def drop_session(self, session_id: UUID) -> None:
+        """Forget every question of a session."""
+        for key in [key for key in self._questions if key[0] == session_id]:
+            del self._questions[key]
@@ -0,0 +1,150 @@
+"""Per-session and per-tenant LLM budgets.
+
+Spending is read from the usage tracker. Once a session or its tenant has
+used ``degrade_at`` of any configured budget, turns run degraded: the agent
+switches to a cheaper model, sees less of the transcript and gets a smaller
+output limit. Once a budget is used up, further turns are refused with
+``BudgetExceededError``.
+"""
+
+from typing import List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from ..agents.base import BaseAgent
+from ..agents.usage import UsageCounter, usage_tracker
+from ..config import BudgetConfig, settings
+from ..models.trial import TrialSession
+from .model_router import parse_model
+
+OK = "ok"
+DEGRADED = "degraded"
+EXHAUSTED = "exhausted"
+
+
+class BudgetExceededError(RuntimeError):
+    """A session or tenant has used up its LLM budget."""
+
+    def __init__(self, scope: str, used: float, limit: float, unit: str):
+        """Initialize the error.
+
+        Args:
+            scope: What ran out, e.g. "session" or "tenant acme"
+            used: Amount used
+            limit: Configured limit
+            unit: "tokens" or "USD"
+        """
+        super().__init__(f"The {scope} budget is exhausted ({used:g} of {limit:g} {unit})")
+        self.scope = scope
+        self.used = used
+        self.limit = limit
+        self.unit = unit
+
+
+class BudgetStatus(BaseModel):
+    """Budget standing of a session."""
+
+    level: str = Field(description="ok, degraded or exhausted")
+    fraction: float = Field(description="Largest fraction used of any budget")
+    scope: Optional[str] = Field(default=None, description="Budget closest to its limit")
+    used: float = Field(default=0.0, description="Amount used of that budget")
+    limit: Optional[float] = Field(default=None, description="That budget's limit")
+    unit: Optional[str] = Field(default=None, description="tokens or USD")
+
+
+class BudgetManager:
+    """Checks sessions against their budgets and degrades agents accordingly."""
+
+    def __init__(self, config: Optional[BudgetConfig] = None):
+        """Initialize the manager.
+
+        Args:
+            config: Budget limits; defaults to settings.budgets
+        """
+        self.config = config or settings.budgets
+
+    def _limits(self, session: TrialSession) -> List[Tuple[str, UsageCounter, Optional[float], str]]:
+        """(scope, counter, limit, unit) for every budget that applies."""
+        session_usage = usage_tracker.session_totals(session.id)
+        limits = [
+            ("session", session_usage, self.config.session_tokens, "tokens"),
+            ("session", session_usage, self.config.session_cost_usd, "USD"),
+        ]
+        if session.tenant_id:
+            tenant_usage = usage_tracker.tenant_totals(session.tenant_id)
+            scope = f"tenant {session.tenant_id} daily"
+            limits += [
+                (scope, tenant_usage, self.config.tenant_tokens_per_day, "tokens"),
+                (scope, tenant_usage, self.config.tenant_cost_usd_per_day, "USD"),
+            ]
+        return limits
+
+    def status(self, session: TrialSession) -> BudgetStatus:
+        """Work out how much of its budgets a session has used.
+
+        Args:
+            session: Trial session
+
+        Returns:
+            Standing against the budget closest to its limit
+        """
+        status = BudgetStatus(level=OK, fraction=0.0)
+        for scope, usage, limit, unit in self._limits(session):
+            if limit is None:
+                continue
+            used = usage.total_tokens if unit == "tokens" else usage.cost_usd
+            fraction = used / limit if limit > 0 else 1.0
+            if fraction >= status.fraction:
+                status = BudgetStatus(
+                    level=OK, fraction=fraction, scope=scope, used=used, limit=limit, unit=unit)
+        if status.fraction >= 1.0:
+            status.level = EXHAUSTED
+        elif status.fraction >= self.config.degrade_at:
+            status.level = DEGRADED
+        return status
+
+    def enforce(self, session: TrialSession, agent: Optional[BaseAgent] = None) -> BudgetStatus:
+        """Refuse exhausted sessions and degrade the agent of nearly exhausted ones.
+
+        Args:
+            session: Trial session about to make LLM calls
+            agent: Agent that will make them
+
+        Returns:
+            The session's budget status
+
+        Raises:
+            BudgetExceededError: If any budget is used up
+        """
+        status = self.status(session)
+        if status.level == EXHAUSTED:
+            raise BudgetExceededError(status.scope or "session", status.used, status.limit or 0, status.unit or "")
+        if status.level == DEGRADED and agent is not None:
+            self.degrade(agent)
+        return status
+
+    def degrade(self, agent: BaseAgent) -> None:
+        """Make an agent cheaper: cheaper model, shorter context and output.
+
+        Args:
+            agent: Agent to degrade
+        """
+        candidate = self._cheaper_model(agent)
+        if candidate is not None:
+            agent.switch_model(*candidate)
+        max_tokens = agent.max_output_tokens or settings.llm.max_tokens
+        agent.max_output_tokens = max(1, int(max_tokens * self.config.degraded_max_tokens_factor))
+        agent.context_entries = min(agent.context_entries, self.config.degraded_context_entries)
+
+    def _cheaper_model(self, agent: BaseAgent) -> Optional[Tuple[str, str]]:
+        """The configured degraded model, or the agent's cheapest priced candidate."""
+        if self.config.degraded_model:
+            return parse_model(self.config.degraded_model)
+
+        def price(candidate: Tuple[str, str]) -> float:
+            entry = settings.llm.pricing.get(f"{candidate[0]}/{candidate[1]}")
+            return entry.input + entry.output if entry else float("inf")
+
+        current = (agent.provider_name, agent.model_name)
+        cheapest = min([current, *agent.fallback_models], key=price)
+        return cheapest if price(cheapest) < price(current) else None
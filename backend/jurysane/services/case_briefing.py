@@ -0,0 +1,252 @@
+"""Precomputed, compact case briefings shared by all agents of a role."""
+
+import hashlib
+import re
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from ..models.trial import Case, CaseRole, Witness
+from ..utils import get_enum_value
+
+# Async callable used for the optional offline LLM pass: (text, max_chars) -> summary
+Summarizer = Callable[[str, int], Awaitable[str]]
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class CaseBriefing(BaseModel):
+    """A compact, role-specific digest of a case."""
+
+    case_id: UUID = Field(description="ID of the case this briefing covers")
+    case_version: str = Field(
+        description="Content hash of the case the briefing was built from")
+    role: CaseRole = Field(description="Role the briefing is written for")
+    witness_name: Optional[str] = Field(
+        default=None, description="Witness the briefing is for (witness role only)")
+    text: str = Field(description="Briefing text injected into agent context")
+    persona: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Compacted witness background/knowledge/bias (witness role only)")
+
+
+def compute_case_version(case: Case) -> str:
+    """Compute a stable content hash identifying a version of a case.
+
+    Args:
+        case: Case to fingerprint
+
+    Returns:
+        Short hex digest that changes whenever the case content changes
+    """
+    payload = case.model_dump_json(exclude={"created_at", "updated_at"})
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def compact_text(text: str, max_chars: int) -> str:
+    """Deterministically shorten text to whole sentences within a budget.
+
+    Args:
+        text: Text to shorten
+        max_chars: Maximum number of characters to keep
+
+    Returns:
+        Whitespace-normalized text of at most ``max_chars`` characters
+    """
+    text = _WHITESPACE.sub(" ", text or "").strip()
+    if len(text) <= max_chars:
+        return text
+
+    kept: List[str] = []
+    length = 0
+    for sentence in _SENTENCE_SPLIT.split(text):
+        extra = len(sentence) + (1 if kept else 0)
+        if length + extra > max_chars:
+            break
+        kept.append(sentence)
+        length += extra
+
+    if kept:
+        return " ".join(kept)
+
+    # First sentence alone is too long - cut at a word boundary
+    cut = text[:max_chars - 1].rsplit(" ", 1)[0]
+    return f"{cut}…"
+
+
+class CaseBriefingService:
+    """Builds and caches per-case, per-role briefings.
+
+    Briefings are keyed by case ID, role and (for witnesses) witness name, and
+    are rebuilt only when the case content hash changes.
+    """
+
+    def __init__(self, max_facts_chars: int = 700, max_item_chars: int = 160):
+        """Initialize the briefing service.
+
+        Args:
+            max_facts_chars: Character budget for the case facts digest
+            max_item_chars: Character budget for each evidence/witness line
+        """
+        self.max_facts_chars = max_facts_chars
+        self.max_item_chars = max_item_chars
+        self._cache: Dict[Tuple[UUID, str, Optional[str]], CaseBriefing] = {}
+        # Summaries produced by the optional offline LLM pass, keyed by version
+        self._summaries: Dict[Tuple[UUID, str], Dict[str, str]] = {}
+
+    def get_briefing(
+        self,
+        case: Case,
+        role: Union[CaseRole, str],
+        witness_name: Optional[str] = None,
+    ) -> CaseBriefing:
+        """Get the briefing for a role, building it on first use.
+
+        Args:
+            case: Case being tried
+            role: Role the briefing is for
+            witness_name: Witness name (required for the witness role)
+
+        Returns:
+            Cached or freshly built briefing
+
+        Raises:
+            ValueError: If a witness briefing is requested for an unknown witness
+        """
+        role_value = get_enum_value(role)
+        key = (case.id, role_value,
+               witness_name if role_value == CaseRole.WITNESS.value else None)
+        version = compute_case_version(case)
+
+        cached = self._cache.get(key)
+        if cached and cached.case_version == version:
+            return cached
+
+        briefing = self._build_briefing(case, CaseRole(role_value), version, key[2])
+        self._cache[key] = briefing
+        return briefing
+
+    async def precompute(
+        self,
+        case: Case,
+        summarizer: Optional[Summarizer] = None,
+    ) -> List[CaseBriefing]:
+        """Build briefings for every role of a case ahead of time.
+
+        Args:
+            case: Case to precompute briefings for
+            summarizer: Optional async LLM summarizer used instead of the
+                deterministic sentence-budget compaction
+
+        Returns:
+            Briefings for all roles and witnesses of the case
+        """
+        version = compute_case_version(case)
+        if summarizer is not None:
+            summaries = {
+                "facts": await summarizer(case.case_facts, self.max_facts_chars),
+            }
+            for witness in case.witnesses:
+                summaries[f"background:{witness.name}"] = await summarizer(
+                    witness.background, self.max_item_chars)
+                summaries[f"knowledge:{witness.name}"] = await summarizer(
+                    witness.knowledge, self.max_facts_chars)
+            self._summaries[(case.id, version)] = summaries
+
+        self.invalidate(case.id)
+        briefings = [
+            self.get_briefing(case, role)
+            for role in (CaseRole.JUDGE, CaseRole.PROSECUTOR, CaseRole.DEFENSE, CaseRole.JURY)
+        ]
+        briefings.extend(
+            self.get_briefing(case, CaseRole.WITNESS, witness.name)
+            for witness in case.witnesses
+        )
+        return briefings
+
+    def invalidate(self, case_id: UUID) -> None:
+        """Drop all cached briefings for a case.
+
+        Args:
+            case_id: Case whose briefings should be rebuilt on next use
+        """
+        for key in [k for k in self._cache if k[0] == case_id]:
+            del self._cache[key]
+
+    def _summary(self, case: Case, version: str, key: str, text: str, max_chars: int) -> str:
+        """Return the offline summary for a field if present, else compact it."""
+        summaries = self._summaries.get((case.id, version), {})
+        return summaries.get(key) or compact_text(text, max_chars)
+
+    def _build_briefing(
+        self,
+        case: Case,
+        role: CaseRole,
+        version: str,
+        witness_name: Optional[str],
+    ) -> CaseBriefing:
+        """Build a briefing for one role."""
+        header = [
+            f"Case: {case.title}",
+            f"Charges: {', '.join(case.charges)}",
+        ]
+
+        if role == CaseRole.WITNESS:
+            witness = next(
+                (w for w in case.witnesses if w.name == witness_name), None)
+            if witness is None:
+                raise ValueError(f"Witness {witness_name} not found")
+            return CaseBriefing(
+                case_id=case.id,
+                case_version=version,
+                role=role,
+                witness_name=witness_name,
+                text="\n".join(header),
+                persona=self._witness_persona(case, version, witness),
+            )
+
+        parts = header + [
+            "Facts: " + self._summary(
+                case, version, "facts", case.case_facts, self.max_facts_chars),
+        ]
+
+        if role == CaseRole.PROSECUTOR:
+            parts.append(f"Your theory: {compact_text(case.prosecution_theory, self.max_facts_chars)}")
+        elif role == CaseRole.DEFENSE:
+            parts.append(f"Your theory: {compact_text(case.defense_theory, self.max_facts_chars)}")
+        elif role == CaseRole.JUDGE:
+            parts.append(f"Prosecution theory: {compact_text(case.prosecution_theory, self.max_item_chars)}")
+            parts.append(f"Defense theory: {compact_text(case.defense_theory, self.max_item_chars)}")
+
+        if case.evidence:
+            parts.append("Evidence:")
+            for evidence in case.evidence:
+                status = "admitted" if evidence.is_admitted else "not admitted"
+                line = f"{evidence.title} ({get_enum_value(evidence.submitted_by)}, {status}): {evidence.description}"
+                parts.append(f"- {compact_text(line, self.max_item_chars)}")
+
+        if case.witnesses and role != CaseRole.JURY:
+            parts.append("Witnesses:")
+            for witness in case.witnesses:
+                parts.append(
+                    f"- {witness.name} (called by {get_enum_value(witness.called_by)})")
+
+        return CaseBriefing(
+            case_id=case.id,
+            case_version=version,
+            role=role,
+            text="\n".join(parts),
+        )
+
+    def _witness_persona(self, case: Case, version: str, witness: Witness) -> Dict[str, str]:
+        """Compact a witness's background and knowledge for their system prompt."""
+        return {
+            "name": witness.name,
+            "background": self._summary(
+                case, version, f"background:{witness.name}", witness.background, self.max_item_chars),
+            "knowledge": self._summary(
+                case, version, f"knowledge:{witness.name}", witness.knowledge, self.max_facts_chars),
+            "bias": witness.bias or "",
+        }
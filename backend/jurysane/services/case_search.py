@@ -0,0 +1,151 @@
+"""Semantic search over the case catalog.
+
+The catalog is embedded once into a contiguous, normalized matrix, so a query
+costs one matmul plus an ``argpartition`` top-k. A token inverted index gives
+a vectorized lexical score that can be blended in, and query embeddings are
+kept in a small LRU so repeated searches skip the encoder.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from ..data.case_store import get_shared_cases
+from ..metrics import record_cache
+from ..models.trial import Case
+from .embeddings import EmbeddingService, get_embedding_service, tokenize
+
+
+class CaseSearchHit(BaseModel):
+    """A case matched by semantic search."""
+
+    case: Case = Field(description="Matched case")
+    score: float = Field(description="Blended relevance score")
+    semantic_score: float = Field(description="Cosine similarity to the query")
+    lexical_score: float = Field(description="Fraction of query words found in the case")
+
+
+def case_search_text(case: Case) -> str:
+    """Text embedded for a case."""
+    return f"{case.title}. {' '.join(case.charges)}. {case.description} {case.case_facts}"
+
+
+class CaseSearchIndex:
+    """Embedding matrix and inverted index over a list of cases."""
+
+    def __init__(
+        self,
+        cases: List[Case],
+        embeddings: Optional[EmbeddingService] = None,
+        query_cache_size: int = 1024,
+    ):
+        """Embed the cases and build the lexical index.
+
+        Args:
+            cases: Cases to index
+            embeddings: Embedding service; defaults to the shared one
+            query_cache_size: Query embeddings kept in the LRU
+        """
+        self.cases = cases
+        self.embeddings = embeddings or get_embedding_service()
+        texts = [case_search_text(case) for case in cases]
+        self.matrix = self.embeddings.matrix(texts)
+
+        postings: Dict[str, List[int]] = {}
+        for row, text in enumerate(texts):
+            for token in set(tokenize(text)):
+                postings.setdefault(token, []).append(row)
+        self.postings = {token: np.asarray(rows, dtype=np.int32) for token, rows in postings.items()}
+
+        self.query_cache_size = query_cache_size
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.cases)
+
+    def embed_query(self, query: str) -> np.ndarray:
+        """Embed a query, using the LRU cache.
+
+        Args:
+            query: Search text
+
+        Returns:
+            Normalized query vector
+        """
+        key = " ".join(query.lower().split())
+        vector = self._query_cache.get(key)
+        record_cache("case_search_query", vector is not None)
+        if vector is not None:
+            self._query_cache.move_to_end(key)
+            return vector
+        vector = self.embeddings.encode([key])[0]
+        self._query_cache[key] = vector
+        if len(self._query_cache) > self.query_cache_size:
+            self._query_cache.popitem(last=False)
+        return vector
+
+    def lexical_scores(self, query: str) -> np.ndarray:
+        """Fraction of distinct query words present in each case.
+
+        Args:
+            query: Search text
+
+        Returns:
+            Scores in [0, 1], one per case
+        """
+        tokens = set(tokenize(query))
+        scores = np.zeros(len(self.cases), dtype=np.float32)
+        if not tokens:
+            return scores
+        rows = [self.postings[token] for token in tokens if token in self.postings]
+        if rows:
+            scores += np.bincount(np.concatenate(rows), minlength=len(self.cases)).astype(np.float32)
+        return scores / len(tokens)
+
+    def search(self, query: str, limit: int = 10, lexical_weight: float = 0.3) -> List[CaseSearchHit]:
+        """Find the cases most relevant to a query.
+
+        Args:
+            query: Search text
+            limit: Maximum results
+            lexical_weight: Share of the score from word overlap (0 = purely semantic)
+
+        Returns:
+            Hits, best first
+        """
+        if not self.cases or limit <= 0 or not query.strip():
+            return []
+        semantic = self.matrix.similarity(self.embed_query(query))
+        if lexical_weight > 0:
+            lexical = self.lexical_scores(query)
+            scores = (1.0 - lexical_weight) * semantic + lexical_weight * lexical
+        else:
+            lexical = None
+            scores = semantic
+
+        limit = min(limit, len(scores))
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top])]
+        return [
+            CaseSearchHit(
+                case=self.cases[i],
+                score=float(scores[i]),
+                semantic_score=float(semantic[i]),
+                lexical_score=float(lexical[i]) if lexical is not None else 0.0,
+            )
+            for i in top if scores[i] > 0
+        ]
+
+
+_index: Optional[CaseSearchIndex] = None
+
+
+def get_case_search_index() -> CaseSearchIndex:
+    """Get the search index for the shared case catalog, rebuilding it if the catalog changed."""
+    global _index
+    cases = get_shared_cases()
+    if _index is None or _index.cases is not cases:
+        _index = CaseSearchIndex(cases)
+    return _index
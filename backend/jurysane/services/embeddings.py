@@ -0,0 +1,322 @@
+"""Local text embeddings with an on-disk cache.
+
+Texts are encoded in batches by a local sentence-transformers model when it
+is installed, or by a deterministic hashing vectorizer otherwise. Every
+vector is L2-normalized, so cosine similarity against a matrix of stored
+vectors is a single matmul. Vectors are cached by a hash of (encoder, text)
+in a memory-mapped float32 file, and matrices can be quantized to float16 or
+int8 to shrink large indexes.
+"""
+
+import hashlib
+import re
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None  # type: ignore
+
+from ..config import EmbeddingConfig, settings
+from ..metrics import record_cache
+
+_TOKEN = re.compile(r"[a-z0-9']+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case word tokens of a text."""
+    return _TOKEN.findall(text.lower())
+
+
+class HashingEncoder:
+    """Signed feature hashing of words and word bigrams; no model needed."""
+
+    def __init__(self, dim: int = 512):
+        """Initialize the encoder.
+
+        Args:
+            dim: Embedding dimension
+        """
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            L2-normalized float32 matrix of shape (len(texts), dim)
+        """
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = tokenize(text)
+            features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+            for feature in features:
+                digest = zlib.crc32(feature.encode("utf-8"))
+                matrix[row, digest % self.dim] += 1.0 if (digest >> 16) & 1 else -1.0
+        return _normalize(matrix)
+
+
+class SentenceTransformerEncoder:
+    """Local sentence-transformers model."""
+
+    def __init__(self, model_name: str, batch_size: int = 64):
+        """Load the model.
+
+        Args:
+            model_name: sentence-transformers model name or path
+            batch_size: Texts per forward pass
+
+        Raises:
+            RuntimeError: If sentence-transformers is not installed
+        """
+        if SentenceTransformer is None:
+            raise RuntimeError(
+                "Local embedding model requested but sentence_transformers is not installed")
+        self.model = SentenceTransformer(model_name)
+        self.batch_size = batch_size
+        self.dim = int(self.model.get_sentence_embedding_dimension())
+        self.name = model_name.replace("/", "__")
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            L2-normalized float32 matrix of shape (len(texts), dim)
+        """
+        vectors = self.model.encode(
+            list(texts), batch_size=self.batch_size, convert_to_numpy=True,
+            normalize_embeddings=True, show_progress_bar=False)
+        return np.asarray(vectors, dtype=np.float32)
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize rows (zero rows stay zero)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+class EmbeddingMatrix:
+    """Stacked embeddings, optionally quantized, supporting batched similarity."""
+
+    def __init__(self, vectors: np.ndarray, quantization: str = "float32"):
+        """Store (and quantize) normalized vectors.
+
+        Args:
+            vectors: Float32 matrix of normalized embeddings
+            quantization: "float32", "float16" or "int8" (per-row scale)
+
+        Raises:
+            ValueError: If the quantization mode is unknown
+        """
+        self.quantization = quantization
+        self.scale: Optional[np.ndarray] = None
+        if quantization == "float32":
+            self.data = np.ascontiguousarray(vectors, dtype=np.float32)
+        elif quantization == "float16":
+            self.data = vectors.astype(np.float16)
+        elif quantization == "int8":
+            peak = np.abs(vectors).max(axis=1, keepdims=True) if len(vectors) else np.ones((0, 1))
+            self.scale = (np.maximum(peak, 1e-12) / 127.0).astype(np.float32)
+            self.data = np.round(vectors / self.scale).astype(np.int8)
+        else:
+            raise ValueError(f"Unknown quantization: {quantization}")
+
+    def __len__(self) -> int:
+        return int(self.data.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the stored vectors."""
+        return int(self.data.nbytes + (self.scale.nbytes if self.scale is not None else 0))
+
+    def similarity(self, queries: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every stored vector to each query.
+
+        Args:
+            queries: Normalized query vectors, shape (dim,) or (n, dim)
+
+        Returns:
+            Scores of shape (len(self),) or (len(self), n)
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        if self.quantization == "float32":
+            return self.data @ queries
+        scores = self.data.astype(np.float32) @ queries
+        if self.scale is not None:
+            scores *= self.scale if scores.ndim == 2 else self.scale[:, 0]
+        return scores
+
+
+class EmbeddingCache:
+    """Content-hash keyed vectors in a growable memory-mapped float32 file.
+
+    ``<name>.f32`` holds one row per vector and ``<name>.keys`` the row keys,
+    one per line, in row order.
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]], name: str, dim: int, capacity: int = 1024):
+        """Open (or create) the cache.
+
+        Args:
+            directory: Directory for the cache files, or None for memory only
+            name: Encoder name, so different encoders never share vectors
+            dim: Embedding dimension
+            capacity: Initial number of rows allocated on disk
+        """
+        self.dim = dim
+        self.rows: Dict[str, int] = {}
+        self._vectors: Union[np.ndarray, np.memmap] = np.zeros((0, dim), dtype=np.float32)
+        self._keys_file = None
+        self._path: Optional[Path] = None
+
+        if directory is None:
+            self._memory: Optional[List[np.ndarray]] = []
+            return
+        self._memory = None
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        self._path = directory / f"{name}.f32"
+        keys_path = directory / f"{name}.keys"
+        if keys_path.exists():
+            keys = keys_path.read_text(encoding="utf-8").split()
+            self.rows = {key: row for row, key in enumerate(keys)}
+        capacity = max(capacity, len(self.rows))
+        self._open(capacity)
+        self._keys_file = keys_path.open("a", encoding="utf-8")
+
+    def _open(self, capacity: int) -> None:
+        """Map the vector file with room for ``capacity`` rows."""
+        assert self._path is not None
+        size = capacity * self.dim * 4
+        with self._path.open("ab") as handle:
+            if handle.tell() < size:
+                handle.truncate(size)
+        self._vectors = np.memmap(self._path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+
+    def get(self, keys: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Look up cached vectors (None for misses)."""
+        if self._memory is not None:
+            return [self._memory[self.rows[key]] if key in self.rows else None for key in keys]
+        return [np.array(self._vectors[self.rows[key]]) if key in self.rows else None for key in keys]
+
+    def put(self, keys: Sequence[str], vectors: np.ndarray) -> None:
+        """Store vectors under their keys."""
+        new = [(key, vector) for key, vector in zip(keys, vectors) if key not in self.rows]
+        if not new:
+            return
+        if self._memory is not None:
+            for key, vector in new:
+                self.rows[key] = len(self._memory)
+                self._memory.append(vector)
+            return
+
+        needed = len(self.rows) + len(new)
+        if needed > self._vectors.shape[0]:
+            self._vectors.flush()
+            self._open(max(needed, 2 * self._vectors.shape[0]))
+        for key, vector in new:
+            row = len(self.rows)
+            self._vectors[row] = vector
+            self.rows[key] = row
+            self._keys_file.write(key + "\n")
+        self._vectors.flush()
+        self._keys_file.flush()
+
+    def close(self) -> None:
+        """Flush and release the cache files."""
+        if self._keys_file is not None:
+            self._vectors.flush()
+            self._keys_file.close()
+            self._keys_file = None
+
+
+class EmbeddingService:
+    """Batched, cached text embeddings."""
+
+    def __init__(self, config: Optional[EmbeddingConfig] = None):
+        """Initialize the encoder and cache.
+
+        Args:
+            config: Embedding settings; defaults to settings.embeddings
+        """
+        self.config = config or settings.embeddings
+        self.encoder = self._make_encoder()
+        self.dim = self.encoder.dim
+        self.cache = EmbeddingCache(self.config.cache_dir, self.encoder.name, self.dim)
+
+    def _make_encoder(self) -> Union[HashingEncoder, SentenceTransformerEncoder]:
+        """Pick the local model when configured and installed, else hashing."""
+        backend = self.config.backend
+        if backend == "sentence-transformers" or (backend == "auto" and SentenceTransformer is not None):
+            return SentenceTransformerEncoder(self.config.model_name, self.config.batch_size)
+        return HashingEncoder(self.config.hashing_dim)
+
+    def _key(self, text: str) -> str:
+        return hashlib.blake2b(f"{self.encoder.name}\0{text}".encode("utf-8"), digest_size=16).hexdigest()
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts, encoding only cache misses, in batches.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Normalized float32 matrix of shape (len(texts), dim)
+        """
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        keys = [self._key(text) for text in texts]
+        cached = self.cache.get(keys)
+        misses = [i for i, vector in enumerate(cached) if vector is None]
+        record_cache("embedding", True, len(texts) - len(misses))
+        record_cache("embedding", False, len(misses))
+
+        # Encode each distinct missing text once
+        unique: Dict[str, int] = {}
+        for i in misses:
+            unique.setdefault(keys[i], i)
+        order = list(unique.values())
+        batch = self.config.batch_size
+        for start in range(0, len(order), batch):
+            rows = order[start:start + batch]
+            vectors = self.encoder.encode([texts[i] for i in rows])
+            self.cache.put([keys[i] for i in rows], vectors)
+
+        result = np.empty((len(texts), self.dim), dtype=np.float32)
+        for i, vector in enumerate(self.cache.get(keys)):
+            result[i] = vector
+        return result
+
+    def matrix(self, texts: Sequence[str], quantization: Optional[str] = None) -> EmbeddingMatrix:
+        """Embed texts into a similarity-searchable matrix.
+
+        Args:
+            texts: Texts to embed
+            quantization: Storage format; defaults to settings.embeddings.quantization
+
+        Returns:
+            Embedding matrix
+        """
+        return EmbeddingMatrix(self.encode(texts), quantization or self.config.quantization)
+
+
+_service: Optional[EmbeddingService] = None
+
+
+def get_embedding_service() -> EmbeddingService:
+    """Get the shared embedding service."""
+    global _service
+    if _service is None:
+        _service = EmbeddingService()
+    return _service
@@ -0,0 +1,302 @@
+"""Background jobs for agent turns.
+
+Instead of holding an HTTP request open while an agent generates its turn,
+a client can submit the turn as a job and poll or stream its status. Jobs
+run on a fixed pool of workers. Jobs of one session run one at a time in
+submission order, so turns are never reordered; across sessions, interactive
+jobs are started before batch (autopilot) ones. Queued and running jobs can
+be cancelled. Jobs run as scheduler work of their priority class, so the
+same priority applies while they wait for agent and provider capacity.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, Field
+
+from ..agents.scheduler import BATCH, INTERACTIVE, Work, work_scope
+from ..config import JobConfig, settings
+
+PRIORITIES = {INTERACTIVE: 0, BATCH: 1}
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = frozenset({SUCCEEDED, FAILED, CANCELLED})
+
+
+class QueueFullError(RuntimeError):
+    """Too many jobs are queued to accept another."""
+
+
+class Job(BaseModel):
+    """Status and outcome of a background agent turn."""
+
+    id: UUID = Field(default_factory=uuid4, description="Job ID")
+    session_id: UUID = Field(description="Trial session the job belongs to")
+    kind: str = Field(description="What the job does, e.g. auto-response")
+    priority: str = Field(default=INTERACTIVE, description="interactive or batch")
+    status: str = Field(default=QUEUED, description="queued, running, succeeded, failed or cancelled")
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Optional[Any] = Field(default=None, description="Result once succeeded")
+    error: Optional[str] = Field(default=None, description="Error message once failed")
+    error_status: Optional[int] = Field(default=None, description="HTTP status matching the error")
+
+
+class _Entry:
+    """A job with the coroutine that runs it."""
+
+    __slots__ = ("job", "run", "task", "changed")
+
+    def __init__(self, job: Job, run: Callable[[], Awaitable[Any]]):
+        self.job = job
+        self.run = run
+        self.task: Optional["asyncio.Task[Any]"] = None
+        self.changed = asyncio.Event()
+
+    def notify(self) -> None:
+        """Wake everyone watching the job."""
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+
+class JobQueue:
+    """Bounded worker pool running agent-turn jobs."""
+
+    def __init__(self, config: Optional[JobConfig] = None):
+        """Initialize the queue; workers start with the first job.
+
+        Args:
+            config: Queue settings; defaults to settings.jobs
+        """
+        self.config = config or settings.jobs
+        self._jobs: Dict[UUID, _Entry] = {}
+        # Per-session FIFO of queued jobs
+        self._pending: Dict[UUID, Deque[_Entry]] = {}
+        self._running_sessions: Set[UUID] = set()
+        # Sessions with a job ready to start: (priority, sequence, session ID)
+        self._ready: List[Tuple[int, int, UUID]] = []
+        self._sequence = itertools.count()
+        self._finished: Deque[Tuple[float, UUID]] = deque()
+        self._workers: List["asyncio.Task[None]"] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._work = asyncio.Event()
+
+    def submit(
+        self,
+        session_id: UUID,
+        kind: str,
+        run: Callable[[], Awaitable[Any]],
+        priority: str = INTERACTIVE,
+    ) -> Job:
+        """Queue a job.
+
+        Args:
+            session_id: Trial session the job belongs to
+            kind: Job kind, for clients
+            run: Coroutine factory doing the work; its return value is the result
+            priority: interactive or batch
+
+        Returns:
+            The queued job
+
+        Raises:
+            ValueError: If the priority is unknown
+            QueueFullError: If max_queued jobs are already waiting
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown job priority: {priority}")
+        self._ensure_workers()
+        self._prune()
+        if sum(len(queue) for queue in self._pending.values()) >= self.config.max_queued:
+            raise QueueFullError("Too many agent turns are queued; try again later")
+
+        entry = _Entry(Job(session_id=session_id, kind=kind, priority=priority), run)
+        self._jobs[entry.job.id] = entry
+        queue = self._pending.setdefault(session_id, deque())
+        queue.append(entry)
+        if len(queue) == 1 and session_id not in self._running_sessions:
+            self._schedule(session_id)
+        return entry.job
+
+    def get(self, job_id: UUID) -> Optional[Job]:
+        """Current state of a job, or None if unknown or expired."""
+        entry = self._jobs.get(job_id)
+        return entry.job.model_copy() if entry else None
+
+    def cancel(self, job_id: UUID) -> Job:
+        """Cancel a queued or running job (finished jobs are left as they are).
+
+        Args:
+            job_id: Job to cancel
+
+        Returns:
+            The job's state after cancelling
+
+        Raises:
+            ValueError: If the job is unknown
+        """
+        entry = self._jobs.get(job_id)
+        if entry is None:
+            raise ValueError(f"Job {job_id} not found")
+        job = entry.job
+        if job.status == QUEUED:
+            self._pending[job.session_id].remove(entry)
+            self._finish(entry, CANCELLED)
+        elif job.status == RUNNING and entry.task is not None:
+            # The worker records the cancellation once the task stops
+            entry.task.cancel()
+        return job.model_copy()
+
+    async def watch(self, job_id: UUID, heartbeat: float = 15.0) -> AsyncIterator[Optional[Job]]:
+        """Follow a job until it finishes.
+
+        Args:
+            job_id: Job to follow
+            heartbeat: Seconds without a change after which None is yielded
+
+        Yields:
+            The job's state now and after every change, or None as a heartbeat
+
+        Raises:
+            ValueError: If the job is unknown
+        """
+        entry = self._jobs.get(job_id)
+        if entry is None:
+            raise ValueError(f"Job {job_id} not found")
+        while True:
+            changed = entry.changed
+            yield entry.job.model_copy()
+            if entry.job.status in FINISHED:
+                return
+            while not changed.is_set():
+                try:
+                    await asyncio.wait_for(changed.wait(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+
+    def stats(self) -> Dict[Tuple[str, str], int]:
+        """Jobs per (status, priority), for queued and running jobs."""
+        counts: Dict[Tuple[str, str], int] = {
+            (status, priority): 0 for status in (QUEUED, RUNNING) for priority in PRIORITIES}
+        for entry in self._jobs.values():
+            key = (entry.job.status, entry.job.priority)
+            if key in counts:
+                counts[key] += 1
+        return counts
+
+    async def shutdown(self) -> None:
+        """Stop the workers, cancelling running jobs."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def _ensure_workers(self) -> None:
+        """Start the worker pool on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._workers:
+            return
+        self._loop = loop
+        self._work = asyncio.Event()
+        if self._ready:
+            self._work.set()
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(max(1, self.config.workers))]
+
+    def _schedule(self, session_id: UUID) -> None:
+        """Mark a session's next job as ready to start."""
+        head = self._pending[session_id][0]
+        heapq.heappush(self._ready, (PRIORITIES[head.job.priority], next(self._sequence), session_id))
+        self._work.set()
+
+    async def _worker(self) -> None:
+        while True:
+            while not self._ready:
+                self._work.clear()
+                await self._work.wait()
+            _, _, session_id = heapq.heappop(self._ready)
+            queue = self._pending.get(session_id)
+            if not queue or session_id in self._running_sessions:
+                continue
+            entry = queue.popleft()
+            self._running_sessions.add(session_id)
+            try:
+                await self._run(entry)
+            finally:
+                self._running_sessions.discard(session_id)
+                if queue:
+                    self._schedule(session_id)
+                elif self._pending.get(session_id) is queue:
+                    del self._pending[session_id]
+
+    async def _run(self, entry: _Entry) -> None:
+        """Run one job and record its outcome."""
+        entry.job.status = RUNNING
+        entry.job.started_at = datetime.utcnow()
+        entry.notify()
+        with work_scope(Work(entry.job.priority)):
+            task = entry.task = asyncio.create_task(entry.run())
+        try:
+            await asyncio.wait({task})
+        except asyncio.CancelledError:
+            # The worker itself is being stopped
+            task.cancel()
+            self._finish(entry, CANCELLED)
+            raise
+
+        if task.cancelled():
+            self._finish(entry, CANCELLED)
+        elif task.exception() is not None:
+            error = task.exception()
+            entry.job.error = str(getattr(error, "detail", None) or error) or type(error).__name__
+            entry.job.error_status = getattr(error, "status_code", 500)
+            self._finish(entry, FAILED)
+        else:
+            result = task.result()
+            entry.job.result = result.model_dump(mode="json") if isinstance(result, BaseModel) else result
+            self._finish(entry, SUCCEEDED)
+
+    def _finish(self, entry: _Entry, status: str) -> None:
+        entry.job.status = status
+        entry.job.finished_at = datetime.utcnow()
+        entry.task = None
+        self._finished.append((time.monotonic(), entry.job.id))
+        entry.notify()
+
+    def _prune(self) -> None:
+        """Forget finished jobs older than the retention period."""
+        cutoff = time.monotonic() - self.config.retention_seconds
+        while self._finished and self._finished[0][0] < cutoff:
+            self._jobs.pop(self._finished.popleft()[1], None)
+
+
+_job_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Shared job queue."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue()
+    return _job_queue
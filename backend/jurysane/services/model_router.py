@@ -0,0 +1,142 @@
+"""Model routing and generation limits per role, trial phase and action.
+
+Rules in ``settings.routing`` map a (role, phase, action) to an ordered list
+of "provider/model" candidates; rules in ``settings.llm.generation_limits``
+map it to a max output length and stop sequences. In both, the most specific
+matching rule wins. With adaptive routing enabled, candidates are re-ranked
+by their rolling latency and error rate so slow or failing models drop
+behind healthier ones.
+"""
+
+from typing import List, Optional, Sequence, Tuple, TypeVar, Union
+
+from ..agents.circuit_breaker import OPEN, get_breaker
+from ..agents.resilience import latency_tracker
+from ..config import GenerationLimit, RoutingConfig, RoutingRule, settings
+from ..models.trial import CaseRole, TrialPhase
+from ..utils import get_enum_value
+
+Candidate = Tuple[str, str]
+RuleT = TypeVar("RuleT", GenerationLimit, RoutingRule)
+
+
+def parse_model(entry: str) -> Candidate:
+    """Split a "provider/model" string into a (provider, model) pair."""
+    provider, _, model = entry.partition("/")
+    return provider.strip().lower(), model.strip()
+
+
+def match_rule(
+    rules: Sequence[RuleT],
+    role: Union[CaseRole, str],
+    phase: Optional[Union[TrialPhase, str]] = None,
+    action: Optional[str] = None,
+) -> Optional[RuleT]:
+    """Find the matching rule with the most specified fields.
+
+    Args:
+        rules: Rules with optional role, phase and action fields
+        role: Role taking the turn
+        phase: Current trial phase
+        action: What the turn does
+
+    Returns:
+        Best matching rule (earliest on ties), or None
+    """
+    turn = (get_enum_value(role), get_enum_value(phase) if phase else None, action)
+    best: Optional[RuleT] = None
+    best_specificity = -1
+    for rule in rules:
+        fields = tuple(zip((rule.role, rule.phase, rule.action), turn))
+        if any(wanted is not None and wanted != actual for wanted, actual in fields):
+            continue
+        specificity = sum(wanted is not None for wanted, _ in fields)
+        if specificity > best_specificity:
+            best, best_specificity = rule, specificity
+    return best
+
+
+class ModelRouter:
+    """Chooses provider/model candidates for each agent turn."""
+
+    def __init__(self, config: Optional[RoutingConfig] = None):
+        """Initialize the router.
+
+        Args:
+            config: Routing rules; defaults to settings.routing
+        """
+        self.config = config or settings.routing
+
+    def route(
+        self,
+        role: CaseRole,
+        phase: Optional[Union[TrialPhase, str]] = None,
+        action: Optional[str] = None,
+    ) -> List[Candidate]:
+        """Candidates from the most specific rule matching the turn.
+
+        Args:
+            role: Role taking the turn
+            phase: Current trial phase
+            action: What the turn does (e.g. "procedural", "closing")
+
+        Returns:
+            Ordered (provider, model) candidates, empty if no rule matches
+        """
+        rule = match_rule(self.config.rules, role, phase, action)
+        if rule is None:
+            return []
+        return [parse_model(entry) for entry in rule.models]
+
+    def rank(self, candidates: List[Candidate]) -> List[Candidate]:
+        """Re-order candidates by observed health when adaptive routing is on.
+
+        Candidates without enough samples score zero so they get explored;
+        ties keep the configured order.
+
+        Args:
+            candidates: Configured candidate order
+
+        Returns:
+            Candidates, best first
+        """
+        if not self.config.adaptive or len(candidates) < 2:
+            return candidates
+        return sorted(candidates, key=lambda candidate: self.score(*candidate))
+
+    def score(self, provider: str, model: str) -> float:
+        """Expected cost of a call in seconds (lower is better).
+
+        Args:
+            provider: Provider name
+            model: Model name
+
+        Returns:
+            Median latency inflated by the provider's error rate; infinite
+            while its circuit breaker is open
+        """
+        breaker = get_breaker(provider)
+        if breaker.state == OPEN:
+            return float("inf")
+        latency = latency_tracker(provider, model).percentile(50)
+        if latency is None:
+            return 0.0
+        return latency * (1.0 + self.config.error_penalty * breaker.failure_rate)
+
+    def generation_limit(
+        self,
+        role: Union[CaseRole, str],
+        phase: Optional[Union[TrialPhase, str]] = None,
+        action: Optional[str] = None,
+    ) -> Optional[GenerationLimit]:
+        """Output length and stop sequences for a turn.
+
+        Args:
+            role: Role taking the turn
+            phase: Current trial phase
+            action: What the turn does
+
+        Returns:
+            Most specific matching limit, or None to use the defaults
+        """
+        return match_rule(settings.llm.generation_limits, role, phase, action)
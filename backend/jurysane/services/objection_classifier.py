@@ -0,0 +1,193 @@
+"""Rule-based fast path for objection rulings.
+
+Some objections can be decided from the question text alone: a tag question
+on direct examination is leading, two questions in one are compound, and
+"what do you think he was planning" calls for speculation. ``classify_question``
+scores the question against patterns for each ``ObjectionType`` and
+``fast_ruling`` turns a confident score into a ruling, so only ambiguous
+objections need the judge model.
+"""
+
+import re
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from pydantic import BaseModel, Field
+
+from ..models.trial import ObjectionType
+
+SUSTAINED = "sustained"
+OVERRULED = "overruled"
+
+_RULING = re.compile(r"\b(sustained|overruled)\b[.!:,]?", re.IGNORECASE)
+# Sentence boundary, not after a title such as "Mr."
+_SENTENCE_END = re.compile(r"(?<!\bMr\.)(?<!\bMrs\.)(?<!\bMs\.)(?<!\bDr\.)(?<=[.!?])\s+")
+
+# (pattern, confidence, explanation) per objection type; the best match wins
+_PATTERNS: Dict[ObjectionType, List[Tuple[Pattern[str], float, str]]] = {
+    ObjectionType.LEADING: [
+        (re.compile(r"\b(isn't|wasn't|aren't|weren't|didn't|doesn't|don't|haven't|hasn't|won't|wouldn't|couldn't)"
+                    r" (it|that|you|he|she|they)\b[^?]*\?\s*$"), 0.9,
+         "The question ends in a tag that suggests the answer."),
+        (re.compile(r",\s*(right|correct|true|isn't that (right|true|so))\s*\?\s*$"), 0.9,
+         "The question ends in a tag that suggests the answer."),
+        (re.compile(r"^(isn't it true|wouldn't you agree|would you agree|is it not true|you would agree)\b"), 0.9,
+         "The question supplies the answer for the witness to adopt."),
+        (re.compile(r"^(so )?(you|he|she|they) (were|was|saw|went|knew|had|did|said|told)\b[^?]*\?\s*$"), 0.7,
+         "The question is phrased as a statement for the witness to confirm."),
+    ],
+    ObjectionType.COMPOUND: [
+        (re.compile(r"\?[^?]+\?"), 0.9, "More than one question is asked at once."),
+        (re.compile(r"\b(and|or) (did|were|was|have|had|do|does|is|are|could|would|can) "
+                    r"(you|he|she|they|it)\b"), 0.8,
+         "The question joins two separate questions."),
+    ],
+    ObjectionType.SPECULATION: [
+        (re.compile(r"\b(what|why|how) (do|did|would|might) you (think|guess|imagine|suppose|believe)\b"), 0.85,
+         "The witness is asked to guess rather than testify from knowledge."),
+        (re.compile(r"\bwhat (was|were|is) (he|she|they|the defendant) (thinking|planning|intending|feeling)\b"), 0.9,
+         "The witness is asked about another person's state of mind."),
+        (re.compile(r"\b(what|how) would (have )?happen(ed)? if\b|\bwhat if\b"), 0.85,
+         "The question asks about a hypothetical the witness did not observe."),
+        (re.compile(r"\b(guess|speculate|imagine)\b"), 0.8,
+         "The witness is invited to speculate."),
+    ],
+    ObjectionType.ARGUMENTATIVE: [
+        (re.compile(r"\b(do you (really )?expect (us|the jury|anyone) to believe|are you (lying|seriously)|"
+                    r"how can you (possibly|honestly))\b"), 0.9,
+         "The question argues with the witness instead of seeking facts."),
+    ],
+    ObjectionType.HEARSAY: [
+        (re.compile(r"\bwhat did (he|she|they|the \w+) (say|tell you|tell|write)\b"), 0.7,
+         "The question seeks an out-of-court statement."),
+    ],
+}
+
+
+class ObjectionAssessment(BaseModel):
+    """How strongly a question supports one objection type."""
+
+    objection_type: ObjectionType = Field(description="Objection type")
+    confidence: float = Field(description="Confidence in [0, 1] that the objection applies")
+    reason: str = Field(description="Why the objection applies")
+
+
+class ObjectionRuling(BaseModel):
+    """A ruling on an objection."""
+
+    ruling: str = Field(description="sustained or overruled")
+    reason: str = Field(description="Explanation for the ruling")
+    confidence: float = Field(default=1.0, description="Confidence in the ruling")
+    source: str = Field(default="classifier", description="classifier or judge")
+
+
+def _normalize(question: str) -> str:
+    """Lower-case, collapse whitespace and unify apostrophes."""
+    return " ".join(question.replace("’", "'").lower().split())
+
+
+def objection_kind(objection_type: str) -> Optional[ObjectionType]:
+    """Parse an objection type such as "Asked and answered" or "asked_and_answered".
+
+    Args:
+        objection_type: Objection type as raised
+
+    Returns:
+        Matching ObjectionType, or None if unknown
+    """
+    try:
+        return ObjectionType(objection_type.strip().lower().replace(" ", "_").replace("-", "_"))
+    except ValueError:
+        return None
+
+
+def last_question(text: str) -> Optional[str]:
+    """Extract the last question sentence from a transcript entry.
+
+    An examiner's turn can hold a preamble and several questions; only the
+    last one is what the objection is aimed at.
+
+    Args:
+        text: Transcript entry content
+
+    Returns:
+        The last sentence ending in "?", or None if there is none
+    """
+    questions = [sentence for sentence in _SENTENCE_END.split(text.strip()) if sentence.endswith("?")]
+    return questions[-1] if questions else None
+
+
+def classify_question(question: str) -> List[ObjectionAssessment]:
+    """Score a question against every objection type with known patterns.
+
+    Args:
+        question: Question text
+
+    Returns:
+        Assessments for the types that matched, most confident first
+    """
+    text = _normalize(question)
+    assessments = []
+    for objection_type, patterns in _PATTERNS.items():
+        best = max(
+            ((confidence, reason) for pattern, confidence, reason in patterns if pattern.search(text)),
+            default=None,
+        )
+        if best is not None:
+            assessments.append(ObjectionAssessment(
+                objection_type=objection_type, confidence=best[0], reason=best[1]))
+    return sorted(assessments, key=lambda assessment: -assessment.confidence)
+
+
+def fast_ruling(
+    objection_type: str,
+    question: Optional[str],
+    examination_type: Optional[str] = None,
+    threshold: float = 0.8,
+) -> Optional[ObjectionRuling]:
+    """Rule on an objection without the judge model when the text is clear-cut.
+
+    Args:
+        objection_type: Objection raised (an ObjectionType value)
+        question: Question objected to
+        examination_type: "direct" or "cross", if known
+        threshold: Minimum confidence for an instant ruling
+
+    Returns:
+        Ruling, or None when the objection needs the judge
+    """
+    kind = objection_kind(objection_type)
+    if kind is None or not question or not question.strip():
+        return None
+
+    if kind == ObjectionType.LEADING:
+        if examination_type == "cross":
+            return ObjectionRuling(
+                ruling=OVERRULED, confidence=0.95,
+                reason="Leading questions are permitted on cross-examination.")
+        if examination_type != "direct":
+            # Leading is only objectionable on direct; unknown goes to the judge
+            return None
+
+    for assessment in classify_question(question):
+        if assessment.objection_type == kind and assessment.confidence >= threshold:
+            return ObjectionRuling(
+                ruling=SUSTAINED, confidence=assessment.confidence, reason=assessment.reason)
+    return None
+
+
+def parse_ruling(text: str) -> Tuple[str, str]:
+    """Extract the ruling and explanation from a judge's free-text answer.
+
+    Args:
+        text: Judge response, e.g. "Sustained. The question calls for speculation."
+
+    Returns:
+        (ruling, explanation); the first of "sustained"/"overruled" mentioned
+        wins, and an answer with neither counts as overruled
+    """
+    match = _RULING.search(text)
+    if match is None:
+        return OVERRULED, text.strip()
+    # "Sustained. Reason" / "Objection overruled. Reason" -> keep only the reason
+    explanation = text[match.end():] if match.start() <= 20 else text
+    return match.group(1).lower(), explanation.lstrip(" \n.:!,-").strip()
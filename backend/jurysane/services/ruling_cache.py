@@ -0,0 +1,103 @@
+"""Cross-session cache of judge rulings on objections.
+
+Drills on popular cases raise the same objections to the same questions over
+and over. Rulings from the judge model are cached under (case version,
+objection type, fingerprint of the normalized question and examination type)
+with LRU and TTL eviction. The case version is a hash of the case content, so
+an edited case never hits rulings made for its old text; those age out.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from ..metrics import record_cache
+from ..models.trial import Case, ObjectionType
+from .asked_and_answered import FILLER_WORDS
+from .case_briefing import compute_case_version
+from .embeddings import tokenize
+from .objection_classifier import ObjectionRuling
+
+RulingKey = Tuple[str, ObjectionType, str]
+
+
+def question_fingerprint(question: str, examination_type: Optional[str] = None) -> str:
+    """Hash a question so rephrasings that differ only in filler words match.
+
+    Args:
+        question: Question objected to
+        examination_type: "direct" or "cross", if known
+
+    Returns:
+        Hex digest
+    """
+    words = " ".join(word for word in tokenize(question) if word not in FILLER_WORDS)
+    text = f"{examination_type or ''}\0{words}"
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class RulingCache:
+    """LRU + TTL cache of objection rulings keyed per case."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600.0):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            ttl_seconds: Lifetime of an entry
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[RulingKey, Tuple[float, ObjectionRuling]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(
+        case: Case,
+        objection_type: ObjectionType,
+        question: str,
+        examination_type: Optional[str] = None,
+    ) -> RulingKey:
+        """Build the cache key for an objection."""
+        return (compute_case_version(case), objection_type,
+                question_fingerprint(question, examination_type))
+
+    def get(self, key: RulingKey) -> Optional[ObjectionRuling]:
+        """Look up a ruling.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached ruling, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            record_cache("objection_ruling", False)
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        record_cache("objection_ruling", True)
+        return entry[1]
+
+    def put(self, key: RulingKey, ruling: ObjectionRuling) -> None:
+        """Store a ruling.
+
+        Args:
+            key: Cache key
+            ruling: Ruling to cache
+        """
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, ruling)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,209 @@
+"""Batch simulation of autopilot trials."""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from pydantic import BaseModel, Field
+
+from ..agents.usage import usage_tracker
+from ..models.trial import Case, UserRole
+from ..utils import get_enum_value
+from .trial_service import TrialService
+
+
+class SimulationSummary(BaseModel):
+    """Totals for a simulation run."""
+
+    completed: int = Field(default=0, description="Trials written this run")
+    failed: int = Field(default=0, description="Trials that raised an error")
+    skipped: int = Field(default=0, description="Trials already in the output file")
+    duration_ms: float = Field(default=0.0, description="Wall time of the run")
+    total_tokens: int = Field(default=0, description="LLM tokens used by trials written this run")
+    cost_usd: float = Field(default=0.0, description="LLM cost of trials written this run")
+
+
+def encode_record(record: Dict[str, Any]) -> str:
+    """Serialize one trial record as an NDJSON line.
+
+    Args:
+        record: Trial record
+
+    Returns:
+        JSON line terminated by a newline
+    """
+    return json.dumps(record, default=str, ensure_ascii=False) + "\n"
+
+
+def load_completed(output_path: Path) -> Set[Tuple[str, int]]:
+    """Collect finished (case title, trial index) keys from an output file.
+
+    A partially written trailing line from an interrupted run is dropped so
+    appending can resume cleanly.
+
+    Args:
+        output_path: NDJSON output file
+
+    Returns:
+        Keys of trials recorded with status "ok"
+    """
+    if not output_path.exists():
+        return set()
+
+    completed: Set[Tuple[str, int]] = set()
+    valid_lines: List[str] = []
+    truncated = False
+    with output_path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                truncated = True
+                continue
+            valid_lines.append(line if line.endswith("\n") else line + "\n")
+            if record.get("status") == "ok":
+                completed.add((record["case_title"], record["trial_index"]))
+
+    if truncated:
+        output_path.write_text("".join(valid_lines), encoding="utf-8")
+    return completed
+
+
+class SimulationRunner:
+    """Runs many autopilot trials concurrently and streams results to NDJSON."""
+
+    def __init__(
+        self,
+        cases: List[Case],
+        trials_per_case: int,
+        output_path: Path,
+        concurrency: int = 4,
+        user_role: UserRole = UserRole.DEFENSE,
+        resume: bool = True,
+        trial_service: Optional[TrialService] = None,
+    ):
+        """Initialize the runner.
+
+        Args:
+            cases: Cases to simulate
+            trials_per_case: Number of trials to run for each case
+            output_path: NDJSON file results are appended to
+            concurrency: Maximum trials in flight at once
+            user_role: Side the (simulated) user plays
+            resume: Skip trials already recorded in the output file
+            trial_service: Service to run trials on (a fresh one by default)
+        """
+        self.cases = cases
+        self.trials_per_case = trials_per_case
+        self.output_path = output_path
+        self.concurrency = max(1, concurrency)
+        self.user_role = user_role
+        self.resume = resume
+        self.trial_service = trial_service or TrialService()
+        self._write_lock = asyncio.Lock()
+
+    async def run(self) -> SimulationSummary:
+        """Run every pending trial.
+
+        Returns:
+            Run summary
+        """
+        started = time.perf_counter()
+        summary = SimulationSummary()
+        done = load_completed(self.output_path) if self.resume else set()
+        if not self.resume and self.output_path.exists():
+            self.output_path.unlink()
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        pending = [
+            (case, index)
+            for case in self.cases
+            for index in range(self.trials_per_case)
+            if (case.title, index) not in done
+        ]
+        summary.skipped = len(self.cases) * self.trials_per_case - len(pending)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run_one(case: Case, index: int) -> None:
+            async with semaphore:
+                record = await self.run_trial(case, index)
+            await self._write(record)
+            summary.total_tokens += record["usage"]["total"]["total_tokens"]
+            summary.cost_usd += record["usage"]["total"]["cost_usd"]
+            if record["status"] == "ok":
+                summary.completed += 1
+            else:
+                summary.failed += 1
+
+        await asyncio.gather(*(run_one(case, index) for case, index in pending))
+
+        summary.duration_ms = (time.perf_counter() - started) * 1000
+        return summary
+
+    async def run_trial(self, case: Case, index: int) -> Dict[str, Any]:
+        """Run one autopilot trial and build its result record.
+
+        Args:
+            case: Case to try
+            index: Trial index within the case
+
+        Returns:
+            Result record (status "ok" or "error")
+        """
+        started = time.perf_counter()
+        session = await self.trial_service.create_trial_session(case, self.user_role, autopilot=True)
+        record: Dict[str, Any] = {
+            "case_id": str(case.id),
+            "case_title": case.title,
+            "trial_index": index,
+            "session_id": str(session.id),
+            "user_role": get_enum_value(self.user_role),
+            "status": "ok",
+            "verdict": None,
+            "charge_verdicts": None,
+            "turns": [],
+        }
+        try:
+            async for event in self.trial_service.run_autopilot(session.id):
+                if event["type"] == "turn":
+                    record["turns"].append({
+                        "phase": event["phase"],
+                        "role": event["role"],
+                        "latency_ms": round(event["latency_ms"], 1),
+                        "chars": len(event["content"]),
+                    })
+                elif event["type"] == "deliberation":
+                    record["charge_verdicts"] = event["charge_verdicts"]
+                elif event["type"] == "completed":
+                    record["verdict"] = event["verdict"]
+        except Exception as e:
+            record["status"] = "error"
+            record["error"] = str(e)
+        finally:
+            record["transcript"] = session.transcript
+            record["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            # Results live in the output file; free the session
+            self.trial_service.active_sessions.pop(session.id, None)
+            self.trial_service.jury_evaluations.pop(session.id, None)
+            self.trial_service.witness_memory.drop_session(session.id)
+            self.trial_service.asked_and_answered.drop_session(session.id)
+            record["usage"] = usage_tracker.session_summary(session.id)
+            usage_tracker.drop_session(session.id)
+
+        return record
+
+    async def _write(self, record: Dict[str, Any]) -> None:
+        """Serialize and append a record.
+
+        Encoding runs inline: a trial record (~100 KB) encodes in about a
+        millisecond, less than shipping it to a worker process would cost.
+        """
+        line = encode_record(record)
+
+        async with self._write_lock:
+            with self.output_path.open("a", encoding="utf-8") as handle:
+                handle.write(line)
+                handle.flush()
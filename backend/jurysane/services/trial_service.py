@@ -1,14 +1,45 @@
 """Service for managing trial sessions and agent interactions."""
 
-from typing import Dict, List, Optional, Union
+import asyncio
+import hashlib
+import json
+import logging
 import os
-import re
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple, TypeVar, Union
 from uuid import UUID, uuid4
 
-from ..agents import DefenseAgent, JudgeAgent, JuryAgent, ProsecutorAgent, WitnessAgent
+from ..agents import (
+    DefenseAgent,
+    DeliberationResult,
+    EvaluationTable,
+    JudgeAgent,
+    JuryAgent,
+    ProsecutorAgent,
+    WitnessAgent,
+)
+from ..agents.base import AgentResponse, AgentUnavailableError, BaseAgent
+from ..agents.rate_limit import llm_session_scope
+from ..agents.scheduler import (
+    BATCH,
+    INTERACTIVE,
+    SPECULATIVE,
+    DeadlineExceededError,
+    Work,
+    current_work,
+    get_scheduler,
+    promote,
+    work_scope,
+)
+from ..agents.usage import usage_scope, usage_tracker
+from ..config import settings
+from ..metrics import record_cache
 from ..models.trial import (
     Case,
     CaseRole,
+    ObjectionType,
     Participant,
     TrialPhase,
     TrialSession,
@@ -16,8 +47,70 @@ from ..models.trial import (
     Verdict,
     Witness,
 )
-from ..utils import get_enum_value, is_enum_or_string_equal, format_case_role
+from ..tracing import traced
+from ..utils import format_case_role, get_enum_value, is_enum_or_string_equal
+from .asked_and_answered import AskedAndAnsweredDetector
+from .budget import BudgetExceededError, BudgetManager
+from .case_briefing import CaseBriefingService
+from .model_router import ModelRouter, parse_model
+from .objection_classifier import (
+    ObjectionRuling,
+    fast_ruling,
+    last_question,
+    objection_kind,
+    parse_ruling,
+)
+from .ruling_cache import RulingCache
+from .turn_directives import parse_directives
 from .turn_manager import TurnManager
+from .witness_memory import WitnessMemoryService
+
+logger = logging.getLogger(__name__)
+
+# Phases where the autopilot uses the standard turn prompts, so the next turn
+# can be generated while the previous event is being consumed
+_AUTOPILOT_PIPELINED_PHASES = (TrialPhase.OPENING_STATEMENTS, TrialPhase.CLOSING_ARGUMENTS)
+
+AgentT = TypeVar("AgentT", bound=BaseAgent)
+
+_NEXT_PHASE = {
+    TrialPhase.SETUP: TrialPhase.OPENING_STATEMENTS,
+    TrialPhase.OPENING_STATEMENTS: TrialPhase.WITNESS_EXAMINATION,
+    TrialPhase.WITNESS_EXAMINATION: TrialPhase.CLOSING_ARGUMENTS,
+    TrialPhase.CLOSING_ARGUMENTS: TrialPhase.JURY_DELIBERATION,
+    TrialPhase.JURY_DELIBERATION: TrialPhase.VERDICT,
+}
+
+
+@dataclass
+class SpeculativeTurn:
+    """A background generation for the turn that was just assigned."""
+
+    role: CaseRole
+    phase: str
+    transcript_length: int
+    task: "asyncio.Task[AgentResponse]"
+    work: Work
+
+
+@dataclass
+class JuryEvaluation:
+    """Jury evaluation tables and a fingerprint of the evidence and testimony scored."""
+
+    inputs: str
+    tables: Dict[str, EvaluationTable]
+
+
+def _fingerprint(*parts: Any) -> str:
+    """Stable hash of JSON-serializable values."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _consume_task_exception(task: "asyncio.Task[AgentResponse]") -> None:
+    """Mark a background task's exception as retrieved."""
+    if not task.cancelled():
+        task.exception()
 
 
 class TrialService:
@@ -28,17 +121,39 @@ class TrialService:
         self.active_sessions: Dict[UUID, TrialSession] = {}
         self.cases: Dict[UUID, Case] = {}
         self.turn_manager = TurnManager()
-
+        self.briefing_service = CaseBriefingService()
+        self.model_router = ModelRouter()
+        self.witness_memory = WitnessMemoryService()
+        self.asked_and_answered = AskedAndAnsweredDetector(
+            settings.trial.asked_and_answered_threshold)
+        self.budgets = BudgetManager()
+        self.scheduler = get_scheduler()
+        self.ruling_cache = RulingCache(
+            settings.trial.ruling_cache_size, settings.trial.ruling_cache_ttl)
+        # Per-session jury evaluation tables, reused by deliberation while
+        # the evidence and testimony they scored are unchanged
+        self.jury_evaluations: Dict[UUID, JuryEvaluation] = {}
+        # Per-session slot holding a pre-generated next AI turn
+        self.speculative_turns: Dict[UUID, SpeculativeTurn] = {}
+        # Sessions currently driven end to end by run_autopilot
+        self.autopilot_sessions: Set[UUID] = set()
+
+    @traced()
     async def create_trial_session(
         self,
         case: Case,
         user_role: UserRole,
+        tenant_id: Optional[str] = None,
+        autopilot: bool = False,
     ) -> TrialSession:
         """Create a new trial session.
 
         Args:
             case: The case to try
             user_role: Role chosen by the user
+            tenant_id: Tenant whose daily budget the session draws on
+            autopilot: The session will be played by run_autopilot; its turns
+                are then never speculated as interactive work
 
         Returns:
             New trial session
@@ -104,6 +219,7 @@ class TrialService:
             user_role=user_role,
             current_phase=TrialPhase.SETUP,
             participants=participants,
+            tenant_id=tenant_id,
         )
 
         # Initialize turn management
@@ -113,6 +229,10 @@ class TrialService:
         # Store session and case
         self.active_sessions[session_id] = trial_session
         self.cases[case.id] = case
+        if autopilot:
+            self.autopilot_sessions.add(session_id)
+
+        self._maybe_speculate(trial_session)
 
         return trial_session
 
@@ -138,6 +258,7 @@ class TrialService:
         """
         return self.cases.get(case_id)
 
+    @traced()
     async def advance_trial_phase(
         self,
         session_id: UUID,
@@ -181,6 +302,7 @@ class TrialService:
 
         # Initialize turn management for new phase
         session = self.turn_manager.initialize_turn_for_phase(session)
+        self._maybe_speculate(session)
 
         return session
 
@@ -240,52 +362,142 @@ class TrialService:
             "metadata": metadata or {},
         }
 
+        # Any new entry (objection, evidence, manual input) invalidates speculation
+        self._discard_speculation(session_id)
         session.transcript.append(transcript_entry)
         return session
 
-    def _create_judge_agent(self) -> JudgeAgent:
-        """Create a judge agent."""
-        model, provider = self._resolve_provider_and_model_for_role(
-            CaseRole.JUDGE)
-        return JudgeAgent(model_name=model, provider_name=provider)
-
-    def _create_prosecutor_agent(self) -> ProsecutorAgent:
-        """Create a prosecutor agent."""
-        model, provider = self._resolve_provider_and_model_for_role(
-            CaseRole.PROSECUTOR)
-        return ProsecutorAgent(model_name=model, provider_name=provider)
-
-    def _create_defense_agent(self) -> DefenseAgent:
-        """Create a defense agent."""
-        model, provider = self._resolve_provider_and_model_for_role(
-            CaseRole.DEFENSE)
-        return DefenseAgent(model_name=model, provider_name=provider)
-
-    def _create_jury_agent(self) -> JuryAgent:
-        """Create a jury agent."""
-        model, provider = self._resolve_provider_and_model_for_role(
-            CaseRole.JURY)
-        return JuryAgent(model_name=model, provider_name=provider)
-
-    def _create_witness_agent(self, witness: Witness) -> WitnessAgent:
+    @asynccontextmanager
+    async def _agent_scope(self, session: TrialSession, agent: BaseAgent) -> AsyncIterator[None]:
+        """Run an agent call for a session through the scheduler.
+
+        LLM calls made inside the block are attributed to the session for
+        provider fairness and usage accounting by phase and tenant. Work of
+        autopilot sessions is scheduled as batch, and other work as
+        interactive unless the caller set a class (e.g. speculation).
+
+        Args:
+            session: Session the calls are made for
+            agent: Agent making them
+
+        Raises:
+            AgentUnavailableError: If the call waited past its deadline
+        """
+        work = current_work()
+        if work is None:
+            work = Work(BATCH if session.id in self.autopilot_sessions else INTERACTIVE)
+        if work.tenant is None:
+            work.tenant = session.tenant_id
+        with llm_session_scope(session.id), usage_scope(
+                session.id, get_enum_value(session.current_phase), session.tenant_id), work_scope(work):
+            try:
+                async with self.scheduler.slot(str(session.id), work):
+                    yield
+            except DeadlineExceededError as e:
+                raise AgentUnavailableError(agent.role, str(e)) from e
+
+    def get_usage(self, session_id: UUID) -> Dict[str, Any]:
+        """Token, cost and latency totals of a session, per role and phase, and its budget.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Usage summary
+
+        Raises:
+            ValueError: If the session is unknown
+        """
+        session = self.active_sessions.get(session_id)
+        if session is None and not usage_tracker.has_session(session_id):
+            raise ValueError(f"Trial session {session_id} not found")
+        summary = usage_tracker.session_summary(session_id)
+        if session is not None:
+            summary["budget"] = self.budgets.status(session).model_dump()
+        return summary
+
+    def get_global_usage(self) -> Dict[str, Any]:
+        """Token, cost and latency totals across sessions, per role, phase and model."""
+        return usage_tracker.global_summary()
+
+    def _create_judge_agent(
+        self,
+        phase: Optional[TrialPhase] = None,
+        action: Optional[str] = None,
+    ) -> JudgeAgent:
+        """Create a judge agent routed for the given phase and action."""
+        (provider, model), *fallbacks = self._resolve_model_candidates_for_role(
+            CaseRole.JUDGE, phase, action)
+        return self._configure_agent(
+            JudgeAgent(model_name=model, provider_name=provider), fallbacks, phase, action)
+
+    def _create_prosecutor_agent(
+        self,
+        phase: Optional[TrialPhase] = None,
+        action: Optional[str] = None,
+    ) -> ProsecutorAgent:
+        """Create a prosecutor agent routed for the given phase and action."""
+        (provider, model), *fallbacks = self._resolve_model_candidates_for_role(
+            CaseRole.PROSECUTOR, phase, action)
+        return self._configure_agent(
+            ProsecutorAgent(model_name=model, provider_name=provider), fallbacks, phase, action)
+
+    def _create_defense_agent(
+        self,
+        phase: Optional[TrialPhase] = None,
+        action: Optional[str] = None,
+    ) -> DefenseAgent:
+        """Create a defense agent routed for the given phase and action."""
+        (provider, model), *fallbacks = self._resolve_model_candidates_for_role(
+            CaseRole.DEFENSE, phase, action)
+        return self._configure_agent(
+            DefenseAgent(model_name=model, provider_name=provider), fallbacks, phase, action)
+
+    def _create_jury_agent(
+        self,
+        phase: Optional[TrialPhase] = None,
+        action: Optional[str] = None,
+    ) -> JuryAgent:
+        """Create a jury agent routed for the given phase and action."""
+        (provider, model), *fallbacks = self._resolve_model_candidates_for_role(
+            CaseRole.JURY, phase, action)
+        return self._configure_agent(
+            JuryAgent(model_name=model, provider_name=provider), fallbacks, phase, action)
+
+    def _create_witness_agent(
+        self,
+        witness: Witness,
+        case: Optional[Case] = None,
+        phase: Optional[TrialPhase] = None,
+        action: Optional[str] = None,
+    ) -> WitnessAgent:
         """Create a witness agent.
 
         Args:
             witness: Witness data
+            case: Case the witness belongs to; when given, the compacted
+                persona from the witness briefing is used
+            phase: Trial phase, for model routing
+            action: Turn action, for model routing
 
         Returns:
             Witness agent
         """
-        witness_data = {
-            "name": witness.name,
-            "background": witness.background,
-            "knowledge": witness.knowledge,
-            "bias": witness.bias,
-            "personality": "cooperative",  # Default personality
-        }
-        model, provider = self._resolve_provider_and_model_for_role(
-            CaseRole.WITNESS)
-        return WitnessAgent(witness_data, model_name=model, provider_name=provider)
+        if case:
+            witness_data = dict(self.briefing_service.get_briefing(
+                case, CaseRole.WITNESS, witness.name).persona)
+        else:
+            witness_data = {
+                "name": witness.name,
+                "background": witness.background,
+                "knowledge": witness.knowledge,
+                "bias": witness.bias,
+            }
+        witness_data["personality"] = "cooperative"  # Default personality
+        (provider, model), *fallbacks = self._resolve_model_candidates_for_role(
+            CaseRole.WITNESS, phase, action)
+        return self._configure_agent(
+            WitnessAgent(witness_data, model_name=model, provider_name=provider), fallbacks, phase, action)
 
     def _resolve_provider_and_model_for_role(self, role: CaseRole) -> tuple[str, str]:
         """Resolve provider and model for a given role using Gemini 2.5 Flash for testing.
@@ -326,6 +538,93 @@ class TrialService:
                           default_model) if role_key else default_model
         return model, provider
 
+    def _resolve_model_candidates_for_role(
+        self,
+        role: CaseRole,
+        phase: Optional[TrialPhase] = None,
+        action: Optional[str] = None,
+    ) -> List[tuple[str, str]]:
+        """Ordered (provider, model) candidates for a turn, primary first.
+
+        The primary comes from the routing rules for (role, phase, action),
+        unless the role has an environment override or no rule matches, in
+        which case _resolve_provider_and_model_for_role decides. Fallbacks
+        come from the role's environment overrides (e.g.
+        JUDGE_FALLBACK_PROVIDER/JUDGE_FALLBACK_MODEL, comma-separated for
+        several) followed by settings.llm.fallback_models.
+        """
+        role_key = get_enum_value(role).upper()
+        overridden = os.getenv(f"{role_key}_PROVIDER") or os.getenv(f"{role_key}_MODEL")
+        candidates = [] if overridden else self.model_router.route(role, phase, action)
+        if not candidates:
+            model, provider = self._resolve_provider_and_model_for_role(role)
+            candidates = [(provider.lower(), model)]
+
+        providers = [p.strip() for p in os.getenv(f"{role_key}_FALLBACK_PROVIDER", "").split(",") if p.strip()]
+        models = [m.strip() for m in os.getenv(f"{role_key}_FALLBACK_MODEL", "").split(",") if m.strip()]
+        candidates.extend((p.lower(), m) for p, m in zip(providers, models))
+        candidates.extend(parse_model(entry) for entry in settings.llm.fallback_models)
+
+        # Drop duplicates while keeping the order
+        return self.model_router.rank(list(dict.fromkeys(candidates)))
+
+    def _configure_agent(
+        self,
+        agent: AgentT,
+        fallbacks: List[tuple[str, str]],
+        phase: Optional[TrialPhase] = None,
+        action: Optional[str] = None,
+    ) -> AgentT:
+        """Attach fallback models and generation limits to a new agent.
+
+        Args:
+            agent: Freshly created agent
+            fallbacks: Failover (provider, model) candidates
+            phase: Trial phase, for generation limits
+            action: Turn action, for generation limits
+
+        Returns:
+            The configured agent
+        """
+        agent.fallback_models = fallbacks
+        limit = self.model_router.generation_limit(agent.role, phase, action)
+        if limit is not None:
+            agent.max_output_tokens = limit.max_tokens
+            agent.stop_sequences = list(dict.fromkeys([*agent.stop_sequences, *limit.stop]))
+        return agent
+
+    def _turn_action(
+        self,
+        session: TrialSession,
+        role: CaseRole,
+        context: Optional[Dict] = None,
+    ) -> Optional[str]:
+        """Classify a turn for model routing.
+
+        Args:
+            session: Trial session
+            role: Role taking the turn
+            context: Agent context; an explicit "action" wins
+
+        Returns:
+            Action name such as "procedural", "examination" or "closing"
+        """
+        if context and context.get("action"):
+            return context["action"]
+        phase = TrialPhase(get_enum_value(session.current_phase))
+        if role == CaseRole.WITNESS:
+            return "testimony"
+        if role == CaseRole.JUDGE:
+            return "verdict" if phase == TrialPhase.VERDICT else "procedural"
+        if role == CaseRole.JURY:
+            return "deliberation"
+        return {
+            TrialPhase.OPENING_STATEMENTS: "opening",
+            TrialPhase.WITNESS_EXAMINATION: "examination",
+            TrialPhase.CLOSING_ARGUMENTS: "closing",
+        }.get(phase)
+
+    @traced()
     async def get_agent_response(
         self,
         session_id: UUID,
@@ -372,21 +671,50 @@ class TrialService:
                 raise ValueError(
                     f"It's not {agent_name}'s turn to speak")
 
+        response = await self._generate_agent_turn(
+            session, agent_role, prompt, context)
+        return await self._commit_agent_turn(session_id, agent_role, response)
+
+    @traced()
+    async def _generate_agent_turn(
+        self,
+        session: TrialSession,
+        agent_role: CaseRole,
+        prompt: str,
+        context: Optional[Dict] = None,
+    ) -> AgentResponse:
+        """Generate an agent's response without touching the transcript or turn.
+
+        Args:
+            session: Trial session
+            agent_role: Role of the agent to respond
+            prompt: Prompt for the agent
+            context: Additional context
+
+        Returns:
+            Raw agent response
+
+        Raises:
+            ValueError: If the case, witness or agent role is invalid
+            AgentUnavailableError: If the LLM provider failed to respond
+        """
         # Get case data and attach to session for context
         case = await self.get_case(session.case_id)
         if case:
             # Add case data to session for agent context
             session.case_data = case
 
-        # Create appropriate agent
+        # Create appropriate agent, routed for this phase and action
+        phase = session.current_phase
+        action = self._turn_action(session, agent_role, context)
         if agent_role == CaseRole.JUDGE:
-            agent = self._create_judge_agent()
+            agent = self._create_judge_agent(phase, action)
         elif agent_role == CaseRole.PROSECUTOR:
-            agent = self._create_prosecutor_agent()
+            agent = self._create_prosecutor_agent(phase, action)
         elif agent_role == CaseRole.DEFENSE:
-            agent = self._create_defense_agent()
+            agent = self._create_defense_agent(phase, action)
         elif agent_role == CaseRole.JURY:
-            agent = self._create_jury_agent()
+            agent = self._create_jury_agent(phase, action)
         elif agent_role == CaseRole.WITNESS:
             # For witness, we need to get the specific witness data
             witness_name = context.get("witness_name") if context else None
@@ -401,28 +729,98 @@ class TrialService:
             if not witness:
                 raise ValueError(f"Witness {witness_name} not found")
 
-            agent = self._create_witness_agent(witness)
+            asked_by = context.get("attorney") or context.get("examination_type")
+            repeat = None
+            if settings.trial.asked_and_answered != "off":
+                repeat = self.asked_and_answered.find(session.id, witness.name, prompt, asked_by)
+                record_cache("asked_and_answered", repeat is not None)
+            if repeat is not None and settings.trial.asked_and_answered == "reuse":
+                # Already answered: repeat the testimony instead of generating it again
+                return AgentResponse(
+                    content=repeat.answer,
+                    role=CaseRole.WITNESS,
+                    metadata={"witness_name": witness.name, "asked_and_answered": True,
+                              "suggested_objection": repeat.objection_type.value,
+                              "original_question": repeat.question,
+                              "similarity": round(repeat.similarity, 3)},
+                )
+
+            agent = self._create_witness_agent(witness, case, phase, action)
+            if settings.trial.witness_memory:
+                agent.recalled_memory = self.witness_memory.recall(
+                    session.id, witness, prompt, settings.trial.witness_memory_top_k)
         else:
             raise ValueError(f"Invalid agent role: {agent_role}")
 
+        # Attach the shared role briefing instead of re-rendering the case
+        if case:
+            witness_name = context.get("witness_name") if context else None
+            agent.case_briefing = self.briefing_service.get_briefing(
+                case, agent_role, witness_name).text
+
+        # Refuse or degrade the turn as the session nears its budget
+        self.budgets.enforce(session, agent)
+
         # Get response from agent
-        response = await agent.respond(prompt, session, context)
+        async with self._agent_scope(session, agent):
+            response = await agent.respond(prompt, session, context)
+
+        # Never let provider failures reach the transcript as testimony
+        if response.metadata.get("error"):
+            raise AgentUnavailableError(
+                agent_role, response.metadata["error"],
+                rate_limited=response.metadata.get("error_type") == "rate_limited")
+
+        if agent_role == CaseRole.WITNESS:
+            if repeat is not None:
+                response.metadata["suggested_objection"] = repeat.objection_type.value
+                response.metadata["original_question"] = repeat.question
+            else:
+                self.asked_and_answered.record(
+                    session.id, witness.name, prompt, response.content, asked_by)
+            if settings.trial.witness_memory:
+                self.witness_memory.record_answer(session.id, witness, prompt, response.content)
+        return response
+
+    @traced()
+    async def _commit_agent_turn(
+        self,
+        session_id: UUID,
+        agent_role: CaseRole,
+        response: AgentResponse,
+        extra_metadata: Optional[Dict] = None,
+        advance_turn: bool = True,
+    ) -> str:
+        """Record a generated response and advance turn management.
 
-        # Parse turn management information from judge responses
-        turn_info = self._parse_turn_management_from_response(response.content)
+        Args:
+            session_id: Session ID
+            agent_role: Role of the agent that responded
+            response: Generated agent response
+            extra_metadata: Additional transcript metadata
+            advance_turn: Whether the response counts as a turn (witness
+                answers do not)
 
-        # Clean the response content by removing TURN_MANAGEMENT lines
-        cleaned_content = self._clean_response_content(response.content)
+        Returns:
+            Cleaned response content
+        """
+        # Split turn directives from the text in one pass
+        parsed = parse_directives(response.content)
+        turn_info = parsed.next_turn
+        cleaned_content = parsed.text
 
         # Add to transcript
         agent_name = format_case_role(agent_role)
-        await self.add_transcript_entry(
+        session = await self.add_transcript_entry(
             session_id,
             agent_name,
             cleaned_content,
             {"confidence": response.confidence,
-                "metadata": response.metadata, "turn_info": turn_info},
+                "metadata": response.metadata, "turn_info": turn_info,
+                **(extra_metadata or {})},
         )
+        if not advance_turn:
+            return cleaned_content
 
         # Update turn management
         session = self.turn_manager.update_turn_after_response(
@@ -432,47 +830,97 @@ class TrialService:
         if turn_info and agent_role == CaseRole.JUDGE:
             session.current_turn = turn_info
 
+        self._maybe_speculate(session)
+
         return cleaned_content
 
-    def _clean_response_content(self, response_content: str) -> str:
-        """Clean response content by removing TURN_MANAGEMENT lines.
+    def _maybe_speculate(self, session: TrialSession) -> None:
+        """Start generating the next AI turn in the background if enabled.
 
-        Args:
-            response_content: The agent's raw response content
+        The result is held in a per-session slot and only served if nothing
+        else was added to the transcript in the meantime.
 
-        Returns:
-            Cleaned response content without TURN_MANAGEMENT lines
+        Args:
+            session: Trial session whose turn was just assigned
         """
-        # Remove TURN_MANAGEMENT lines from the response
-        lines = response_content.split('\n')
-        cleaned_lines = []
-
-        for line in lines:
-            # Skip lines that contain TURN_MANAGEMENT
-            if not re.search(r'TURN_MANAGEMENT:\s*\w+', line, re.IGNORECASE):
-                cleaned_lines.append(line)
-
-        return '\n'.join(cleaned_lines).strip()
+        autopilot = session.id in self.autopilot_sessions
+        if autopilot:
+            # The autopilot drives the other phases with its own prompts
+            if session.current_phase not in _AUTOPILOT_PIPELINED_PHASES:
+                return
+        elif not settings.trial.speculative_generation:
+            return
+
+        self._discard_speculation(session.id)
+        role = self._coerce_role(session.current_turn)
+        # Witness turns need a witness name from the caller; user turns are
+        # only played by the autopilot
+        if role is None or role == CaseRole.WITNESS:
+            return
+        if role == self._user_case_role(session) and not autopilot:
+            return
+
+        prompt = self._get_turn_prompt_for_agent(role, session)
+        # Speculation only uses capacity interactive turns leave free
+        work = Work(BATCH if autopilot else SPECULATIVE, tenant=session.tenant_id)
+        with work_scope(work):
+            task = asyncio.create_task(
+                self._generate_agent_turn(session, role, prompt))
+        task.add_done_callback(_consume_task_exception)
+        self.speculative_turns[session.id] = SpeculativeTurn(
+            role=role,
+            phase=get_enum_value(session.current_phase),
+            transcript_length=len(session.transcript),
+            task=task,
+            work=work,
+        )
 
-    def _parse_turn_management_from_response(self, response_content: str) -> Optional[CaseRole]:
-        """Parse turn management information from agent response.
+    def _take_speculation(self, session: TrialSession, role: CaseRole) -> Optional["asyncio.Task[AgentResponse]"]:
+        """Claim the speculative generation for a session if it is still valid.
 
         Args:
-            response_content: The agent's response content
+            session: Trial session
+            role: Role whose turn is about to be served
 
         Returns:
-            CaseRole if turn management info found, None otherwise
+            The pending generation task, or None if there is no usable slot
         """
-        # Look for TURN_MANAGEMENT: pattern in response
-        turn_match = re.search(r'TURN_MANAGEMENT:\s*(\w+)',
-                               response_content, re.IGNORECASE)
-        if turn_match:
-            turn_role = turn_match.group(1).lower()
-            try:
-                return CaseRole(turn_role)
-            except ValueError:
-                pass
-        return None
+        slot = self.speculative_turns.pop(session.id, None)
+        if slot is None:
+            return None
+        if (slot.role != role
+                or slot.phase != get_enum_value(session.current_phase)
+                or slot.transcript_length != len(session.transcript)):
+            slot.task.cancel()
+            return None
+        if slot.work.priority == SPECULATIVE:
+            # Someone is now waiting for this turn: a user, or the autopilot
+            autopilot = session.id in self.autopilot_sessions
+            promote(slot.work, BATCH if autopilot else INTERACTIVE)
+        return slot.task
+
+    def _discard_speculation(self, session_id: UUID) -> None:
+        """Cancel and drop any speculative generation for a session.
+
+        Args:
+            session_id: Session ID
+        """
+        slot = self.speculative_turns.pop(session_id, None)
+        if slot is not None:
+            slot.task.cancel()
+
+    def _coerce_role(self, role: Optional[Union[CaseRole, str]]) -> Optional[CaseRole]:
+        """Convert a stored turn value to a CaseRole, or None if invalid."""
+        if role is None:
+            return None
+        try:
+            return CaseRole(get_enum_value(role).lower())
+        except ValueError:
+            return None
+
+    def _user_case_role(self, session: TrialSession) -> CaseRole:
+        """Get the case role played by the user."""
+        return CaseRole.DEFENSE if session.user_role == UserRole.DEFENSE else CaseRole.PROSECUTOR
 
     async def submit_evidence(
         self,
@@ -593,6 +1041,7 @@ class TrialService:
         objection_id: str,
         ruling: str,
         reason: str,
+        extra_metadata: Optional[Dict] = None,
     ) -> TrialSession:
         """Judge rules on an objection.
 
@@ -601,6 +1050,7 @@ class TrialService:
             objection_id: ID of the objection
             ruling: "sustained" or "overruled"
             reason: Reason for the ruling
+            extra_metadata: Additional transcript metadata
 
         Returns:
             Updated trial session
@@ -618,11 +1068,334 @@ class TrialService:
             "Judge",
             f"Objection {ruling}. {reason}",
             {"objection_ruling": True, "objection_id": objection_id,
-                "ruling": ruling, "reason": reason}
+                "ruling": ruling, "reason": reason, **(extra_metadata or {})}
         )
 
         return session
 
+    @traced()
+    async def request_objection_ruling(
+        self,
+        session_id: UUID,
+        objection_type: str,
+        reason: str,
+        question: Optional[str] = None,
+        examination_type: Optional[str] = None,
+        witness_name: Optional[str] = None,
+        asked_by: Optional[str] = None,
+        objection_id: Optional[str] = None,
+    ) -> ObjectionRuling:
+        """Have the court rule on an objection and record the ruling.
+
+        Clear-cut objections are ruled by the rule-based classifier without
+        an LLM call; the rest are served from the ruling cache or go to the
+        judge agent.
+
+        Args:
+            session_id: Session ID
+            objection_type: Type of objection (an ObjectionType value)
+            reason: Reason given for the objection
+            question: Question objected to; defaults to the last transcript entry
+            examination_type: "direct" or "cross", if known
+            witness_name: Witness being examined, for asked-and-answered checks
+            asked_by: Side that asked the question
+            objection_id: ID of the objection
+
+        Returns:
+            The ruling
+
+        Raises:
+            ValueError: If session not found
+            AgentUnavailableError: If the judge model failed to respond
+        """
+        session = self.active_sessions.get(session_id)
+        if not session:
+            raise ValueError(f"Trial session {session_id} not found")
+
+        # The classifier only sees the question itself: an inferred transcript
+        # entry may hold a preamble or several questions (not one compound one)
+        classified = question
+        if question is None:
+            question = next(
+                (entry["content"] for entry in reversed(session.transcript)
+                 if not entry.get("metadata", {}).get("objection")
+                 and not entry.get("metadata", {}).get("objection_ruling")),
+                None)
+            classified = last_question(question) if question else None
+
+        ruling = None
+        if settings.trial.objection_fast_path:
+            ruling = self._asked_and_answered_ruling(
+                session_id, objection_type, question, witness_name, asked_by)
+            if ruling is None:
+                ruling = fast_ruling(
+                    objection_type, classified, examination_type,
+                    settings.trial.objection_fast_path_confidence)
+
+        # Judge rulings are shared across sessions of the same case
+        cache_key = None
+        kind = objection_kind(objection_type)
+        case = await self.get_case(session.case_id)
+        if ruling is None and kind is not None and question and case is not None:
+            cache_key = self.ruling_cache.key(case, kind, question, examination_type)
+            cached = self.ruling_cache.get(cache_key)
+            if cached is not None:
+                ruling = cached.model_copy(update={"source": "cache"})
+        if ruling is None:
+            ruling = await self._judge_objection_ruling(session, objection_type, reason, question)
+            if cache_key is not None:
+                self.ruling_cache.put(cache_key, ruling)
+
+        await self.rule_on_objection(
+            session_id, objection_id or str(uuid4()), ruling.ruling, ruling.reason,
+            {"objection_type": objection_type, "ruling_source": ruling.source,
+             "ruling_confidence": ruling.confidence},
+        )
+        return ruling
+
+    def _asked_and_answered_ruling(
+        self,
+        session_id: UUID,
+        objection_type: str,
+        question: Optional[str],
+        witness_name: Optional[str],
+        asked_by: Optional[str],
+    ) -> Optional[ObjectionRuling]:
+        """Sustain an asked-and-answered objection the session history confirms."""
+        if objection_kind(objection_type) != ObjectionType.ASKED_AND_ANSWERED or not question or not witness_name:
+            return None
+        repeat = self.asked_and_answered.find(session_id, witness_name, question, asked_by)
+        if repeat is None:
+            return None
+        return ObjectionRuling(
+            ruling="sustained", confidence=repeat.similarity,
+            reason=f"The witness has already answered that question: {repeat.answer}")
+
+    @traced()
+    async def _judge_objection_ruling(
+        self,
+        session: TrialSession,
+        objection_type: str,
+        reason: str,
+        question: Optional[str],
+    ) -> ObjectionRuling:
+        """Ask the judge agent to rule on an objection.
+
+        Raises:
+            AgentUnavailableError: If the judge model failed to respond
+        """
+        case = await self.get_case(session.case_id)
+        if case:
+            session.case_data = case
+        agent = self._create_judge_agent(session.current_phase, "objection_ruling")
+        if case:
+            agent.case_briefing = self.briefing_service.get_briefing(case, CaseRole.JUDGE).text
+
+        self.budgets.enforce(session, agent)
+        async with self._agent_scope(session, agent):
+            response = await agent.rule_on_objection(objection_type, reason, session, question)
+        if response.metadata.get("error"):
+            raise AgentUnavailableError(
+                CaseRole.JUDGE, response.metadata["error"],
+                rate_limited=response.metadata.get("error_type") == "rate_limited")
+
+        ruling, explanation = parse_ruling(parse_directives(response.content).text)
+        return ObjectionRuling(
+            ruling=ruling, reason=explanation, confidence=response.confidence, source="judge")
+
+    @traced()
+    async def evaluate_for_jury(
+        self,
+        session_id: UUID,
+        mode: Optional[str] = None,
+        refresh: bool = False,
+    ) -> Dict[str, EvaluationTable]:
+        """Score all evidence and witnesses for the jury, cached per session.
+
+        The cached tables are reused until admitted evidence or testimony
+        changes. Failed evaluations are never cached.
+
+        Args:
+            session_id: Session ID
+            mode: "batch" (one call per table) or "parallel" fan-out;
+                defaults to settings.jury.evaluation_mode
+            refresh: Re-run the evaluation even if cached
+
+        Returns:
+            Evaluation tables keyed by "evidence" and "witness"
+
+        Raises:
+            ValueError: If session or case not found
+            AgentUnavailableError: If a scoring call failed
+        """
+        session = self.active_sessions.get(session_id)
+        if not session:
+            raise ValueError(f"Trial session {session_id} not found")
+
+        case = await self.get_case(session.case_id)
+        if not case:
+            raise ValueError(f"Case {session.case_id} not found")
+        session.case_data = case
+
+        evidence_items, testimonies = self._jury_evaluation_inputs(session, case)
+        inputs = _fingerprint(evidence_items, testimonies)
+        cached = self.jury_evaluations.get(session_id)
+        if cached and cached.inputs == inputs and not refresh:
+            return cached.tables
+
+        jury = self._create_jury_agent(session.current_phase, "evaluation")
+        jury.case_briefing = self.briefing_service.get_briefing(
+            case, CaseRole.JURY).text
+        mode = mode or settings.jury.evaluation_mode
+
+        self.budgets.enforce(session, jury)
+        async with self._agent_scope(session, jury):
+            evidence_table, witness_table = await asyncio.gather(
+                jury.evaluate_evidence_batch(evidence_items, session, mode=mode),
+                jury.assess_witnesses_batch(testimonies, session, mode=mode),
+            )
+
+        tables = {"evidence": evidence_table, "witness": witness_table}
+        self.jury_evaluations[session_id] = JuryEvaluation(inputs=inputs, tables=tables)
+        return tables
+
+    def _jury_evaluation_inputs(
+        self,
+        session: TrialSession,
+        case: Case,
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Admitted evidence and witness testimony the jury scores.
+
+        Args:
+            session: Trial session
+            case: Case being tried
+
+        Returns:
+            (evidence content keyed by title, testimony keyed by witness name)
+        """
+        evidence_items = {
+            evidence.title: evidence.content
+            for evidence in case.evidence if evidence.is_admitted
+        }
+        testimonies = {
+            witness.name: self._summarize_testimony(session, witness.name)
+            for witness in case.witnesses
+        }
+        return evidence_items, testimonies
+
+    def _summarize_testimony(self, session: TrialSession, witness_name: str, limit: int = 4) -> str:
+        """Join a witness's most recent answers from the transcript.
+
+        Args:
+            session: Trial session
+            witness_name: Witness whose answers to collect
+            limit: Maximum number of answers to include
+
+        Returns:
+            Recent answers, or a placeholder when the witness did not testify
+        """
+        answers = [
+            entry.get("content", "") for entry in session.transcript
+            if entry.get("metadata", {}).get("metadata", {}).get("witness_name") == witness_name
+        ]
+        return " ".join(answers[-limit:]) or "Did not testify."
+
+    @traced()
+    async def run_jury_deliberation(
+        self,
+        session_id: UUID,
+        jurors: Optional[int] = None,
+    ) -> DeliberationResult:
+        """Run a parallel panel deliberation and record the verdict.
+
+        Args:
+            session_id: Session ID
+            jurors: Panel size (defaults to settings.jury.size)
+
+        Returns:
+            Deliberation result with per-charge vote breakdown
+
+        Raises:
+            ValueError: If session or case not found, or not in deliberation
+            AgentUnavailableError: If a juror's LLM call failed
+        """
+        session = self.active_sessions.get(session_id)
+        if not session:
+            raise ValueError(f"Trial session {session_id} not found")
+
+        if not is_enum_or_string_equal(session.current_phase, TrialPhase.JURY_DELIBERATION):
+            raise ValueError("Jury can only deliberate during the jury deliberation phase")
+
+        case = await self.get_case(session.case_id)
+        if not case:
+            raise ValueError(f"Case {session.case_id} not found")
+        session.case_data = case
+
+        jury = self._create_jury_agent(session.current_phase, "deliberation")
+        jury.case_briefing = self.briefing_service.get_briefing(
+            case, CaseRole.JURY).text
+
+        self.budgets.enforce(session, jury)
+        async with self._agent_scope(session, jury):
+            result = await jury.deliberate_panel(
+                session,
+                charges=case.charges,
+                prosecution_summary=self._summarize_statements(session, CaseRole.PROSECUTOR),
+                defense_summary=self._summarize_statements(session, CaseRole.DEFENSE),
+                key_evidence=[
+                    f"{evidence.title}: {evidence.description}"
+                    for evidence in case.evidence if evidence.is_admitted
+                ],
+                judge_instructions=self._summarize_statements(session, CaseRole.JUDGE, limit=1),
+                jurors=jurors,
+                assessments=self._format_jury_evaluations(session, case),
+            )
+
+        await self.add_transcript_entry(
+            session_id,
+            format_case_role(CaseRole.JURY),
+            f"We, the jury, find the defendant: {result.verdict.verdict}",
+            {"jury_verdict": True, "vote_breakdown": result.verdict.vote_breakdown,
+             "charge_verdicts": result.charge_verdicts,
+             "jurors_voted": len(result.jurors), "stopped_early": result.stopped_early},
+        )
+        session.verdict = result.verdict
+
+        return result
+
+    def _format_jury_evaluations(self, session: TrialSession, case: Case) -> Optional[str]:
+        """Render cached jury evaluation tables for the deliberation prompt.
+
+        Returns None when nothing is cached or the evidence or testimony
+        changed since the tables were scored.
+        """
+        cached = self.jury_evaluations.get(session.id)
+        if not cached or cached.inputs != _fingerprint(*self._jury_evaluation_inputs(session, case)):
+            return None
+        return "\n".join(
+            f"{kind.title()}:\n{table.as_prompt_text()}"
+            for kind, table in cached.tables.items() if table.scores
+        )
+
+    def _summarize_statements(self, session: TrialSession, role: CaseRole, limit: int = 3) -> str:
+        """Join the most recent transcript statements made by a role.
+
+        Args:
+            session: Trial session
+            role: Role whose statements to collect
+            limit: Maximum number of statements to include
+
+        Returns:
+            Recent statements, or a placeholder when the role said nothing
+        """
+        speaker = format_case_role(role)
+        statements = [
+            entry.get("content", "") for entry in session.transcript
+            if entry.get("speaker") == speaker
+        ]
+        return "\n\n".join(statements[-limit:]) or "Nothing on the record."
+
+    @traced()
     async def complete_trial(
         self,
         session_id: UUID,
@@ -650,6 +1423,7 @@ class TrialService:
 
         return session
 
+    @traced()
     async def get_automatic_agent_response(
         self,
         session_id: UUID,
@@ -696,6 +1470,19 @@ class TrialService:
                     # Invalid current_turn value, return None
                     return None
 
+            # Serve the pre-generated turn if nothing changed since it started
+            speculative = None if context else self._take_speculation(
+                session, current_turn)
+            if speculative is not None:
+                transcript_length = len(session.transcript)
+                try:
+                    generated = await speculative
+                except Exception:
+                    generated = None
+                if generated is not None and len(session.transcript) == transcript_length:
+                    return await self._commit_agent_turn(
+                        session_id, current_turn, generated, {"speculative": True})
+
             # Create a generic prompt for the agent to respond
             prompt = self._get_turn_prompt_for_agent(current_turn, session)
             response = await self.get_agent_response(
@@ -705,10 +1492,186 @@ class TrialService:
                 context=context
             )
             return response
+        except (AgentUnavailableError, BudgetExceededError):
+            # Surface provider failures and spent budgets instead of pretending it's the user's turn
+            raise
         except Exception as e:
             # Log error getting automatic response
             return None
 
+    async def run_autopilot(
+        self,
+        session_id: UUID,
+        max_turns_per_phase: int = 8,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Play a whole trial with AI agents in every role, including the user's.
+
+        Turns follow the TurnManager and phases advance automatically. The
+        next opening/closing turn is generated while the previous event is
+        being consumed, and jury evaluation runs alongside closing arguments.
+
+        Args:
+            session_id: Session ID
+            max_turns_per_phase: Safety cap on turns taken in a single phase
+
+        Yields:
+            Transcript events: "turn", "phase", "deliberation" and "completed"
+
+        Raises:
+            ValueError: If session or case not found
+        """
+        session = self.active_sessions.get(session_id)
+        if not session:
+            raise ValueError(f"Trial session {session_id} not found")
+        case = await self.get_case(session.case_id)
+        if not case:
+            raise ValueError(f"Case {session.case_id} not found")
+
+        self.autopilot_sessions.add(session_id)
+        evaluation: Optional["asyncio.Task[Dict[str, EvaluationTable]]"] = None
+        try:
+            while session.current_phase != TrialPhase.COMPLETED:
+                phase = TrialPhase(get_enum_value(session.current_phase))
+
+                if phase == TrialPhase.SETUP:
+                    yield await self._autopilot_turn(session, CaseRole.JUDGE)
+
+                elif phase in (TrialPhase.OPENING_STATEMENTS, TrialPhase.CLOSING_ARGUMENTS):
+                    if phase == TrialPhase.CLOSING_ARGUMENTS and evaluation is None:
+                        # Evidence and testimony are final; score them in parallel
+                        evaluation = asyncio.create_task(self.evaluate_for_jury(session_id))
+                    for _ in range(max_turns_per_phase):
+                        role = self._coerce_role(session.current_turn)
+                        if role is None:
+                            break
+                        yield await self._autopilot_turn(session, role)
+
+                elif phase == TrialPhase.WITNESS_EXAMINATION:
+                    for witness in case.witnesses:
+                        async for event in self._autopilot_examine_witness(session, witness):
+                            yield event
+
+                elif phase == TrialPhase.JURY_DELIBERATION:
+                    if evaluation is not None:
+                        try:
+                            await evaluation
+                        except Exception:
+                            # Deliberate without precomputed assessments
+                            logger.warning(
+                                "Jury evaluation failed for session %s", session_id, exc_info=True)
+                    started = time.perf_counter()
+                    result = await self.run_jury_deliberation(session_id)
+                    yield {
+                        "type": "deliberation",
+                        "phase": phase.value,
+                        "verdict": result.verdict.verdict,
+                        "vote_breakdown": result.verdict.vote_breakdown,
+                        "charge_verdicts": result.charge_verdicts,
+                        "latency_ms": (time.perf_counter() - started) * 1000,
+                    }
+
+                elif phase == TrialPhase.VERDICT:
+                    verdict = session.verdict.verdict if session.verdict else "no verdict"
+                    yield await self._autopilot_turn(
+                        session, CaseRole.JUDGE,
+                        prompt=f"The jury has returned its verdict: {verdict}. "
+                               "Read the verdict into the record and conclude the trial.")
+                    await self.complete_trial(
+                        session_id, session.verdict or Verdict(verdict=verdict, reasoning=""))
+                    yield {
+                        "type": "completed",
+                        "phase": TrialPhase.COMPLETED.value,
+                        "verdict": session.verdict.model_dump(mode="json") if session.verdict else None,
+                        "turns": len(session.transcript),
+                    }
+                    break
+
+                next_phase = _NEXT_PHASE[phase]
+                await self.advance_trial_phase(session_id, next_phase)
+                yield {"type": "phase", "from_phase": phase.value, "phase": next_phase.value}
+        finally:
+            self.autopilot_sessions.discard(session_id)
+            self._discard_speculation(session_id)
+            if evaluation is not None and not evaluation.done():
+                evaluation.cancel()
+
+    @traced()
+    async def _autopilot_examine_witness(
+        self,
+        session: TrialSession,
+        witness: Witness,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Run direct then cross examination of one witness for the autopilot.
+
+        Args:
+            session: Trial session
+            witness: Witness to examine
+
+        Yields:
+            Turn events for attorney questions and witness answers
+        """
+        # Like a judge directive: the calling side examines first
+        session.current_turn = self._coerce_role(witness.called_by)
+        for examination_type in ("direct", "cross"):
+            attorney = self._coerce_role(session.current_turn)
+            if attorney is None:
+                return
+            question = await self._autopilot_turn(
+                session, attorney,
+                prompt=f"Conduct {examination_type} examination of {witness.name}. "
+                       "Ask your questions to the witness.")
+            yield question
+            yield await self._autopilot_turn(
+                session, CaseRole.WITNESS,
+                prompt=question["content"],
+                context={"witness_name": witness.name,
+                         "examination_type": examination_type,
+                         "attorney": attorney.value},
+            )
+
+    @traced()
+    async def _autopilot_turn(
+        self,
+        session: TrialSession,
+        role: CaseRole,
+        prompt: Optional[str] = None,
+        context: Optional[Dict] = None,
+    ) -> Dict[str, Any]:
+        """Generate and commit one autopilot turn.
+
+        Args:
+            session: Trial session
+            role: Role taking the turn
+            prompt: Prompt override; defaults to the standard turn prompt
+            context: Additional agent context
+
+        Returns:
+            Turn event
+        """
+        started = time.perf_counter()
+        response = None
+        speculative = None if prompt else self._take_speculation(session, role)
+        if speculative is not None:
+            try:
+                response = await speculative
+            except Exception:
+                response = None
+        if response is None:
+            response = await self._generate_agent_turn(
+                session, role, prompt or self._get_turn_prompt_for_agent(role, session), context)
+
+        content = await self._commit_agent_turn(
+            session.id, role, response, {"autopilot": True},
+            advance_turn=role != CaseRole.WITNESS)
+        return {
+            "type": "turn",
+            "phase": get_enum_value(session.current_phase),
+            "role": role.value,
+            "speaker": (context or {}).get("witness_name") or format_case_role(role),
+            "content": content,
+            "latency_ms": (time.perf_counter() - started) * 1000,
+        }
+
     def _get_turn_prompt_for_agent(self, agent_role: CaseRole, session: TrialSession) -> str:
         """Get an appropriate prompt for an agent based on their turn.
 
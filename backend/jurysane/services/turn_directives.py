@@ -0,0 +1,218 @@
+"""Parsing of turn directives embedded in agent responses.
+
+Judges end their turn with a directive line such as
+``TURN_MANAGEMENT: prosecutor``. A single pass over the response with a
+precompiled pattern yields both the text to show and the directives. Role
+names go through an alias table ("prosecution", "the state", ...), JSON
+responses from providers running in structured-output mode are accepted, and
+``DirectiveStreamParser`` does the same incrementally on streamed tokens.
+"""
+
+import json
+import re
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from ..models.trial import CaseRole
+
+DIRECTIVE_KEYS = ("turn_management", "next_speaker")
+
+ROLE_ALIASES: Dict[str, CaseRole] = {
+    "judge": CaseRole.JUDGE,
+    "court": CaseRole.JUDGE,
+    "the court": CaseRole.JUDGE,
+    "prosecutor": CaseRole.PROSECUTOR,
+    "prosecution": CaseRole.PROSECUTOR,
+    "prosecuting attorney": CaseRole.PROSECUTOR,
+    "state": CaseRole.PROSECUTOR,
+    "the state": CaseRole.PROSECUTOR,
+    "people": CaseRole.PROSECUTOR,
+    "the people": CaseRole.PROSECUTOR,
+    "government": CaseRole.PROSECUTOR,
+    "defense": CaseRole.DEFENSE,
+    "defence": CaseRole.DEFENSE,
+    "defense counsel": CaseRole.DEFENSE,
+    "defense attorney": CaseRole.DEFENSE,
+    "jury": CaseRole.JURY,
+    "jurors": CaseRole.JURY,
+    "the jury": CaseRole.JURY,
+    "witness": CaseRole.WITNESS,
+    "the witness": CaseRole.WITNESS,
+}
+
+# Directive key (optionally wrapped in markdown emphasis) through end of line
+_DIRECTIVE = re.compile(
+    r"[ \t]*[*_`]*\b(?P<key>TURN_MANAGEMENT|NEXT_SPEAKER)\b[*_`]*[ \t]*:[*_`]*[ \t]*"
+    r"(?P<value>[^\n]*)(?:\n|$)",
+    re.IGNORECASE,
+)
+_VALUE_NOISE = re.compile(r"[\[\]()*_`\"'.!,;]")
+_KEY_PREFIXES = tuple(key.upper() for key in DIRECTIVE_KEYS)
+
+
+class ParsedResponse(BaseModel):
+    """Response text with its directives separated out."""
+
+    text: str = Field(description="Response with directive lines removed")
+    directives: Dict[str, str] = Field(
+        default_factory=dict, description="Raw directive values by lower-case key")
+    next_turn: Optional[CaseRole] = Field(
+        default=None, description="Role the response hands the turn to, if recognized")
+
+
+def resolve_role(value: str) -> Optional[CaseRole]:
+    """Map a free-form role name to a CaseRole via the alias table.
+
+    Args:
+        value: Directive value, e.g. "Prosecution", "the defense" or "[defense]"
+
+    Returns:
+        Matching role, or None if unrecognized
+    """
+    name = " ".join(_VALUE_NOISE.sub(" ", value).lower().split())
+    if name in ROLE_ALIASES:
+        return ROLE_ALIASES[name]
+    # "the defense" -> "defense"
+    name = name[len("the "):] if name.startswith("the ") else name
+    if not name or name == "the":
+        return None
+    if name in ROLE_ALIASES:
+        return ROLE_ALIASES[name]
+    # "defense, present your opening" -> first word
+    return ROLE_ALIASES.get(name.split()[0])
+
+
+def _from_directives(text: str, directives: Dict[str, str]) -> ParsedResponse:
+    """Build a parsed response, resolving the next turn from the directives."""
+    next_turn = None
+    for key in DIRECTIVE_KEYS:
+        if key in directives:
+            next_turn = resolve_role(directives[key])
+            if next_turn is not None:
+                break
+    return ParsedResponse(text=text, directives=directives, next_turn=next_turn)
+
+
+def _parse_json(content: str) -> Optional[ParsedResponse]:
+    """Parse a structured-output response ({"response": ..., "turn_management": ...})."""
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or "response" not in data:
+        return None
+    directives = {
+        key.lower(): str(value) for key, value in data.items()
+        if key.lower() in DIRECTIVE_KEYS and value
+    }
+    return _from_directives(str(data["response"]).strip(), directives)
+
+
+def parse_directives(content: str) -> ParsedResponse:
+    """Split an agent response into clean text and turn directives.
+
+    Args:
+        content: Raw response (plain text with directive lines, or JSON)
+
+    Returns:
+        Clean text, raw directives and the resolved next turn
+    """
+    stripped = content.strip()
+    if stripped.startswith("{"):
+        parsed = _parse_json(stripped)
+        if parsed is not None:
+            return parsed
+
+    pieces: List[str] = []
+    directives: Dict[str, str] = {}
+    position = 0
+    for match in _DIRECTIVE.finditer(content):
+        pieces.append(content[position:match.start()])
+        value = match.group("value").strip()
+        if value:
+            # The last directive of a kind wins
+            directives[match.group("key").lower()] = value
+        position = match.end()
+    pieces.append(content[position:])
+
+    return _from_directives("".join(pieces).strip(), directives)
+
+
+class DirectiveStreamParser:
+    """Incremental directive parser for streamed responses.
+
+    ``feed`` returns the part of the text that can be shown immediately;
+    anything that might still turn out to be a directive is held back until
+    the line completes. JSON responses are buffered whole.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty parser."""
+        self._raw: List[str] = []
+        self._pending = ""
+        self._json: Optional[bool] = None
+
+    def feed(self, chunk: str) -> str:
+        """Consume a streamed chunk.
+
+        Args:
+            chunk: Next piece of the response
+
+        Returns:
+            Text safe to emit now (directives removed)
+        """
+        self._raw.append(chunk)
+        if self._json is None:
+            head = "".join(self._raw).lstrip()
+            if not head:
+                return ""
+            self._json = head.startswith("{")
+        if self._json:
+            return ""
+
+        self._pending += chunk
+        emitted: List[str] = []
+        while "\n" in self._pending:
+            line, self._pending = self._pending.split("\n", 1)
+            emitted.append(self._clean_line(line + "\n"))
+        safe, self._pending = self._split_pending(self._pending)
+        emitted.append(safe)
+        return "".join(emitted)
+
+    def close(self) -> Tuple[str, ParsedResponse]:
+        """Finish the stream.
+
+        Returns:
+            Remaining text to emit, and the parse of the whole response
+        """
+        parsed = parse_directives("".join(self._raw))
+        if self._json:
+            return parsed.text, parsed
+        tail = self._clean_line(self._pending)
+        self._pending = ""
+        return tail, parsed
+
+    @staticmethod
+    def _clean_line(line: str) -> str:
+        """Drop a directive from a complete line."""
+        return _DIRECTIVE.sub("", line)
+
+    @staticmethod
+    def _split_pending(pending: str) -> Tuple[str, str]:
+        """Split an unfinished line into (emit now, hold back)."""
+        upper = pending.upper()
+        for key in _KEY_PREFIXES:
+            index = upper.find(key)
+            if index != -1:
+                # Keep any markdown emphasis with the directive
+                while index > 0 and pending[index - 1] in " \t*_`":
+                    index -= 1
+                return pending[:index], pending[index:]
+
+        # Hold back a trailing partial key, e.g. "...TURN_MAN"
+        for length in range(min(len(pending), max(map(len, _KEY_PREFIXES))), 0, -1):
+            suffix = upper[-length:].lstrip("*_`")
+            if suffix and any(key.startswith(suffix) for key in _KEY_PREFIXES):
+                return pending[:-length], pending[-length:]
+        return pending, ""
@@ -4,6 +4,7 @@ from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from ..models.trial import CaseRole, TrialPhase, TrialSession, UserRole
+from ..tracing import traced
 from ..utils import get_enum_value, is_enum_or_string_equal
 
 
@@ -23,6 +24,7 @@ class TurnManager:
             TrialPhase.COMPLETED: []
         }
 
+    @traced()
     def get_next_turn(
         self,
         session: TrialSession,
@@ -152,6 +154,7 @@ class TurnManager:
 
         return False
 
+    @traced()
     def update_turn_after_response(
         self,
         session: TrialSession,
@@ -181,6 +184,7 @@ class TurnManager:
 
         return session
 
+    @traced()
     def initialize_turn_for_phase(
         self,
         session: TrialSession
@@ -0,0 +1,180 @@
+"""Retrieval memory for witnesses.
+
+Each (session, witness) pair gets a small in-process cosine index over the
+witness's knowledge and background, split into sentence chunks, plus every
+answer the witness has given. Before a witness answers, the chunks closest
+to the question are retrieved and added to its prompt, so the persona in
+the system prompt can stay compact while answers remain consistent with
+earlier testimony.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from ..models.trial import Witness
+from .case_briefing import compact_text
+from .embeddings import EmbeddingService, get_embedding_service
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+
+def chunk_text(text: str, max_chars: int = 240) -> List[str]:
+    """Split text into sentence-aligned chunks of at most ``max_chars``.
+
+    Args:
+        text: Text to split
+        max_chars: Target chunk size
+
+    Returns:
+        Non-empty chunks
+    """
+    chunks: List[str] = []
+    current = ""
+    for sentence in _SENTENCE_SPLIT.split(text.strip()):
+        if current and len(current) + len(sentence) + 1 > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}".strip()
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class MemoryHit(BaseModel):
+    """A retrieved memory chunk."""
+
+    text: str = Field(description="Chunk text")
+    kind: str = Field(description="knowledge, background or testimony")
+    score: float = Field(description="Cosine similarity to the query")
+
+
+class WitnessMemoryIndex:
+    """Cosine index over one witness's chunks; search is a single matmul."""
+
+    def __init__(self, embeddings: Optional[EmbeddingService] = None):
+        """Initialize an empty index.
+
+        Args:
+            embeddings: Embedding service; defaults to the shared one
+        """
+        self.embeddings = embeddings or get_embedding_service()
+        self.vectors = np.zeros((0, self.embeddings.dim), dtype=np.float32)
+        self.texts: List[str] = []
+        self.kinds: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def add(self, texts: List[str], kind: str) -> None:
+        """Embed and add chunks.
+
+        Args:
+            texts: Chunks to add
+            kind: Source of the chunks
+        """
+        texts = [text for text in texts if text.strip()]
+        if not texts:
+            return
+        self.vectors = np.vstack([self.vectors, self.embeddings.encode(texts)])
+        self.texts.extend(texts)
+        self.kinds.extend([kind] * len(texts))
+
+    def search(self, query: str, k: int = 4, min_score: float = 0.05) -> List[MemoryHit]:
+        """Find the chunks most similar to a query.
+
+        Args:
+            query: Question being asked
+            k: Maximum hits
+            min_score: Similarity below which hits are dropped
+
+        Returns:
+            Hits, most similar first
+        """
+        if not self.texts or k <= 0:
+            return []
+        scores = self.vectors @ self.embeddings.encode([query])[0]
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            MemoryHit(text=self.texts[i], kind=self.kinds[i], score=float(scores[i]))
+            for i in top if scores[i] >= min_score
+        ]
+
+
+class WitnessMemoryService:
+    """Per-session, per-witness retrieval indexes."""
+
+    def __init__(self, chunk_chars: int = 240, answer_chars: int = 320):
+        """Initialize the service.
+
+        Args:
+            chunk_chars: Chunk size for knowledge and background
+            answer_chars: Maximum stored length of each question/answer pair
+        """
+        self.chunk_chars = chunk_chars
+        self.answer_chars = answer_chars
+        self._indexes: Dict[Tuple[UUID, str], WitnessMemoryIndex] = {}
+
+    def get_index(self, session_id: UUID, witness: Witness) -> WitnessMemoryIndex:
+        """Get a witness's index, building it from the witness data on first use.
+
+        Args:
+            session_id: Trial session
+            witness: Witness whose memory to load
+
+        Returns:
+            The witness's index for the session
+        """
+        key = (session_id, witness.name)
+        index = self._indexes.get(key)
+        if index is None:
+            index = WitnessMemoryIndex()
+            index.add(chunk_text(witness.knowledge, self.chunk_chars), "knowledge")
+            index.add(chunk_text(witness.background, self.chunk_chars), "background")
+            self._indexes[key] = index
+        return index
+
+    def recall(self, session_id: UUID, witness: Witness, question: str, k: int = 4) -> Optional[str]:
+        """Render the memories most relevant to a question for the prompt.
+
+        Args:
+            session_id: Trial session
+            witness: Witness being asked
+            question: Question text
+            k: Maximum memories to include
+
+        Returns:
+            Prompt block, or None when nothing relevant was found
+        """
+        hits = self.get_index(session_id, witness).search(question, k)
+        if not hits:
+            return None
+        lines = []
+        for hit in hits:
+            label = "You testified" if hit.kind == "testimony" else "You know"
+            lines.append(f"- {label}: {hit.text}")
+        return "\n".join(lines)
+
+    def record_answer(self, session_id: UUID, witness: Witness, question: str, answer: str) -> None:
+        """Remember an answer so later testimony stays consistent.
+
+        Args:
+            session_id: Trial session
+            witness: Witness who answered
+            question: Question asked
+            answer: Witness's answer
+        """
+        pair = f"Asked: {compact_text(question, 120)} Answered: {answer}"
+        self.get_index(session_id, witness).add(
+            [compact_text(pair, self.answer_chars)], "testimony")
+
+    def drop_session(self, session_id: UUID) -> None:
+        """Forget every witness index of a session."""
+        for key in [key for key in self._indexes if key[0] == session_id]:
+            del self._indexes[key]
@@ -0,0 +1,261 @@
+"""Lightweight request tracing.
+
+Spans are opened with ``span(name)`` or the ``traced`` decorator and nest
+through a context variable, so one trace follows a request from its route
+through ``TrialService`` and the turn manager down to each agent's context
+building, provider queueing and LLM call. A span opened with no parent starts
+a new trace, kept with probability ``settings.tracing.sample_rate``; every
+span of a dropped trace is a no-op. Finished traces are written to stdout or
+a JSON-lines file, one span per line, using OpenTelemetry's field names and
+W3C ``traceparent`` IDs.
+
+With tracing disabled, ``span`` and ``traced`` cost one flag check.
+"""
+
+import asyncio
+import functools
+import json
+import os
+import random
+import re
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple, TypeVar
+
+from .config import TracingConfig, settings
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+# Marks the current context as belonging to a trace that was not sampled
+_DROPPED = object()
+
+# Span that new spans are nested under
+_current_span: ContextVar[Any] = ContextVar("current_span", default=None)
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """Parse a W3C ``traceparent`` header.
+
+    Args:
+        header: Header value, e.g. "00-<trace id>-<parent id>-01"
+
+    Returns:
+        (trace ID, parent span ID, sampled), or None if missing or malformed
+    """
+    match = _TRACEPARENT.match((header or "").strip().lower())
+    if match is None:
+        return None
+    return match.group(1), match.group(2), bool(int(match.group(3), 16) & 1)
+
+
+class _Trace:
+    """Spans finished so far in one trace."""
+
+    __slots__ = ("trace_id", "sampled", "spans")
+
+    def __init__(self, trace_id: str, sampled: bool):
+        self.trace_id = trace_id
+        self.sampled = sampled
+        self.spans: List["Span"] = []
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = ("name", "span_id", "parent_id", "attributes", "status", "start_ns", "end_ns",
+                 "_trace", "_root")
+
+    def __init__(self, name: str, trace: _Trace, parent_id: Optional[str], root: bool):
+        self.name = name
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attributes: Dict[str, Any] = {}
+        self.status = "ok"
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self._trace = trace
+        self._root = root
+
+    @property
+    def trace_id(self) -> str:
+        return self._trace.trace_id
+
+    @property
+    def traceparent(self) -> str:
+        """This span as a W3C ``traceparent`` header value."""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self._trace.sampled else '00'}"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute (strings, numbers and booleans export as-is)."""
+        self.attributes[key] = value
+
+    def finish(self) -> None:
+        """End the span; ending a trace's root span exports the trace."""
+        self.end_ns = time.time_ns()
+        trace = self._trace
+        trace.spans.append(self)
+        if not self._root:
+            return
+        slow_ms = settings.tracing.slow_trace_ms
+        if trace.sampled or (slow_ms is not None and (self.end_ns - self.start_ns) / 1e6 >= slow_ms):
+            get_exporter().export(trace.spans)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The span in OpenTelemetry's JSON field names."""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id,
+            "name": self.name,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "durationMs": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "status": self.status,
+            "attributes": {key: value if isinstance(value, (str, int, float, bool)) else str(value)
+                           for key, value in self.attributes.items()},
+        }
+
+
+class SpanExporter:
+    """Writes finished traces as JSON lines to a stream."""
+
+    def __init__(self, stream: TextIO):
+        """Initialize the exporter.
+
+        Args:
+            stream: Text stream the spans are written to
+        """
+        self.stream = stream
+
+    def export(self, spans: List[Span]) -> None:
+        """Write a trace's spans, one JSON object per line."""
+        try:
+            self.stream.write("".join(json.dumps(span.as_dict()) + "\n" for span in spans))
+            self.stream.flush()
+        except (OSError, ValueError):
+            # Tracing must never fail the request it observes
+            pass
+
+
+_exporter: Optional[SpanExporter] = None
+
+
+def get_exporter() -> SpanExporter:
+    """Exporter for ``settings.tracing``, created on first use."""
+    global _exporter
+    if _exporter is None:
+        _exporter = _build_exporter(settings.tracing)
+    return _exporter
+
+
+def _build_exporter(config: TracingConfig) -> SpanExporter:
+    if config.exporter == "file":
+        directory = os.path.dirname(config.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return SpanExporter(open(config.file_path, "a", encoding="utf-8"))
+    return SpanExporter(sys.stdout)
+
+
+def set_exporter(exporter: Optional[SpanExporter]) -> None:
+    """Replace the exporter (None rebuilds it from settings on next use)."""
+    global _exporter
+    _exporter = exporter
+
+
+def current_span() -> Optional[Span]:
+    """The innermost recording span, if any."""
+    current = _current_span.get()
+    return current if isinstance(current, Span) else None
+
+
+def _start_span(name: str, parent: Optional[Span], traceparent: Optional[str]) -> Optional[Span]:
+    """Open a child of ``parent``, or the root of a new (possibly continued) trace."""
+    if parent is not None:
+        return Span(name, parent._trace, parent.span_id, root=False)
+    remote = parse_traceparent(traceparent)
+    if remote is not None:
+        trace_id, parent_id, sampled = remote
+    else:
+        trace_id, parent_id = os.urandom(16).hex(), None
+        sampled = random.random() < settings.tracing.sample_rate
+    if not sampled and settings.tracing.slow_trace_ms is None:
+        return None
+    return Span(name, _Trace(trace_id, sampled), parent_id, root=True)
+
+
+@contextmanager
+def span(
+    name: str,
+    attributes: Optional[Dict[str, Any]] = None,
+    traceparent: Optional[str] = None,
+) -> Iterator[Optional[Span]]:
+    """Time a block as a span of the current trace.
+
+    Args:
+        name: Span name
+        attributes: Initial attributes
+        traceparent: Incoming W3C header to continue, for root spans
+
+    Yields:
+        The span, or None when tracing is off or the trace is not sampled
+    """
+    if not settings.tracing.enabled:
+        yield None
+        return
+    parent = _current_span.get()
+    current = None if parent is _DROPPED else _start_span(name, parent, traceparent)
+    if current is None:
+        token = _current_span.set(_DROPPED)
+        try:
+            yield None
+        finally:
+            _current_span.reset(token)
+        return
+
+    if attributes:
+        current.attributes.update(attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.status = "error"
+        current.attributes["exception.type"] = type(e).__name__
+        current.attributes["exception.message"] = str(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        current.finish()
+
+
+def traced(name: Optional[str] = None) -> Callable[[F], F]:
+    """Decorator running a function (sync or async) inside a span.
+
+    Args:
+        name: Span name; defaults to the function's qualified name
+    """
+    def decorate(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not settings.tracing.enabled:
+                    return await func(*args, **kwargs)
+                with span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not settings.tracing.enabled:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
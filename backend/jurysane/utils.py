@@ -1,8 +1,11 @@
 """Utility functions for the JurySane application."""
 
-from typing import Any, Union
+import asyncio
+from typing import Any, Awaitable, List, TypeVar, Union
 from enum import Enum
 
+T = TypeVar("T")
+
 
 def get_enum_value(obj: Union[Enum, str, Any]) -> str:
     """Safely get enum value or string representation.
@@ -92,3 +95,25 @@ def is_enum_or_string_equal(obj1: Any, obj2: Any) -> bool:
     val1 = get_enum_value(obj1)
     val2 = get_enum_value(obj2)
     return val1 == val2
+
+
+async def gather_with_concurrency(limit: int, *aws: Awaitable[T]) -> List[T]:
+    """Run awaitables concurrently with at most ``limit`` in flight.
+
+    Coroutines are not started until a slot is free, so work queued behind
+    the limit can still observe state changed by earlier completions.
+
+    Args:
+        limit: Maximum number of awaitables running at once
+        *aws: Awaitables to run
+
+    Returns:
+        Results in the same order as the inputs
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws))
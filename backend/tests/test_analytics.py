@@ -0,0 +1,106 @@
+"""Test simulation analytics."""
+
+from uuid import uuid4
+
+import numpy as np
+
+from jurysane.agents.usage import UsageTracker, usage_scope
+from jurysane.analytics import (
+    GUILTY,
+    grouped_percentiles,
+    load_simulation_arrays,
+    summarize,
+    wilson_interval,
+)
+
+
+def _usage(tokens):
+    """Usage summary in the shape the simulation stores."""
+    tracker = UsageTracker()
+    session_id = uuid4()
+    with usage_scope(session_id, "closing_arguments"):
+        tracker.record("prosecutor", {"prompt_tokens": tokens - 100, "completion_tokens": 100,
+                                      "cost_usd": 0.0, "latency_ms": 10.0})
+    return tracker.session_summary(session_id)
+
+
+def _record(case_title, verdict, guilty_votes, latencies, tokens=None, trial_index=None, status="ok"):
+    """Build a minimal simulation record."""
+    record = {
+        "case_title": case_title,
+        "status": status,
+        "verdict": {
+            "verdict": verdict,
+            "vote_breakdown": {"Theft: guilty": guilty_votes,
+                               "Theft: not_guilty": 12 - guilty_votes},
+        },
+        "charge_verdicts": {"Theft": verdict},
+        "turns": [{"latency_ms": latency} for latency in latencies],
+        "usage": _usage(tokens) if tokens is not None else None,
+        "duration_ms": sum(latencies),
+    }
+    if trial_index is not None:
+        record["trial_index"] = trial_index
+    return record
+
+
+def test_grouped_percentiles_match_numpy():
+    """Test grouped percentiles against np.percentile per group."""
+    rng = np.random.default_rng(0)
+    groups = rng.integers(0, 4, size=200)
+    values = rng.normal(size=200)
+
+    result = grouped_percentiles(groups, values, 5, [0, 50, 95, 100])
+
+    for group in range(4):
+        expected = np.percentile(values[groups == group], [0, 50, 95, 100])
+        np.testing.assert_allclose(result[group], expected)
+    assert np.isnan(result[4]).all()
+
+
+def test_wilson_interval_bounds():
+    """Test Wilson intervals contain the observed rate."""
+    bounds = wilson_interval(np.array([0, 5, 10]), np.array([10, 10, 10]))
+    assert bounds[0, 0] == 0.0
+    assert bounds[1, 0] < 0.5 < bounds[1, 1]
+    assert bounds[2, 1] == 1.0
+
+
+def test_summarize_per_case():
+    """Test per-case verdict rates, vote histograms and latency percentiles."""
+    arrays = load_simulation_arrays([
+        _record("State v. A", "Guilty", 12, [100, 200], tokens=1000),
+        _record("State v. A", "Hung", 7, [300], tokens=3000),
+        _record("State v. B", "Not Guilty", 0, [50]),
+    ])
+
+    reports = summarize(arrays, percentiles=[50])
+
+    assert arrays.trial_verdict[0] == GUILTY
+    a, b = reports
+    assert a.trials == 2
+    assert a.verdict_rates["Guilty"] == 0.5
+    assert a.verdict_rates["Hung"] == 0.5
+    assert a.turn_latency_ms["p50"] == 200
+    assert a.tokens["p50"] == 2000
+    assert a.charge_vote_distributions["Theft"][12] == 1
+    assert a.charge_vote_distributions["Theft"][7] == 1
+    assert b.verdict_rates["Not Guilty"] == 1.0
+    assert np.isnan(b.tokens["p50"])
+
+
+def test_resumed_runs_count_each_trial_once():
+    """Test a re-run trial replaces its failed record and errors stay out of verdict rates."""
+    arrays = load_simulation_arrays([
+        _record("State v. A", None, 0, [100], trial_index=0, status="error"),
+        _record("State v. A", "Guilty", 12, [100], trial_index=1),
+        _record("State v. A", None, 0, [100], trial_index=2, status="error"),
+        _record("State v. A", "Guilty", 12, [100], trial_index=0),
+    ])
+
+    (report,) = summarize(arrays, percentiles=[50])
+
+    assert report.trials == 3 and report.errors == 1
+    assert report.verdict_rates["Guilty"] == 1.0
+    assert report.verdict_rates["No Verdict"] == 0.0
+    assert report.guilty_rate_ci[1] == 1.0
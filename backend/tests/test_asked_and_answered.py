@@ -0,0 +1,32 @@
+"""Test repeated-question detection."""
+
+from uuid import uuid4
+
+from jurysane.services.asked_and_answered import AskedAndAnsweredDetector
+
+
+def test_rephrased_question_is_detected():
+    """Test a rephrasing by the same side matches the earlier answer."""
+    detector = AskedAndAnsweredDetector()
+    session_id = uuid4()
+    detector.record(session_id, "Ana", "Where were you on the night of March 3rd?",
+                    "At the store.", "prosecutor")
+
+    repeat = detector.find(session_id, "Ana",
+                           "So, again, where were you on the night of March 3rd?", "prosecutor")
+
+    assert repeat is not None
+    assert repeat.answer == "At the store."
+    assert repeat.objection_type.value == "asked_and_answered"
+
+
+def test_different_question_or_side_is_not_detected():
+    """Test new questions and the other side's questions pass through."""
+    detector = AskedAndAnsweredDetector()
+    session_id = uuid4()
+    detector.record(session_id, "Ana", "Where were you on the night of March 3rd?",
+                    "At the store.", "prosecutor")
+
+    assert detector.find(session_id, "Ana", "What did the robber carry?", "prosecutor") is None
+    assert detector.find(session_id, "Ana", "Where were you on the night of March 3rd?",
+                         "defense") is None
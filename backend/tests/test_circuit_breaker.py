@@ -0,0 +1,95 @@
+"""Test the provider circuit breaker."""
+
+import asyncio
+
+import pytest
+from langchain.schema import HumanMessage
+
+from jurysane.agents import JudgeAgent, circuit_breaker
+from jurysane.agents.base import BaseAgent
+from jurysane.agents.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from jurysane.config import CircuitBreakerConfig
+
+
+class _Clock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", clock)
+    return clock
+
+
+def _open_breaker(clock):
+    breaker = CircuitBreaker("test", CircuitBreakerConfig(min_calls=2, open_seconds=30.0))
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker
+
+
+def test_breaker_opens_probes_and_closes(clock):
+    """Test closed -> open -> half-open -> closed, and a failed probe reopening."""
+    breaker = _open_breaker(clock)
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+
+    clock.now += 31
+    assert breaker.allow_request()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow_request()  # One probe at a time
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    clock.now += 31
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow_request()
+
+
+def test_cancelled_or_lost_probe_frees_its_slot(clock):
+    """Test a probe without an outcome does not block the provider forever."""
+    breaker = _open_breaker(clock)
+    clock.now += 31
+    assert breaker.allow_request()
+    breaker.release_probe()
+    assert breaker.allow_request()
+
+    # A probe that never reports back is given up after a cool-down
+    assert not breaker.allow_request()
+    clock.now += 31
+    assert breaker.allow_request()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_llm_call_releases_half_open_probe(monkeypatch, clock):
+    """Test cancelling an agent's probe call leaves the breaker usable."""
+    started = asyncio.Event()
+
+    class HangingLLM:
+        async def ainvoke(self, messages, **kwargs):
+            started.set()
+            await asyncio.Event().wait()
+
+    monkeypatch.setattr(BaseAgent, "_build_llm", lambda self, provider, model: HangingLLM())
+    breaker = _open_breaker(clock)
+    monkeypatch.setitem(circuit_breaker._breakers, "breaker-test", breaker)
+    clock.now += 31
+    agent = JudgeAgent(model_name="model", provider_name="breaker-test")
+
+    call = asyncio.create_task(agent._invoke_llm([HumanMessage(content="Hi")], [], {}))
+    await started.wait()
+    assert breaker.state == HALF_OPEN and not breaker.allow_request()
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+
+    assert breaker.allow_request()
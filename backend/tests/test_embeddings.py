@@ -0,0 +1,34 @@
+"""Test the embedding service and its cache."""
+
+import numpy as np
+
+from jurysane.config import EmbeddingConfig
+from jurysane.services.embeddings import EmbeddingMatrix, EmbeddingService
+
+
+def _service(cache_dir):
+    return EmbeddingService(EmbeddingConfig(backend="hashing", cache_dir=str(cache_dir), batch_size=2))
+
+
+def test_cache_persists_across_instances(tmp_path):
+    """Test vectors are reloaded from the memory-mapped cache."""
+    texts = ["the defendant left at noon", "the car was red", "it rained", "the car was red"]
+    first = _service(tmp_path).encode(texts)
+
+    reopened = _service(tmp_path)
+    assert len(reopened.cache.rows) == 3
+    np.testing.assert_array_equal(reopened.encode(texts), first)
+    np.testing.assert_allclose(np.linalg.norm(first, axis=1), 1.0, rtol=1e-5)
+
+
+def test_quantized_similarity_matches_float32(tmp_path):
+    """Test float16 and int8 matrices rank like float32."""
+    service = _service(tmp_path)
+    docs = ["witness saw the car", "the knife was in the kitchen", "alibi at the cinema"]
+    query = service.encode(["what car did the witness see"])[0]
+
+    exact = service.matrix(docs, "float32").similarity(query)
+    for mode in ("float16", "int8"):
+        scores = EmbeddingMatrix(service.encode(docs), mode).similarity(query)
+        np.testing.assert_allclose(scores, exact, atol=0.02)
+        assert int(np.argmax(scores)) == 0
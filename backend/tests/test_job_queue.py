@@ -0,0 +1,67 @@
+"""Test the background agent-turn job queue."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from jurysane.config import JobConfig
+from jurysane.services.job_queue import (
+    BATCH,
+    CANCELLED,
+    INTERACTIVE,
+    SUCCEEDED,
+    JobQueue,
+)
+
+
+@pytest.mark.asyncio
+async def test_jobs_keep_session_order_and_prefer_interactive():
+    """Test a session's jobs run in order and interactive sessions go first."""
+    queue = JobQueue(JobConfig(workers=1))
+    started = []
+    release = asyncio.Event()
+
+    def turn(name, wait=False):
+        async def run():
+            started.append(name)
+            if wait:
+                await release.wait()
+            return name
+        return run
+
+    batch_session, interactive_session = uuid4(), uuid4()
+    first = queue.submit(batch_session, "auto-response", turn("batch-1", wait=True), BATCH)
+    await asyncio.sleep(0)
+    second = queue.submit(batch_session, "auto-response", turn("batch-2"), BATCH)
+    queue.submit(interactive_session, "auto-response", turn("interactive"), INTERACTIVE)
+
+    release.set()
+    async for job in queue.watch(second.id):
+        pass
+
+    assert started == ["batch-1", "interactive", "batch-2"]
+    assert queue.get(first.id).result == "batch-1"
+    assert job.status == SUCCEEDED and job.result == "batch-2"
+    await queue.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancel_queued_and_running_jobs():
+    """Test cancelling a running job and one queued behind it."""
+    queue = JobQueue(JobConfig(workers=1))
+    session_id = uuid4()
+
+    async def forever():
+        await asyncio.Event().wait()
+
+    running = queue.submit(session_id, "auto-response", forever)
+    queued = queue.submit(session_id, "auto-response", forever)
+    await asyncio.sleep(0)
+
+    assert queue.cancel(queued.id).status == CANCELLED
+    queue.cancel(running.id)
+    async for job in queue.watch(running.id):
+        pass
+    assert job.status == CANCELLED
+    await queue.shutdown()
@@ -0,0 +1,129 @@
+"""Test jury scoring and panel deliberation."""
+
+import re
+from uuid import uuid4
+
+import pytest
+from langchain.schema import AIMessage
+
+from jurysane.agents import JuryAgent
+from jurysane.agents.base import AgentUnavailableError, BaseAgent
+from jurysane.models.trial import TrialPhase, TrialSession, UserRole
+
+CHARGES = ["Robbery", "Assault"]
+
+
+class _StubLLM:
+    """Answers every call with ``reply(prompt text)``."""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = 0
+
+    async def ainvoke(self, messages, **kwargs):
+        self.calls += 1
+        return AIMessage(content=self.reply("\n".join(str(message.content) for message in messages)))
+
+
+def _jury(monkeypatch, reply):
+    llm = _StubLLM(reply)
+    monkeypatch.setattr(BaseAgent, "_build_llm", lambda self, provider, model: llm)
+    return JuryAgent(model_name="model", provider_name="jury-test"), llm
+
+
+def _session():
+    return TrialSession(
+        id=uuid4(), case_id=uuid4(), user_role=UserRole.DEFENSE,
+        current_phase=TrialPhase.JURY_DELIBERATION)
+
+
+async def _deliberate(jury, jurors, require_unanimous):
+    return await jury.deliberate_panel(
+        _session(), charges=CHARGES, prosecution_summary="", defense_summary="",
+        key_evidence=[], judge_instructions="", jurors=jurors, max_concurrency=1,
+        require_unanimous=require_unanimous)
+
+
+@pytest.mark.asyncio
+async def test_batch_scores_tolerate_malformed_and_missing_items(monkeypatch):
+    """Test ITEM lines are parsed by number; bad, out-of-range and missing lines leave items unscored."""
+    reply = """Here are my scores:
+ITEM 2 | SCORE 7 | Consistent with the timeline
+item #1 | score: 12/10
+ITEM 3 | SCORE high | Not a number
+ITEM 9 | SCORE 5 | No such item"""
+    jury, llm = _jury(monkeypatch, lambda prompt: reply)
+    items = {"Knife": "Recovered at the scene", "Video": "CCTV footage",
+             "Receipt": "Store receipt", "Phone": "Call records"}
+
+    table = await jury.evaluate_evidence_batch(items, _session())
+
+    assert llm.calls == 1
+    assert [row.item for row in table.scores] == list(items)
+    assert [row.score for row in table.scores] == [10.0, 7.0, None, None]
+    assert table.scores[1].rationale == "Consistent with the timeline"
+    assert table.scores[0].rationale == ""
+
+
+@pytest.mark.asyncio
+async def test_panel_stops_once_unanimity_is_impossible(monkeypatch):
+    """Test a unanimous panel stops after one split per charge, tallying votes per charge."""
+    def reply(prompt):
+        juror = int(re.search(r"juror #(\d+)", prompt).group(1))
+        vote = "GUILTY" if juror % 2 else "NOT GUILTY"
+        return f"VOTE: Robbery = {vote}\nVOTE: Assault = {vote}\nVOTE: Arson = GUILTY\nSUMMARY: Juror {juror}."
+
+    jury, llm = _jury(monkeypatch, reply)
+    result = await _deliberate(jury, jurors=6, require_unanimous=True)
+
+    assert llm.calls == 2
+    assert result.stopped_early and result.jurors_seated == 6
+    assert result.charge_verdicts == {"Robbery": "Hung", "Assault": "Hung"}
+    assert result.verdict.vote_breakdown == {
+        "Robbery: guilty": 1, "Robbery: not_guilty": 1,
+        "Assault: guilty": 1, "Assault: not_guilty": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_panel_stops_at_a_settled_majority_and_counts_abstentions(monkeypatch):
+    """Test a majority panel stops once every charge is decided; unparseable votes abstain."""
+    def reply(prompt):
+        return "VOTE: Robbery = GUILTY\nAssault: probably guilty\nSUMMARY: Convinced."
+
+    jury, llm = _jury(monkeypatch, reply)
+    result = await _deliberate(jury, jurors=5, require_unanimous=False)
+
+    # Robbery is settled after 3 guilty votes; Assault can never reach a majority
+    assert llm.calls == 3 and len(result.jurors) == 3
+    assert result.charge_verdicts == {"Robbery": "Guilty", "Assault": "Not Guilty"}
+    assert result.verdict.vote_breakdown["Robbery: guilty"] == 3
+    assert result.verdict.vote_breakdown["Assault: guilty"] == 0
+    assert result.jurors[0].votes == {"Robbery": "Guilty"}
+
+
+@pytest.mark.asyncio
+async def test_failed_juror_call_fails_the_panel(monkeypatch):
+    """Test a provider failure is never counted as a juror abstaining."""
+    def reply(prompt):
+        if "juror #2" in prompt:
+            raise ValueError("provider exploded")
+        return "VOTE: Robbery = GUILTY\nVOTE: Assault = GUILTY\nSUMMARY: Convinced."
+
+    jury, llm = _jury(monkeypatch, reply)
+    with pytest.raises(AgentUnavailableError):
+        await _deliberate(jury, jurors=6, require_unanimous=True)
+
+    # The remaining jurors are not called once the panel has failed
+    assert llm.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_scoring_call_is_not_an_unscored_table(monkeypatch):
+    """Test a provider failure raises instead of returning items without scores."""
+    def reply(prompt):
+        raise ValueError("provider exploded")
+
+    jury, _ = _jury(monkeypatch, reply)
+    with pytest.raises(AgentUnavailableError):
+        await jury.assess_witnesses_batch({"Officer Diaz": "Saw the car"}, _session())
@@ -25,7 +25,27 @@ def test_health_check():
     assert data["status"] == "healthy"
 
 
+def test_provider_health():
+    """Test provider health endpoint."""
+    response = client.get("/health/providers")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] in ("healthy", "degraded")
+    assert "providers" in data
+    assert "limiters" in data
+
+
 def test_api_docs():
     """Test API documentation is accessible."""
     response = client.get("/docs")
     assert response.status_code == 200
+
+
+def test_metrics():
+    """Test Prometheus metrics endpoint."""
+    client.get("/health")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'jurysane_http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in response.text
+    assert 'jurysane_sessions{state="active"}' in response.text
@@ -0,0 +1,44 @@
+"""Test the rule-based objection fast path."""
+
+from jurysane.services.objection_classifier import (
+    fast_ruling,
+    last_question,
+    parse_ruling,
+)
+
+
+def test_clear_cut_objections_are_ruled():
+    """Test mechanically detectable objections are ruled without the judge."""
+    leading = fast_ruling("leading", "You were at the store that night, weren't you?", "direct")
+    compound = fast_ruling("compound", "Where were you, and did you see the defendant?")
+    speculation = fast_ruling("speculation", "What was the defendant thinking when he ran?")
+
+    assert leading is not None and leading.ruling == "sustained"
+    assert compound is not None and compound.ruling == "sustained"
+    assert speculation is not None and speculation.ruling == "sustained"
+    assert fast_ruling("leading", "You were there, weren't you?", "cross").ruling == "overruled"
+
+
+def test_ambiguous_objections_go_to_the_judge():
+    """Test open questions and pattern-free objection types are not fast-ruled."""
+    assert fast_ruling("leading", "Where were you that night?", "direct") is None
+    # Leading is only sustained on direct; unknown examinations go to the judge
+    assert fast_ruling("leading", "You were at the store, weren't you?") is None
+    assert fast_ruling("leading", "You were at the store, weren't you?", "redirect") is None
+    assert fast_ruling("relevance", "What is your favorite color?") is None
+    assert fast_ruling("not_a_type", "Anything?") is None
+
+
+def test_parse_ruling():
+    """Test judge answers are split into ruling and explanation."""
+    assert parse_ruling("Sustained. The question calls for speculation.") == (
+        "sustained", "The question calls for speculation.")
+    assert parse_ruling("Objection overruled.")[0] == "overruled"
+
+
+def test_last_question_of_a_transcript_entry():
+    """Test separate questions in one turn are not mistaken for a compound question."""
+    entry = "Thank you, Mr. Lee. Where were you? And what did you see?"
+    assert last_question(entry) == "And what did you see?"
+    assert fast_ruling("compound", last_question(entry)) is None
+    assert last_question("No further questions.") is None
@@ -0,0 +1,105 @@
+"""Test per-provider rate limits."""
+
+import asyncio
+import time
+
+import pytest
+
+from jurysane.agents import rate_limit
+from jurysane.agents.rate_limit import (
+    ProviderLimiter,
+    TokenBucket,
+    get_limiter,
+    set_provider_concurrency,
+)
+from jurysane.agents.resilience import call_with_resilience
+from jurysane.config import RateLimitConfig, settings
+
+
+@pytest.fixture(autouse=True)
+def isolated_limiters(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_limiters", {})
+    monkeypatch.setattr(rate_limit, "_overrides", {})
+
+
+def test_token_bucket_refills_per_minute():
+    """Test a bucket allows a burst of its capacity and then refills at its rate."""
+    bucket = TokenBucket(60)
+    now = bucket.updated
+    assert bucket.wait_time(60, now) == 0.0
+    bucket.consume(60, now)
+
+    assert bucket.wait_time(1, now) == pytest.approx(1.0)
+    assert bucket.wait_time(1, now + 1.0) == 0.0
+    # Requests larger than the bucket wait for a full bucket, not forever
+    assert bucket.wait_time(600, now + 1.0) == pytest.approx(59.0)
+
+
+@pytest.mark.asyncio
+async def test_requests_and_tokens_per_minute_hold_calls():
+    """Test calls wait once either the RPM or the TPM budget is spent."""
+    by_requests = ProviderLimiter("rpm", RateLimitConfig(requests_per_minute=2))
+    by_tokens = ProviderLimiter("tpm", RateLimitConfig(tokens_per_minute=1000))
+
+    for _ in range(2):
+        await by_requests.acquire("session", 10)
+    await by_tokens.acquire("session", 800)
+
+    held = [asyncio.ensure_future(by_requests.acquire("session", 10)),
+            asyncio.ensure_future(by_tokens.acquire("session", 800))]
+    await asyncio.sleep(0.01)
+    assert not any(call.done() for call in held)
+    assert by_requests.waiting == 1 and by_tokens.waiting == 1
+
+    for call in held:
+        call.cancel()
+    await asyncio.gather(*held, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_error_penalizes_the_provider(monkeypatch):
+    """Test a 429 blocks the provider's limiter for the Retry-After period before retrying."""
+    monkeypatch.setitem(settings.llm.rate_limits, "rl-test", RateLimitConfig(max_concurrency=4))
+
+    class _Response:
+        status_code = 429
+        headers = {"retry-after": "0.1"}
+
+    class RateLimitError(Exception):
+        response = _Response()
+
+    calls = []
+
+    async def call():
+        async with rate_limit.provider_slot("rl-test", "model"):
+            calls.append(time.monotonic())
+            if len(calls) == 1:
+                raise RateLimitError("Too many requests")
+            return "ok"
+
+    attempts = []
+    assert await call_with_resilience(call, "rl-test", "model", attempts) == "ok"
+
+    limiter = get_limiter("rl-test", "model")
+    assert limiter.blocked_until > 0
+    # The penalty is temporary: no request limit is added to the provider
+    assert limiter.requests is None and limiter.tokens is None
+    assert calls[1] - calls[0] >= 0.1
+    assert [record["outcome"] for record in attempts] == ["rate_limited", "ok"]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_override_resizes_the_live_limiter():
+    """Test raising the cap grants calls already queued on the limiter."""
+    set_provider_concurrency("rl-test", 1)
+    limiter = get_limiter("rl-test", "model")
+    await limiter.acquire("session", 0)
+    queued = asyncio.ensure_future(limiter.acquire("session", 0))
+    await asyncio.sleep(0)
+    assert not queued.done()
+
+    set_provider_concurrency("rl-test", 2)
+    await asyncio.wait_for(queued, timeout=1)
+
+    assert get_limiter("rl-test", "model") is limiter
+    assert limiter.in_flight == 2
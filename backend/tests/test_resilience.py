@@ -0,0 +1,72 @@
+"""Test deadlines and error handling around LLM calls."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from langchain.schema import HumanMessage
+
+from jurysane.agents import JudgeAgent, base, circuit_breaker
+from jurysane.agents.base import BaseAgent
+from jurysane.agents.circuit_breaker import CircuitBreaker
+from jurysane.agents.resilience import DEADLINE, classify_error, is_provider_failure
+from jurysane.agents.scheduler import DeadlineExceededError
+from jurysane.config import CircuitBreakerConfig, settings
+
+
+class _Reply:
+    content = "Proceed."
+
+
+class _FastLLM:
+    async def ainvoke(self, messages, **kwargs):
+        return _Reply()
+
+
+def _agent(monkeypatch, provider):
+    monkeypatch.setattr(BaseAgent, "_build_llm", lambda self, provider, model: _FastLLM())
+    breaker = CircuitBreaker(provider, CircuitBreakerConfig(min_calls=1))
+    monkeypatch.setitem(circuit_breaker._breakers, provider, breaker)
+    return JudgeAgent(model_name="model", provider_name=provider), breaker
+
+
+@pytest.mark.asyncio
+async def test_queueing_for_a_slot_does_not_count_against_the_timeout(monkeypatch):
+    """Test the per-attempt timeout starts once the provider slot is held."""
+    monkeypatch.setattr(settings.llm, "timeout", 0.05)
+
+    @asynccontextmanager
+    async def slow_slot(provider, model, tokens):
+        await asyncio.sleep(0.1)
+        yield
+
+    monkeypatch.setattr(base, "provider_slot", slow_slot)
+    agent, breaker = _agent(monkeypatch, "resilience-queue")
+    attempts = []
+
+    response = await agent._invoke_llm([HumanMessage(content="Hi")], attempts, {})
+
+    assert response.content == "Proceed."
+    assert [record["outcome"] for record in attempts] == ["ok"]
+    assert breaker.total_failures == 0
+
+
+@pytest.mark.asyncio
+async def test_deadline_miss_is_not_a_provider_failure(monkeypatch):
+    """Test work dropped while queueing is not retried and leaves the breaker alone."""
+    @asynccontextmanager
+    async def dropped_slot(provider, model, tokens):
+        raise DeadlineExceededError("speculative", 2.0)
+        yield
+
+    monkeypatch.setattr(base, "provider_slot", dropped_slot)
+    agent, breaker = _agent(monkeypatch, "resilience-deadline")
+    attempts = []
+
+    with pytest.raises(DeadlineExceededError):
+        await agent._invoke_llm([HumanMessage(content="Hi")], attempts, {})
+
+    error = DeadlineExceededError("speculative", 2.0)
+    assert classify_error(error) == DEADLINE and not is_provider_failure(error)
+    assert [record["outcome"] for record in attempts] == [DEADLINE]
+    assert breaker.total_failures == 0
@@ -0,0 +1,19 @@
+"""Test the cross-session objection ruling cache."""
+
+from jurysane.data.sample_cases import get_sample_case
+from jurysane.models.trial import ObjectionType
+from jurysane.services.objection_classifier import ObjectionRuling
+from jurysane.services.ruling_cache import RulingCache
+
+
+def test_rulings_are_keyed_by_case_content():
+    """Test rephrased questions hit and an edited case misses."""
+    cache = RulingCache()
+    case = get_sample_case()
+    ruling = ObjectionRuling(ruling="sustained", reason="Speculation.", source="judge")
+    cache.put(cache.key(case, ObjectionType.SPECULATION, "What was he planning?"), ruling)
+
+    assert cache.get(cache.key(case, ObjectionType.SPECULATION, "So what was he planning?")) == ruling
+
+    edited = case.model_copy(update={"case_facts": case.case_facts + " New facts."})
+    assert cache.get(cache.key(edited, ObjectionType.SPECULATION, "What was he planning?")) is None
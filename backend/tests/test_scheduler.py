@@ -0,0 +1,57 @@
+"""Test fair scheduling of agent work."""
+
+import asyncio
+
+import pytest
+
+from jurysane.agents.scheduler import (
+    BATCH,
+    INTERACTIVE,
+    SPECULATIVE,
+    AgentScheduler,
+    DeadlineExceededError,
+    FairQueue,
+    Work,
+)
+from jurysane.config import SchedulerConfig
+
+
+def test_fair_queue_orders_by_class_then_fair_share():
+    """Test interactive work goes first and a backlogged session cannot starve another."""
+    queue = FairQueue("test", SchedulerConfig())
+    loop = asyncio.new_event_loop()
+    try:
+        for _ in range(3):
+            queue.push(loop.create_future(), "busy", Work(BATCH))
+        queue.push(loop.create_future(), "light", Work(BATCH))
+        queue.push(loop.create_future(), "user", Work(INTERACTIVE))
+
+        order = [queue.pop().session for _ in range(5)]
+    finally:
+        loop.close()
+
+    assert order[0] == "user"
+    assert order.index("light") <= 2
+    assert len(queue) == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_drops_work_past_its_deadline():
+    """Test queued work is dropped once its deadline passes."""
+    scheduler = AgentScheduler(SchedulerConfig(max_concurrency=1))
+    release = asyncio.Event()
+
+    async def hold():
+        async with scheduler.slot("user", Work(INTERACTIVE)):
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    with pytest.raises(DeadlineExceededError):
+        async with scheduler.slot("speculation", Work(SPECULATIVE, deadline_seconds=0.01)):
+            pass
+
+    release.set()
+    await holder
+    assert scheduler.stats()["in_flight"][INTERACTIVE] == 0
+    assert scheduler.stats()["queued"][SPECULATIVE] == 0
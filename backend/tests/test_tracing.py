@@ -0,0 +1,41 @@
+"""Test request tracing."""
+
+import io
+import json
+
+from jurysane import tracing
+from jurysane.config import settings
+
+
+def test_nested_spans_export_one_trace(monkeypatch):
+    """Test child spans share the root's trace and are exported with it."""
+    monkeypatch.setattr(settings.tracing, "enabled", True)
+    monkeypatch.setattr(settings.tracing, "sample_rate", 1.0)
+    buffer = io.StringIO()
+    tracing.set_exporter(tracing.SpanExporter(buffer))
+    try:
+        with tracing.span("request", traceparent="00-" + "a" * 32 + "-" + "b" * 16 + "-01"):
+            with tracing.span("child", {"step": 1}):
+                pass
+    finally:
+        tracing.set_exporter(None)
+
+    child, root = [json.loads(line) for line in buffer.getvalue().splitlines()]
+    assert root["traceId"] == child["traceId"] == "a" * 32
+    assert root["parentSpanId"] == "b" * 16
+    assert child["parentSpanId"] == root["spanId"]
+    assert child["attributes"] == {"step": 1}
+
+
+def test_unsampled_and_disabled_traces_are_not_recorded(monkeypatch):
+    """Test spans are no-ops when tracing is off or the trace is dropped."""
+    monkeypatch.setattr(settings.tracing, "enabled", False)
+    with tracing.span("request") as span:
+        assert span is None
+
+    monkeypatch.setattr(settings.tracing, "enabled", True)
+    monkeypatch.setattr(settings.tracing, "sample_rate", 0.0)
+    with tracing.span("request") as span:
+        with tracing.span("child") as child:
+            assert span is None and child is None
+    assert tracing.parse_traceparent("not-a-header") is None
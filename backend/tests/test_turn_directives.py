@@ -0,0 +1,57 @@
+"""Test turn directive parsing."""
+
+from jurysane.models.trial import CaseRole
+from jurysane.services.turn_directives import (
+    DirectiveStreamParser,
+    parse_directives,
+    resolve_role,
+)
+
+
+def test_parse_directives_with_alias():
+    """Test directive lines are removed and role aliases resolved."""
+    parsed = parse_directives(
+        "Counsel, you may begin.\n**TURN_MANAGEMENT:** Prosecution\n")
+
+    assert parsed.text == "Counsel, you may begin."
+    assert parsed.directives == {"turn_management": "Prosecution"}
+    assert parsed.next_turn == CaseRole.PROSECUTOR
+
+
+def test_resolve_role_with_article():
+    """Test roles named with a leading "the" resolve."""
+    assert resolve_role("the defense") == CaseRole.DEFENSE
+    assert resolve_role("The Prosecution") == CaseRole.PROSECUTOR
+    assert resolve_role("the defense, call your first witness") == CaseRole.DEFENSE
+    assert resolve_role("the") is None
+    assert resolve_role("") is None
+
+
+def test_parse_directives_json():
+    """Test structured JSON responses."""
+    parsed = parse_directives(
+        '{"response": "The defense may proceed.", "turn_management": "defense"}')
+
+    assert parsed.text == "The defense may proceed."
+    assert parsed.next_turn == CaseRole.DEFENSE
+
+
+def test_parse_directives_without_directive():
+    """Test plain responses pass through unchanged."""
+    parsed = parse_directives("Sustained.")
+
+    assert parsed.text == "Sustained."
+    assert parsed.next_turn is None
+
+
+def test_stream_parser_matches_batch_parse():
+    """Test streamed chunks never leak the directive."""
+    response = "Members of the jury, please retire.\nTURN_MANAGEMENT: the jury\n"
+    parser = DirectiveStreamParser()
+
+    emitted = "".join(parser.feed(response[i:i + 3]) for i in range(0, len(response), 3))
+    tail, parsed = parser.close()
+
+    assert "TURN" not in emitted + tail
+    assert (emitted + tail).strip() == parsed.text
+    assert parsed.next_turn == CaseRole.JURY
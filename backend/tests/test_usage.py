@@ -0,0 +1,22 @@
+"""Test LLM usage accounting."""
+
+from jurysane.agents.usage import UsageTracker, usage_scope
+
+
+def _call(tracker, session_id, tokens=100):
+    with usage_scope(session_id, "opening_statements"):
+        tracker.record("judge", {"prompt_tokens": tokens, "completion_tokens": 0,
+                                 "cost_usd": 0.0, "latency_ms": 1.0})
+
+
+def test_least_recently_active_sessions_are_forgotten():
+    """Test per-session counters are bounded while global totals are kept."""
+    tracker = UsageTracker(max_sessions=2)
+    _call(tracker, "a")
+    _call(tracker, "b")
+    _call(tracker, "a")
+    _call(tracker, "c")
+
+    assert tracker.has_session("a") and tracker.has_session("c")
+    assert not tracker.has_session("b")
+    assert tracker.global_summary()["total"]["prompt_tokens"] == 400